@@ -0,0 +1,123 @@
+"""
+Tasas de cruza y mutación adaptativas según la diversidad de la población.
+
+La diversidad es la distancia de Hamming media entre pares de individuos,
+normalizada por n_bits (0 = todos iguales, ~0.5 = población aleatoria); ver
+population_diversity en algorithm/population_stats.py.
+
+AdaptiveRates ajusta cada generación las tres probabilidades dentro de los
+límites del usuario. Por debajo de la diversidad objetivo la mutación sube
+(hacia el máximo) y la cruza baja; por encima, al revés. El ajuste es
+multiplicativo sobre la distancia a cada límite, de modo que las tasas cambian
+de forma suave y nunca salen de [mínimo, máximo].
+
+    python -m algorithm.adaptive_rates   # compara evaluaciones hasta el objetivo
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+RATE_NAMES = ('prob_crossover', 'prob_mutation_i', 'prob_mutation_g')
+DEFAULT_TARGET_DIVERSITY = 0.4
+DEFAULT_GAIN = 0.5
+
+
+class AdaptiveRates:
+    """Controlador de las probabilidades de cruza, PMI y PMG"""
+
+    def __init__(
+        self,
+        bounds: Dict[str, Tuple[float, float]],
+        initial: Dict[str, float],
+        target_diversity: float = DEFAULT_TARGET_DIVERSITY,
+        gain: float = DEFAULT_GAIN
+    ):
+        """
+        Args:
+            bounds: (mínimo, máximo) de cada probabilidad; las que falten no se adaptan.
+            initial: Valores de partida (se recortan a los límites).
+            target_diversity: Diversidad normalizada que se intenta mantener.
+            gain: Fracción de la distancia al límite que se recorre por generación
+                cuando la diversidad es nula (o el doble de la objetivo).
+
+        Raises:
+            ValueError: Si algún límite no cumple 0 <= mínimo <= máximo <= 1.
+        """
+        for name, (low, high) in bounds.items():
+            if not 0.0 <= low <= high <= 1.0:
+                raise ValueError(f"Límites inválidos para '{name}': [{low}, {high}]")
+        self.bounds = {name: (float(low), float(high)) for name, (low, high) in bounds.items()}
+        self.target_diversity = target_diversity
+        self.gain = gain
+        self.rates = {name: float(initial[name]) for name in RATE_NAMES}
+        for name, (low, high) in self.bounds.items():
+            self.rates[name] = min(max(self.rates[name], low), high)
+
+    def update(self, diversity: float) -> Dict[str, float]:
+        """Ajusta las tasas según la diversidad de la generación actual y las devuelve"""
+        # error > 0: falta diversidad (más mutación, menos cruza); error < 0: sobra
+        error = float(np.clip((self.target_diversity - diversity) / self.target_diversity, -1.0, 1.0))
+        step = self.gain * abs(error)
+        for name, (low, high) in self.bounds.items():
+            raise_rate = (error > 0) == (name != 'prob_crossover')
+            rate = self.rates[name]
+            self.rates[name] = rate + step * (high - rate) if raise_rate else rate - step * (rate - low)
+        return dict(self.rates)
+
+
+def make_adaptive_rates(adaptive_rates: Optional[Dict], initial: Dict[str, float]) -> Optional[AdaptiveRates]:
+    """AdaptiveRates a partir del parámetro 'adaptive_rates' de una ejecución (None = tasas fijas)"""
+    if not adaptive_rates:
+        return None
+    options = dict(adaptive_rates)
+    target = options.pop('target_diversity', DEFAULT_TARGET_DIVERSITY)
+    gain = options.pop('gain', DEFAULT_GAIN)
+    return AdaptiveRates(options, initial, target_diversity=target, gain=gain)
+
+
+if __name__ == '__main__':
+    import time
+    from manager.ga_manager import get_ga_instance
+    from utils.function_provider import CustomFunctionProvider
+
+    def evaluations_to_target(ga, params, target, tolerance, **kwargs):
+        """Evaluaciones hasta que el mejor de la generación alcanza el objetivo (None si no llega)"""
+        for record in ga.stream(**params, **kwargs):
+            reached = record.best_fitness <= target + tolerance if params['is_minimizing'] \
+                else record.best_fitness >= target - tolerance
+            if reached:
+                return (record.generation + 1) * params['pop_size']
+        return None
+
+    benchmarks = [
+        ("ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)", -10, 10, False),
+        ("x**2 + 10*sin(5*x)", -10, 10, True),
+        ("sin(x)*x**2 - cos(3*x)", -20, 20, False),
+    ]
+    n_seeds = 60
+    for function_text, x_min, x_max, is_minimizing in benchmarks:
+        provider = CustomFunctionProvider(function_text)
+        params = dict(x_min=x_min, x_max=x_max, delta_x=0.001, pop_size=30, max_generations=150,
+                      prob_crossover=0.8, prob_mutation_i=0.2, prob_mutation_g=0.05,
+                      is_minimizing=is_minimizing, function_provider=provider)
+        grid = provider.get_raw_function_values(np.linspace(x_min, x_max, 2**16))
+        target = float(grid.min() if is_minimizing else grid.max())
+        tolerance = 1e-3 * float(np.ptp(grid))
+        modes = {
+            'fijas': None,
+            'adaptativas': {'prob_crossover': (0.5, 0.95), 'prob_mutation_i': (0.05, 0.9),
+                            'prob_mutation_g': (0.01, 0.3)},
+        }
+        print(f"f(x) = {function_text}  ({'min' if is_minimizing else 'max'}, objetivo {target:.4f})")
+        for label, adaptive in modes.items():
+            start = time.perf_counter()
+            counts = [evaluations_to_target(get_ga_instance('standard_ga'), params, target, tolerance,
+                                            seed=seed, adaptive_rates=adaptive) for seed in range(n_seeds)]
+            reached = np.array([c for c in counts if c is not None], dtype=float)
+            # Las semillas que no llegan cuentan con el presupuesto completo (cota inferior)
+            budget = params['pop_size'] * params['max_generations']
+            mean = np.mean([budget if c is None else c for c in counts])
+            median = f"{np.median(reached):.0f}" if reached.size else "N/A"
+            print(f"  {label:12s} éxito {reached.size}/{n_seeds}, evaluaciones medias {mean:.0f} "
+                  f"(mediana de las exitosas {median}), {time.perf_counter() - start:.2f} s")
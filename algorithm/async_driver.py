@@ -0,0 +1,61 @@
+"""
+Controlador asíncrono (asyncio) para algoritmos con interfaz ask/tell.
+
+Permite evaluar cada generación con corrutinas (por ejemplo, peticiones a
+servicios locales de simulación) manteniendo muchas evaluaciones en vuelo a
+la vez, sin bloquear el bucle de eventos del llamador.
+
+Ejemplo:
+    async def evaluar(x):
+        return await cliente_simulador.calcular(x)
+
+    resultados = asyncio.run(run_ask_tell_async(
+        GeneticAlgorithm(), evaluar, max_in_flight=64,
+        x_min=-10, x_max=10, delta_x=0.01, pop_size=100, max_generations=50,
+        prob_crossover=0.8, prob_mutation_i=0.3, prob_mutation_g=0.1,
+        is_minimizing=False
+    ))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+async def evaluate_batch_async(
+    x_values,
+    evaluate: Callable[[float], Awaitable[float]],
+    max_in_flight: int = 32
+) -> list:
+    """Evalúa un lote con la corrutina `evaluate`, con a lo sumo `max_in_flight` evaluaciones simultáneas"""
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def _evaluate_one(x):
+        async with semaphore:
+            return await evaluate(float(x))
+
+    return await asyncio.gather(*(_evaluate_one(x) for x in x_values))
+
+
+async def run_ask_tell_async(
+    ga,
+    evaluate: Callable[[float], Awaitable[float]],
+    max_in_flight: int = 32,
+    **setup_kwargs
+) -> Dict[str, Any]:
+    """
+    Ejecuta un AG con interfaz setup/ask/tell/result evaluando con corrutinas.
+
+    Args:
+        ga: Instancia del AG (p. ej. GeneticAlgorithm).
+        evaluate: Corrutina x -> f(x) (fitness REAL, sin ajustar por min/max).
+        max_in_flight: Número máximo de evaluaciones en curso a la vez.
+        **setup_kwargs: Parámetros de ga.setup() (x_min, x_max, delta_x, ...).
+
+    Returns:
+        El mismo diccionario de resultados que GeneticAlgorithm.run().
+    """
+    ga.setup(**setup_kwargs)
+    while not ga.is_done:
+        x_values = ga.ask()
+        ga.tell(await evaluate_batch_async(x_values, evaluate, max_in_flight))
+    return ga.result()
@@ -0,0 +1,249 @@
+"""
+Motor por lotes: evoluciona R poblaciones independientes a la vez.
+
+Con codificaciones pequeñas, el costo de una ejecución del AG estándar lo domina
+el intérprete (listas de bits, un individuo a la vez). Aquí las R poblaciones
+viven en un único arreglo uint8 (R, pop_size, n_bits) y cada operador es una
+sola llamada vectorizada sobre todas las ejecuciones:
+
+  - poda aleatoria conservando al mejor de cada ejecución (argsort de claves aleatorias);
+  - emparejamiento cíclico con pareja aleatoria y cruza de tres puntos (máscaras);
+  - mutación PMI/PMG (máscaras de individuo y de gen).
+
+Las probabilidades pueden ser distintas por ejecución: escalares o secuencias de
+longitud R que se difunden sobre el primer eje. Cada generación se evalúa con una
+sola llamada al proveedor (R * pop_size valores x).
+
+Los operadores siguen la semántica de GeneticAlgorithm, pero el flujo aleatorio
+es otro: una semilla del lote no reproduce la misma ejecución en el AG estándar.
+Por eso cada resultado lleva 'seed' = None y guarda 'batch_seed' y 'batch_index'.
+
+Ejemplo (barrido de PMG con 8 repeticiones por valor):
+
+    rates = np.repeat([0.01, 0.05, 0.1, 0.2], 8)
+    resultados = BatchedGeneticAlgorithm().run_batch(
+        x_min=-10, x_max=10, delta_x=0.01, pop_size=40, max_generations=60,
+        prob_crossover=0.8, prob_mutation_i=0.3, prob_mutation_g=rates,
+        is_minimizing=False, seed=1
+    )
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.math_functions import decode_population, get_function_provider
+from utils.evaluation import SerialEvaluator
+from algorithm.genetic_algorithm import GeneticAlgorithm
+
+
+def _broadcast_rates(name: str, values, n_runs: int) -> np.ndarray:
+    """Probabilidad escalar o por ejecución como arreglo (R,)"""
+    rates = np.asarray(values, dtype=float)
+    try:
+        return np.broadcast_to(rates, (n_runs,)).copy()
+    except ValueError:
+        raise ValueError(
+            f"'{name}' debe ser un escalar o tener {n_runs} valores (uno por ejecución), "
+            f"se recibió la forma {rates.shape}."
+        ) from None
+
+
+class BatchedGeneticAlgorithm:
+    """AG de ejemplo sobre R poblaciones apiladas en un arreglo (R, pop_size, n_bits)"""
+
+    def __init__(self):
+        self._rng = np.random.default_rng()
+
+    def _select_parents(self, population: np.ndarray, fitness: np.ndarray, is_minimizing: bool):
+        """
+        Poda: conserva pop_size // 2 individuos por ejecución (siempre el mejor, en
+        primer lugar; el resto al azar) y forma las parejas (padre_i cíclico, padre_j
+        aleatorio). Devuelve dos arreglos (R, parejas, n_bits).
+        """
+        n_runs, pop_size, _ = population.shape
+        rows = np.arange(n_runs)[:, None]
+        num_a_conservar = max(1, pop_size // 2)
+        best = np.argmin(fitness, axis=1) if is_minimizing else np.argmax(fitness, axis=1)
+
+        keys = self._rng.random((n_runs, pop_size))
+        keys[rows[:, 0], best] = -1.0
+        conservados = np.argsort(keys, axis=1)[:, :num_a_conservar]       # (R, K), el mejor primero
+
+        n_pairs = (pop_size + 1) // 2
+        i_positions = (2 * np.arange(n_pairs)) % num_a_conservar
+        j_positions = self._rng.integers(0, num_a_conservar, (n_runs, n_pairs))
+        parents_i = population[rows, conservados[:, i_positions]]
+        parents_j = population[rows, np.take_along_axis(conservados, j_positions, axis=1)]
+        return parents_i, parents_j
+
+    def _crossover_three_points(self, parents_i: np.ndarray, parents_j: np.ndarray,
+                                prob_crossover: np.ndarray) -> np.ndarray:
+        """Cruza de tres puntos de todas las parejas; devuelve los hijos intercalados (R, 2*parejas, n_bits)"""
+        n_runs, n_pairs, n_bits = parents_i.shape
+        if n_bits >= 4:
+            do_cross = self._rng.random((n_runs, n_pairs)) < prob_crossover[:, None]
+            # Tres puntos únicos en [1, n_bits): los 3 menores de n_bits-1 claves aleatorias
+            points = np.argpartition(self._rng.random((n_runs, n_pairs, n_bits - 1)), 2, axis=-1)[..., :3] + 1
+            # Se intercambian los segmentos con un número impar de puntos a la izquierda
+            crossed = (np.arange(n_bits) >= points[..., None]).sum(axis=-2) % 2 == 1
+            swap = crossed & do_cross[..., None]
+            child1 = np.where(swap, parents_j, parents_i)
+            child2 = np.where(swap, parents_i, parents_j)
+        else:
+            child1, child2 = parents_i.copy(), parents_j.copy()
+        return np.stack((child1, child2), axis=2).reshape(n_runs, 2 * n_pairs, n_bits)
+
+    def _mutate(self, children: np.ndarray, prob_mutation_i: np.ndarray, prob_mutation_g: np.ndarray) -> None:
+        """Mutación in situ: individuos con PMI, y dentro de ellos genes con PMG"""
+        n_runs, pop_size, n_bits = children.shape
+        mutant = self._rng.random((n_runs, pop_size, 1)) < prob_mutation_i[:, None, None]
+        genes = self._rng.random((n_runs, pop_size, n_bits)) < prob_mutation_g[:, None, None]
+        np.bitwise_xor(children, (mutant & genes).view(np.uint8), out=children)
+
+    def _next_generation(self, population, fitness, is_minimizing, prob_crossover,
+                         prob_mutation_i, prob_mutation_g) -> np.ndarray:
+        pop_size = population.shape[1]
+        parents_i, parents_j = self._select_parents(population, fitness, is_minimizing)
+        children = np.ascontiguousarray(
+            self._crossover_three_points(parents_i, parents_j, prob_crossover)[:, :pop_size]
+        )
+        self._mutate(children, prob_mutation_i, prob_mutation_g)
+        return children
+
+    def run_batch(
+        self,
+        x_min: float,
+        x_max: float,
+        delta_x: float,
+        pop_size: int,
+        max_generations: int,
+        prob_crossover,
+        prob_mutation_i,
+        prob_mutation_g,
+        is_minimizing: bool,
+        n_runs: Optional[int] = None,
+        function_provider=None,
+        evaluator=None,
+        seed: Optional[int] = None,
+        keep_history: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Ejecuta R ejecuciones independientes del AG en paralelo (vectorizadas).
+
+        Args:
+            prob_crossover, prob_mutation_i, prob_mutation_g: Escalar o secuencia
+                de longitud R (una probabilidad por ejecución).
+            n_runs: Número de ejecuciones R; si no se indica se deduce de las
+                probabilidades (1 si todas son escalares).
+            evaluator: Backend de evaluación (ver utils.evaluation); por defecto
+                se evalúa en el proceso actual.
+            seed: Semilla del lote completo.
+            keep_history: Si es False solo se guarda best_fitness_history
+                (los historiales por individuo ocupan G * R * pop_size * (n_bits + 8) bytes).
+
+        Returns:
+            Lista de R diccionarios con el mismo formato que GeneticAlgorithm.run();
+            population_history y fitness_history son vistas (G, pop_size, ...) de
+            los arreglos del lote.
+        """
+        if n_runs is None:
+            n_runs = max(np.size(prob_crossover), np.size(prob_mutation_i), np.size(prob_mutation_g))
+        prob_crossover = _broadcast_rates('prob_crossover', prob_crossover, n_runs)
+        prob_mutation_i = _broadcast_rates('prob_mutation_i', prob_mutation_i, n_runs)
+        prob_mutation_g = _broadcast_rates('prob_mutation_g', prob_mutation_g, n_runs)
+
+        self._rng = np.random.default_rng(seed)
+        function_provider = function_provider or get_function_provider().copy()
+        if evaluator is None:
+            evaluator = SerialEvaluator(function_provider)
+        n_bits = GeneticAlgorithm.compute_n_bits(x_min, x_max, delta_x)
+
+        population = self._rng.integers(0, 2, (n_runs, pop_size, n_bits), dtype=np.uint8)
+        best_fitness_history = np.empty((max_generations, n_runs))
+        if keep_history:
+            population_history = np.empty((max_generations, n_runs, pop_size, n_bits), dtype=np.uint8)
+            fitness_history = np.empty((max_generations, n_runs, pop_size))
+
+        def _evaluate(pop):
+            # Una sola llamada al proveedor por generación para las R poblaciones
+            x_values = decode_population(pop, x_min, x_max, n_bits).reshape(-1)
+            return np.asarray(evaluator.evaluate(x_values), dtype=float).reshape(n_runs, pop_size)
+
+        for generation in range(max_generations):
+            fitness = _evaluate(population)
+            best_fitness_history[generation] = fitness.min(axis=1) if is_minimizing else fitness.max(axis=1)
+            if keep_history:
+                population_history[generation] = population
+                fitness_history[generation] = fitness
+            population = self._next_generation(population, fitness, is_minimizing, prob_crossover,
+                                               prob_mutation_i, prob_mutation_g)
+        final_fitness = _evaluate(population)
+
+        # --- Resumen de cada ejecución (mismas claves que GeneticAlgorithm.summary) ---
+        best_index = np.argmin(final_fitness, axis=1) if is_minimizing else np.argmax(final_fitness, axis=1)
+        best_individuals = population[np.arange(n_runs), best_index]
+        best_x = decode_population(best_individuals, x_min, x_max, n_bits)
+        best_fitness = final_fitness[np.arange(n_runs), best_index]
+        if max_generations > 0:
+            improvement = best_fitness_history[0] - best_fitness if is_minimizing else best_fitness - best_fitness_history[0]
+        else:
+            improvement = np.zeros(n_runs)
+
+        results = []
+        for r in range(n_runs):
+            ga_results = {
+                'best_individual': best_individuals[r].tolist(),
+                'best_x': float(best_x[r]),
+                'best_fitness': float(best_fitness[r]),
+                'objective_function_raw': float(best_fitness[r]),
+                'x_min': x_min,
+                'x_max': x_max,
+                'n_bits': n_bits,
+                'pop_size': pop_size,
+                'generations': max_generations,
+                'prob_crossover': float(prob_crossover[r]),
+                'prob_mutation_i': float(prob_mutation_i[r]),
+                'prob_mutation_g': float(prob_mutation_g[r]),
+                'improvement': float(improvement[r]),
+                'final_population': population[r].tolist(),
+                'final_fitness': final_fitness[r].tolist(),
+                'is_minimizing': is_minimizing,
+                'seed': None,
+                'batch_seed': seed,
+                'batch_index': r,
+                'function_text_for_report': function_provider.function_text
+            }
+            results.append({
+                'ga_results': ga_results,
+                'population_history': population_history[:, r] if keep_history else [],
+                'fitness_history': fitness_history[:, r] if keep_history else [],
+                'best_fitness_history': best_fitness_history[:, r]
+            })
+        return results
+
+
+if __name__ == '__main__':
+    import time
+    from manager.ga_manager import get_ga_instance
+
+    params = dict(x_min=-10, x_max=10, delta_x=0.01, pop_size=40, max_generations=60,
+                  prob_crossover=0.8, prob_mutation_i=0.3, prob_mutation_g=0.1, is_minimizing=False)
+    n_runs = 1000
+
+    start = time.perf_counter()
+    batch = BatchedGeneticAlgorithm().run_batch(n_runs=n_runs, seed=0, keep_history=False, **params)
+    batched_seconds = time.perf_counter() - start
+
+    standard_runs = 20
+    start = time.perf_counter()
+    for s in range(standard_runs):
+        get_ga_instance('standard_ga').run(seed=s, **params)
+    standard_seconds = (time.perf_counter() - start) / standard_runs * n_runs
+
+    final_best = np.array([r['ga_results']['best_fitness'] for r in batch])
+    print(f"{n_runs} ejecuciones por lote: {batched_seconds:.2f} s "
+          f"({n_runs / batched_seconds * 60:.0f} ejecuciones/min)")
+    print(f"AG estándar (estimado para {n_runs}): {standard_seconds:.2f} s")
+    print(f"Mejor fitness final: mediana {np.median(final_best):.6f}, "
+          f"p10 {np.percentile(final_best, 10):.6f}, p90 {np.percentile(final_best, 90):.6f}")
@@ -13,24 +13,34 @@ import random
 import numpy as np
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterator, Optional
 
 from utils.math_functions import (
-    objective_function,
     get_raw_function_value,
     binary_to_decimal,
+    decode_population,
     get_function_provider
 )
+from utils.evaluation import SerialEvaluator
+from algorithm.history import GenerationRecord, RunHistory
+from algorithm.adaptive_rates import make_adaptive_rates
+from algorithm.population_stats import generation_statistics
+from algorithm.niching import (NICHING_MODES, MIN_NICHE_SIZE, DEFAULT_MAX_NICHES, crowding_replacement,
+                               default_niche_radius, find_niches)
+from algorithm.memetic import make_memetic_refiner
 
 class GeneticAlgorithm:
     """Clase que implementa el algoritmo genético de ejemplo"""
 
     def __init__(self):
-        pass
+        # Generador aleatorio propio: con `seed` la ejecución es reproducible y
+        # varias instancias pueden ejecutarse a la vez sin compartir estado.
+        self._rng = random.Random()
+        self._state = None
 
     def create_individual(self, n_bits: int) -> List[int]:
         """Crea un individuo aleatorio (lista de bits)"""
-        return [random.randint(0, 1) for _ in range(n_bits)]
+        return [self._rng.randint(0, 1) for _ in range(n_bits)]
 
     def crossover_three_points(
         self,
@@ -43,9 +53,9 @@ class GeneticAlgorithm:
         Si random < prob_crossover, intercambia segmentos entre puntos.
         """
         child1, child2 = parent1.copy(), parent2.copy()
-        if random.random() < prob_crossover and len(parent1) >= 4:
+        if self._rng.random() < prob_crossover and len(parent1) >= 4:
             # Elegir (hasta) 3 puntos de cruce únicos en [1, len-1)
-            puntos = sorted(random.sample(range(1, len(parent1)), min(3, len(parent1)-1)))
+            puntos = sorted(self._rng.sample(range(1, len(parent1)), min(3, len(parent1)-1)))
             swap = False
             prev = 0
             for punto in puntos + [len(parent1)]:
@@ -68,51 +78,13 @@ class GeneticAlgorithm:
         """
         mutated = individual.copy()
         for idx in range(len(mutated)):
-            if random.random() < prob_mutation_gene:
+            if self._rng.random() < prob_mutation_gene:
                 mutated[idx] = 1 - mutated[idx]
         return mutated
 
-    def run(
-        self,
-        x_min: float,
-        x_max: float,
-        delta_x: float,
-        pop_size: int,
-        max_generations: int,
-        prob_crossover: float,
-        prob_mutation_i: float,
-        prob_mutation_g: float,
-        is_minimizing: bool,
-        progress_root_window: tk.Tk = None
-    ) -> Dict[str, Any]:
-        """
-        Ejecuta el algoritmo genético completo, devolviendo:
-          {
-            'ga_results': {
-                'best_individual': [...],
-                'best_x': float,
-                'best_fitness': float,
-                'objective_function_raw': float,
-                'x_min': ..., 'x_max': ..., 'n_bits': ...,
-                'pop_size': ..., 'generations': ...,
-                'prob_crossover': ..., 'prob_mutation_i': ...,
-                'prob_mutation_g': ..., 'improvement': ...,
-                'final_population': [...],
-                'final_fitness': [...],
-                'is_minimizing': ...,
-                'function_text_for_report': str
-            },
-            'population_history': [...],       # poblaciones por generación (listas de individuos)
-            'fitness_history': [...],          # fitness real de cada individuo por generación
-            'best_fitness_history': [...]      # mejor fitness real por generación
-          }
-        """
-
-        # --- 0. Obtener la función objetivo (texto y proveedor) ---
-        current_function_provider = get_function_provider()
-        function_text_used_by_ga = current_function_provider.function_text
-
-        # --- 1. Calcular n_bits en base a (x_min, x_max, delta_x) ---
+    @staticmethod
+    def compute_n_bits(x_min: float, x_max: float, delta_x: float) -> int:
+        """Calcula el número de bits necesarios para cubrir [x_min, x_max] con precisión delta_x"""
         if x_min == 0 and x_max == 31 and delta_x == 1.0:
             n_bits = 5
         elif x_min >= 0 and x_max == int(x_max) and delta_x == 1.0:
@@ -131,172 +103,445 @@ class GeneticAlgorithm:
                     n_bits = 0
                 else:
                     n_bits = 1
+        return n_bits
+
+    # ------------------------------------------------------------------
+    # Interfaz ask/tell: el llamador decide cómo y cuándo evaluar
+    # ------------------------------------------------------------------
+    def setup(
+        self,
+        x_min: float,
+        x_max: float,
+        delta_x: float,
+        pop_size: int,
+        max_generations: int,
+        prob_crossover: float,
+        prob_mutation_i: float,
+        prob_mutation_g: float,
+        is_minimizing: bool,
+        function_provider=None,
+        seed: int = None,
+        keep_history: bool = True,
+        include_population: bool = False,
+        adaptive_rates: Optional[Dict[str, Any]] = None,
+        elite_count: int = 0,
+        niching: Optional[str] = None,
+        niche_radius: Optional[float] = None,
+        memetic: Optional[Dict[str, Any]] = None,
+        max_niches: Optional[int] = DEFAULT_MAX_NICHES
+    ) -> None:
+        """
+        Prepara una ejecución para usarla con ask()/tell().
+
+        Se piden max_generations + 1 lotes: uno por generación y uno más para
+        la evaluación final de la población resultante.
+
+        `keep_history` guarda internamente el historial completo para result();
+        si es False solo se conserva lo necesario para summary(). Los registros
+        devueltos por tell() incluyen la población si `include_population`
+        (o `keep_history`) es True.
+
+        `adaptive_rates` activa las tasas adaptativas: límites (mínimo, máximo) por
+        probabilidad, p. ej. {'prob_mutation_g': (0.01, 0.3)}, y opcionalmente
+        'target_diversity' y 'gain' (ver algorithm/adaptive_rates.py). Las
+        probabilidades fijas se usan como valores iniciales.
+
+        `elite_count` (k) es el número de mejores individuos que pasan sin cambios
+        a la generación siguiente. Su fitness ya se conoce, así que ask() no los
+        vuelve a pedir: cada lote tiene pop_size - k candidatos (salvo el primero).
+
+        `niching='crowding'` usa crowding determinista en lugar de la poda
+        aleatoria para mantener varios óptimos (ver algorithm/niching.py);
+        `niche_radius` es la separación en x que distingue dos nichos al
+        informarlos (por defecto una fracción del intervalo) y `max_niches` el
+        número de nichos informados (los mejores; None = todos). Los que quedan
+        fuera se cuentan en ga_results['niches_omitted'] y los individuos sin
+        nicho (grupos de uno) en ga_results['niche_isolated'].
+
+        `memetic` activa el refinamiento local con la derivada simbólica:
+        {'interval': k, 'top': m, 'steps': s} (las claves que falten toman los
+        valores por defecto; ver algorithm/memetic.py). Cada k generaciones los m
+        mejores dan hasta s pasos de Newton/gradiente y vuelven a la población
+        con sus bits; sus evaluaciones de f se hacen con el proveedor y se
+        cuentan en las de la ejecución.
+
+        Raises:
+            ValueError: Si elite_count no está en [0, pop_size), si el modo de
+                nichos no existe o si se combina con elitismo (el crowding ya
+                conserva a los mejores), o si las opciones de `memetic` no son válidas.
+        """
+        if not 0 <= elite_count < max(1, pop_size):
+            raise ValueError(f"El número de élites debe estar entre 0 y {max(0, pop_size - 1)}, "
+                             f"se recibió {elite_count}.")
+        if niching is not None:
+            if niching not in NICHING_MODES:
+                raise ValueError(f"Modo de nichos desconocido: '{niching}'. Opciones: {NICHING_MODES}")
+            if elite_count:
+                raise ValueError("El crowding determinista no se combina con elitismo: "
+                                 "un individuo solo se reemplaza por un hijo mejor.")
+            if pop_size < 2:
+                raise ValueError("Los nichos requieren una población de al menos 2 individuos.")
+            if max_niches is not None and max_niches < 1:
+                raise ValueError(f"max_niches debe ser positivo o None, se recibió {max_niches}.")
+        # --- 0. Obtener la función objetivo (texto y proveedor propio de esta ejecución) ---
+        current_function_provider = function_provider or get_function_provider().copy()
+
+        if seed is not None:
+            self._rng.seed(seed)
+        else:
+            self._rng = random.Random()
+
+        # --- 1. Calcular n_bits en base a (x_min, x_max, delta_x) ---
+        n_bits = self.compute_n_bits(x_min, x_max, delta_x)
+
+        initial_rates = {'prob_crossover': prob_crossover, 'prob_mutation_i': prob_mutation_i,
+                         'prob_mutation_g': prob_mutation_g}
+        adaptive = make_adaptive_rates(adaptive_rates, initial_rates)
+        refiner = make_memetic_refiner(memetic, current_function_provider, x_min, x_max, n_bits, is_minimizing)
 
         # --- 2. Inicialización de estructuras para historial ---
-        population_history_data = []           # List[List[individuo_bits]]
-        raw_fitness_history_data = []          # List[List[float]] (fitness real de cada individuo)
-        best_raw_fitness_history_data = []     # List[float] (mejor fitness real por generación)
+        self._state = {
+            'x_min': x_min, 'x_max': x_max, 'n_bits': n_bits,
+            'pop_size': pop_size, 'max_generations': max_generations,
+            'prob_crossover': prob_crossover,
+            'prob_mutation_i': prob_mutation_i,
+            'prob_mutation_g': prob_mutation_g,
+            'is_minimizing': is_minimizing,
+            'seed': seed,
+            # Tasas en uso (cambian por generación si son adaptativas)
+            'rates': adaptive.rates.copy() if adaptive else initial_rates,
+            'adaptive': adaptive,
+            'adaptive_rates': adaptive_rates,
+            'elite_count': elite_count,
+            # Fitness ya conocido de las élites, al principio de 'population' (no se reevalúan)
+            'known_fitness': [],
+            'evaluations': 0,
+            'niching': niching,
+            'niche_radius': niche_radius if niche_radius is not None else default_niche_radius(x_min, x_max),
+            'max_niches': max_niches,
+            # Parejas de padres pendientes del torneo de crowding (hasta evaluar a los hijos)
+            'crowding': None,
+            'memetic': refiner,
+            'function_provider': current_function_provider,
+            'function_text': current_function_provider.function_text,
+            'generation': 0,
+            # Creamos la población inicial (aleatoria)
+            'population': [self.create_individual(n_bits) for _ in range(pop_size)],
+            'awaiting_tell': False,
+            'done': False,
+            'final_fitness': None,
+            'initial_best_fitness': None,       # mejor fitness real de la primera generación
+            'include_population': include_population or keep_history,
+            'history': RunHistory() if keep_history else None,
+        }
 
-        # Creamos la población inicial (aleatoria)
-        population = [self.create_individual(n_bits) for _ in range(pop_size)]
+    @property
+    def function_provider(self):
+        """Proveedor de la función objetivo de la ejecución actual"""
+        return self._state['function_provider'] if self._state else None
 
-        # --- 2b. (opcional) Barra de progreso en Tkinter ---
-        internal_progress_window = None
-        local_progress_bar = None
-        local_progress_label = None
-        is_tk_parent = progress_root_window and (
-            isinstance(progress_root_window, tk.Tk) or isinstance(progress_root_window, tk.Toplevel)
-        )
-        if is_tk_parent:
-            try:
-                internal_progress_window = tk.Toplevel(progress_root_window)
-                internal_progress_window.title("Ejecutando AG (Ejemplo)...")
-                internal_progress_window.geometry("400x120")
-                internal_progress_window.configure(bg='#f0f0f0')
-                modo = "Minimizando" if is_minimizing else "Maximizando"
-                tk.Label(
-                    internal_progress_window,
-                    text=f"Ejecutando AG de Ejemplo... ({modo})",
-                    font=("Arial", 12),
-                    bg='#f0f0f0'
-                ).pack(pady=20)
-                local_progress_bar = ttk.Progressbar(
-                    internal_progress_window,
-                    mode='determinate',
-                    maximum=max_generations
-                )
-                local_progress_bar.pack(pady=10, padx=20, fill='x')
-                local_progress_label = tk.Label(
-                    internal_progress_window,
-                    text="",
-                    font=("Arial", 10),
-                    bg='#f0f0f0'
-                )
-                local_progress_label.pack()
-                internal_progress_window.update()
-            except tk.TclError:
-                internal_progress_window = None
-
-        # --- 3. Bucle principal de generaciones ---
-        for generation in range(max_generations):
-            # 3.1 Evaluar cada individuo: obtener fitness interno (para la lógica del AG)
-            #     y fitness real (para historiales y reporte final)
-            internal_fitness_scores = []
-            current_gen_raw_fitness = []
-            for indiv in population:
-                x_val = binary_to_decimal(indiv, x_min, x_max, n_bits)
-                fit_interna = objective_function(x_val, is_minimizing)   # fitness “interno” según si minimiza/maximiza
-                fit_cruda   = get_raw_function_value(x_val)               # fitness real (sin signo)
-                internal_fitness_scores.append(fit_interna)
-                current_gen_raw_fitness.append(fit_cruda)
-
-            # 3.2 Guardar historiales de fitness real
-            if is_minimizing:
-                mejor_raw_esta_gen = min(current_gen_raw_fitness) if current_gen_raw_fitness else np.inf
-            else:
-                mejor_raw_esta_gen = max(current_gen_raw_fitness) if current_gen_raw_fitness else -np.inf
+    @property
+    def generation(self) -> int:
+        """Generación pendiente de evaluar (max_generations = evaluación final)"""
+        return self._state['generation'] if self._state else 0
 
-            best_raw_fitness_history_data.append(mejor_raw_esta_gen)
-            raw_fitness_history_data.append(current_gen_raw_fitness.copy())
-            population_history_data.append([ind.copy() for ind in population])
+    @property
+    def is_done(self) -> bool:
+        return bool(self._state and self._state['done'])
 
-            # 3.3 Actualizar barra de progreso (si aplica)
-            if internal_progress_window and local_progress_bar and local_progress_label:
-                local_progress_bar.config(value=generation + 1)
-                local_progress_label.config(text=f"Generación {generation + 1}/{max_generations}")
-                internal_progress_window.update()
+    def ask(self, as_genomes: bool = False):
+        """
+        Devuelve el siguiente lote de candidatos a evaluar: un arreglo con los
+        valores x decodificados o, con `as_genomes=True`, la lista de individuos.
+        Las élites de la generación anterior no se incluyen (su fitness ya se conoce).
 
-            # 3.4 SELECCIÓN + PODA:
-            #     - Primero, hallamos el fitness interno de cada individuo.
-            #     - Identificamos al “mejor” (según fitness interno).
-            #     - Después, para simular “poda aleatoria conservando al mejor”:
-            #         * Siempre mantenemos al mejor (por fitness real).
-            #         * De los demás, eliminamos aleatoriamente hasta reducir al 50% de la población actual.
-            #       (ejemplo: pop_size=10 → queremos 5 individuos para la siguiente fase)
-            #
-            #     NOTA: el enunciado pide “eliminar aleatoriamente, conservando al mejor”.
-            #
-            # Primer paso: encontrar índice del mejor individuo (por fitness real)
-            if current_gen_raw_fitness:
-                if is_minimizing:
-                    idx_mejor = current_gen_raw_fitness.index(min(current_gen_raw_fitness))
-                else:
-                    idx_mejor = current_gen_raw_fitness.index(max(current_gen_raw_fitness))
-            else:
-                idx_mejor = None
+        Raises:
+            RuntimeError: Si no se llamó a setup() o la ejecución ya terminó.
+        """
+        if self._state is None:
+            raise RuntimeError("Debe llamar a setup() antes de ask().")
+        if self._state['done']:
+            raise RuntimeError("La ejecución del AG ya terminó; use result().")
+        self._state['awaiting_tell'] = True
+        population = self._state['population'][len(self._state['known_fitness']):]
+        if as_genomes:
+            return [ind.copy() for ind in population]
+        return decode_population(population, self._state['x_min'], self._state['x_max'], self._state['n_bits'])
+
+    def tell(self, fitness) -> Optional[GenerationRecord]:
+        """
+        Recibe el fitness REAL f(x) de cada candidato del último ask(), en el mismo orden
+        (sin las élites, cuyo fitness se agrega internamente).
 
-            # Crear lista de pareja candidata: todos los índices menos el del mejor
-            indices_todos = list(range(len(population)))
-            if idx_mejor is not None:
-                indice_mejor = idx_mejor
-            else:
-                indice_mejor = None
-
-            # Ahora, escogemos aleatoriamente la mitad de los demás para eliminar:
-            # queremos conservar exactamente pop_size//2 individuos (incluido el mejor).
-            num_a_conservar = max(1, pop_size // 2)  # al menos 1 (que será el mejor).
-            conservados = []
-            if indice_mejor is not None:
-                conservados.append(indice_mejor)
-
-            candidatos_eliminar = [i for i in indices_todos if i != indice_mejor]
-            # Aleatoriamente escogemos (num_a_conservar-1) índices de los candidatos para conservar
-            if num_a_conservar - 1 > 0 and candidatos_eliminar:
-                seleccionados = random.sample(
-                    candidatos_eliminar,
-                    min(len(candidatos_eliminar), num_a_conservar - 1)
-                )
-                conservados += seleccionados
-
-            # Reconstruir población “podada”: solo los individuos en “conservados”
-            nueva_poblacion_parte = [population[i] for i in conservados]
-
-            # 3.5 EMPAREJAMIENTO + CRUZA + MUTACIÓN:
-            #
-            # Ahora, cada individuo de `nueva_poblacion_parte` genera una pareja “aleatoria”:
-            #   * Puede emparejarse incluso consigo mismo.
-            #   * Repetimos hasta reconstruir nuevamente pop_size individuos.
-            #
-            # Después, hacemos crossover de tres puntos y mutación (si cumple PMI → PMG).
-
-            new_population = []
-            # Creamos lista “posibles padres” igual a la población podada
-            posibles_padres = nueva_poblacion_parte.copy()
-            # Mientras no hayamos generado pop_size hijos (nueva generación):
-            while len(new_population) < pop_size:
-                # 1) Elegir un padre_i (en orden cíclico) y parearlo con un padre_j aleatorio:
-                padre_i = posibles_padres[len(new_population) % len(posibles_padres)]
-                padre_j = random.choice(posibles_padres)  # podría ser el mismo
-
-                # 2) Cruza tres puntos:
-                hijo1, hijo2 = self.crossover_three_points(padre_i, padre_j, prob_crossover)
-
-                # 3) MUTACIÓN:
-                #    - Primero: ver si el individuo cumple PMI (prob_mutation_i).
-                #    - Si cumple, aplicar “mutación_gen” con prob_mutation_g (PMG).
-                if random.random() < prob_mutation_i:
-                    hijo1 = self.mutation_gene(hijo1, prob_mutation_g)
-                if random.random() < prob_mutation_i:
-                    hijo2 = self.mutation_gene(hijo2, prob_mutation_g)
-
-                new_population.append(hijo1)
-                if len(new_population) < pop_size:
-                    new_population.append(hijo2)
-
-            # Actualizar población para la siguiente generación
-            population = new_population[:pop_size]
-
-        # Fin del bucle de generaciones
-        if internal_progress_window:
-            internal_progress_window.destroy()
+        Devuelve el GenerationRecord de la generación evaluada, o None si el lote
+        era la evaluación final.
+
+        Raises:
+            RuntimeError: Si no hay un lote pendiente.
+            ValueError: Si el número de valores no coincide con la población.
+        """
+        state = self._state
+        if state is None or not state['awaiting_tell']:
+            raise RuntimeError("tell() debe llamarse después de ask().")
+        known_fitness = state['known_fitness']
+        current_gen_raw_fitness = [float(f) for f in fitness]
+        expected = len(state['population']) - len(known_fitness)
+        if len(current_gen_raw_fitness) != expected:
+            raise ValueError(
+                f"Se esperaban {expected} valores de fitness, "
+                f"se recibieron {len(current_gen_raw_fitness)}."
+            )
+        state['awaiting_tell'] = False
+        state['evaluations'] += expected
+        current_gen_raw_fitness = known_fitness + current_gen_raw_fitness
+        if state['crowding'] is not None:
+            # Los hijos ya evaluados compiten con sus padres: quedan los sobrevivientes
+            state['population'], current_gen_raw_fitness = self._crowding_replace(
+                state['population'], current_gen_raw_fitness)
+        refiner = state['memetic']
+        if refiner is not None and state['generation'] < state['max_generations'] \
+                and refiner.is_due(state['generation']):
+            state['population'], current_gen_raw_fitness = self._memetic_refine(
+                state['population'], current_gen_raw_fitness)
+
+        if state['generation'] >= state['max_generations']:
+            # Evaluación final de la población resultante
+            state['final_fitness'] = current_gen_raw_fitness
+            state['done'] = True
+            return None
+
+        record = self._make_record(state['population'], current_gen_raw_fitness)
+        if state['initial_best_fitness'] is None:
+            state['initial_best_fitness'] = record.best_fitness
+        if state['history'] is not None:
+            state['history'].add(record)
+
+        state['population'] = self._next_generation(state['population'], current_gen_raw_fitness)
+        state['generation'] += 1
+        return record
+
+    def _make_record(self, population: List[List[int]], current_gen_raw_fitness: List[float]) -> GenerationRecord:
+        """Resume una generación evaluada (estadísticas vectorizadas sobre los bits y el fitness real)"""
+        state = self._state
+        fitness_array = np.asarray(current_gen_raw_fitness, dtype=float)
+        bits = np.asarray(population, dtype=np.uint8).reshape(len(population), state['n_bits'])
+        if fitness_array.size:
+            idx_mejor = int(np.argmin(fitness_array) if state['is_minimizing'] else np.argmax(fitness_array))
+            mejor_raw_esta_gen = float(fitness_array[idx_mejor])
+            best_x = binary_to_decimal(population[idx_mejor], state['x_min'], state['x_max'], state['n_bits'])
+        else:
+            mejor_raw_esta_gen = np.inf if state['is_minimizing'] else -np.inf
+            best_x = np.nan
+        stats = generation_statistics(bits, fitness_array, state['is_minimizing'])
+        diversity = stats['hamming_diversity']
+
+        include_population = state['include_population']
+        rates = None
+        if state['adaptive'] is not None:
+            # Las tasas ajustadas con esta generación son las que producen la siguiente
+            state['rates'] = rates = state['adaptive'].update(diversity)
+        return GenerationRecord(
+            generation=state['generation'],
+            best_x=best_x,
+            best_fitness=mejor_raw_esta_gen,
+            mean_fitness=stats['mean_fitness'],
+            std_fitness=stats['std_fitness'],
+            # Los individuos nunca se modifican in situ (cruza y mutación crean copias),
+            # así que basta una copia superficial de la lista como vista de la población.
+            population=list(population) if include_population else None,
+            fitness=current_gen_raw_fitness if include_population else None,
+            diversity=diversity,
+            rates=rates,
+            stats=stats
+        )
 
-        # --- 4. Evaluación final de la población y mejores resultados ---
-        final_internal_fitness = []
-        final_raw_fitness_report = []
-        for indiv in population:
-            x_val = binary_to_decimal(indiv, x_min, x_max, n_bits)
-            final_internal_fitness.append(objective_function(x_val, is_minimizing))
-            final_raw_fitness_report.append(get_raw_function_value(x_val))
+    def _next_generation(self, population: List[List[int]], current_gen_raw_fitness: List[float]) -> List[List[int]]:
+        """Aplica poda, emparejamiento, cruza y mutación sobre una generación evaluada"""
+        state = self._state
+        pop_size = state['pop_size']
+        is_minimizing = state['is_minimizing']
+        rates = state['rates']
+        if state['niching'] == 'crowding':
+            return self._crowding_generation(population, current_gen_raw_fitness)
+
+        # SELECCIÓN + PODA:
+        #     - Identificamos al “mejor” (según fitness real).
+        #     - Después, para simular “poda aleatoria conservando al mejor”:
+        #         * Siempre mantenemos al mejor (por fitness real).
+        #         * De los demás, eliminamos aleatoriamente hasta reducir al 50% de la población actual.
+        #       (ejemplo: pop_size=10 → queremos 5 individuos para la siguiente fase)
+        #
+        #     NOTA: el enunciado pide “eliminar aleatoriamente, conservando al mejor”.
+        #
+        # ÉLITES: los k mejores pasan intactos a la siguiente generación, con su
+        # fitness (no se reevalúan). argpartition es O(N); solo se ordenan los k.
+        elites = []
+        state['known_fitness'] = []
+        elite_count = min(state['elite_count'], len(population))
+        if elite_count:
+            ranked = np.asarray(current_gen_raw_fitness, dtype=float)
+            ranked = np.where(np.isnan(ranked), np.inf, ranked if is_minimizing else -ranked)
+            top = np.argpartition(ranked, elite_count - 1)[:elite_count]
+            top = top[np.argsort(ranked[top], kind='stable')]
+            elites = [population[i] for i in top]
+            state['known_fitness'] = [current_gen_raw_fitness[i] for i in top]
+
+        # Primer paso: encontrar índice del mejor individuo (por fitness real)
+        if current_gen_raw_fitness:
+            if is_minimizing:
+                idx_mejor = current_gen_raw_fitness.index(min(current_gen_raw_fitness))
+            else:
+                idx_mejor = current_gen_raw_fitness.index(max(current_gen_raw_fitness))
+        else:
+            idx_mejor = None
+
+        # Crear lista de pareja candidata: todos los índices menos el del mejor
+        indices_todos = list(range(len(population)))
+        indice_mejor = idx_mejor
+
+        # Ahora, escogemos aleatoriamente la mitad de los demás para eliminar:
+        # queremos conservar exactamente pop_size//2 individuos (incluido el mejor).
+        num_a_conservar = max(1, pop_size // 2)  # al menos 1 (que será el mejor).
+        conservados = []
+        if indice_mejor is not None:
+            conservados.append(indice_mejor)
+
+        candidatos_eliminar = [i for i in indices_todos if i != indice_mejor]
+        # Aleatoriamente escogemos (num_a_conservar-1) índices de los candidatos para conservar
+        if num_a_conservar - 1 > 0 and candidatos_eliminar:
+            seleccionados = self._rng.sample(
+                candidatos_eliminar,
+                min(len(candidatos_eliminar), num_a_conservar - 1)
+            )
+            conservados += seleccionados
+
+        # Reconstruir población “podada”: solo los individuos en “conservados”
+        nueva_poblacion_parte = [population[i] for i in conservados]
+        if not nueva_poblacion_parte:
+            return population
+
+        # EMPAREJAMIENTO + CRUZA + MUTACIÓN:
+        #
+        # Ahora, cada individuo de `nueva_poblacion_parte` genera una pareja “aleatoria”:
+        #   * Puede emparejarse incluso consigo mismo.
+        #   * Repetimos hasta reconstruir nuevamente pop_size individuos.
+        #
+        # Después, hacemos crossover de tres puntos y mutación (si cumple PMI → PMG).
+        new_population = []
+        # Creamos lista “posibles padres” igual a la población podada
+        posibles_padres = nueva_poblacion_parte.copy()
+        # Mientras no hayamos generado pop_size - k hijos (nueva generación):
+        while len(new_population) < pop_size - len(elites):
+            # 1) Elegir un padre_i (en orden cíclico) y parearlo con un padre_j aleatorio:
+            padre_i = posibles_padres[len(new_population) % len(posibles_padres)]
+            padre_j = self._rng.choice(posibles_padres)  # podría ser el mismo
+
+            # 2) Cruza tres puntos:
+            hijo1, hijo2 = self.crossover_three_points(padre_i, padre_j, rates['prob_crossover'])
+
+            # 3) MUTACIÓN:
+            #    - Primero: ver si el individuo cumple PMI (prob_mutation_i).
+            #    - Si cumple, aplicar “mutación_gen” con prob_mutation_g (PMG).
+            if self._rng.random() < rates['prob_mutation_i']:
+                hijo1 = self.mutation_gene(hijo1, rates['prob_mutation_g'])
+            if self._rng.random() < rates['prob_mutation_i']:
+                hijo2 = self.mutation_gene(hijo2, rates['prob_mutation_g'])
+
+            new_population.append(hijo1)
+            if len(new_population) < pop_size - len(elites):
+                new_population.append(hijo2)
+
+        # Población para la siguiente generación (las élites primero, sin cambios)
+        return elites + new_population[:pop_size - len(elites)]
+
+    def _crowding_generation(self, population: List[List[int]], current_gen_raw_fitness: List[float]) -> List[List[int]]:
+        """
+        Crowding determinista, primera mitad: empareja la población al azar (sin
+        reemplazo) y genera dos hijos por pareja con la cruza y mutación de siempre.
+        Los padres quedan en state['crowding'] hasta que tell() recibe el fitness
+        de los hijos. Con población impar, el individuo sin pareja pasa intacto.
+        """
+        state = self._state
+        rates = state['rates']
+        order = list(range(len(population)))
+        self._rng.shuffle(order)
+        carried = []
+        state['known_fitness'] = []
+        if len(order) % 2:
+            leftover = order.pop()
+            carried = [population[leftover]]
+            state['known_fitness'] = [current_gen_raw_fitness[leftover]]
+
+        parents, parent_fitness, children = [], [], []
+        for a, b in zip(order[0::2], order[1::2]):
+            hijo1, hijo2 = self.crossover_three_points(population[a], population[b], rates['prob_crossover'])
+            if self._rng.random() < rates['prob_mutation_i']:
+                hijo1 = self.mutation_gene(hijo1, rates['prob_mutation_g'])
+            if self._rng.random() < rates['prob_mutation_i']:
+                hijo2 = self.mutation_gene(hijo2, rates['prob_mutation_g'])
+            parents.append((population[a], population[b]))
+            parent_fitness.append((current_gen_raw_fitness[a], current_gen_raw_fitness[b]))
+            children += [hijo1, hijo2]
+        state['crowding'] = (parents, parent_fitness)
+        return carried + children
+
+    def _crowding_replace(self, population: List[List[int]], fitness: List[float]):
+        """Crowding determinista, segunda mitad: cada hijo evaluado reemplaza al padre más cercano si es mejor"""
+        state = self._state
+        parents, parent_fitness = state['crowding']
+        state['crowding'] = None
+        n_carried = len(population) - 2 * len(parents)
+        survivors, survivor_fitness = population[:n_carried], fitness[:n_carried]
+        if not parents:
+            return survivors, survivor_fitness
+
+        decode = lambda individuals: decode_population(
+            individuals, state['x_min'], state['x_max'], state['n_bits']).reshape(-1, 2)
+        children = population[n_carried:]
+        child_fitness = fitness[n_carried:]
+        swap, wins = crowding_replacement(
+            decode([ind for pair in parents for ind in pair]), parent_fitness,
+            decode(children), np.asarray(child_fitness).reshape(-1, 2), state['is_minimizing'])
+        for p, (pair, pair_fitness) in enumerate(zip(parents, parent_fitness)):
+            for side in (0, 1):
+                child = 2 * p + (1 - side if swap[p] else side)
+                if wins[p, side]:
+                    survivors.append(children[child])
+                    survivor_fitness.append(child_fitness[child])
+                else:
+                    survivors.append(pair[side])
+                    survivor_fitness.append(pair_fitness[side])
+        return survivors, survivor_fitness
+
+    def _memetic_refine(self, population: List[List[int]], fitness: List[float]):
+        """Refina localmente a los mejores de una generación evaluada (ver algorithm/memetic.py)"""
+        state = self._state
+        refiner = state['memetic']
+        top = min(refiner.top, len(population))
+        ranked = np.asarray(fitness, dtype=float)
+        ranked = np.where(np.isnan(ranked), np.inf, ranked if state['is_minimizing'] else -ranked)
+        chosen = np.argpartition(ranked, top - 1)[:top]
+        evaluations_before = refiner.stats['evaluations']
+        bits, refined_fitness = refiner.refine(
+            np.asarray([population[i] for i in chosen], dtype=np.uint8), [fitness[i] for i in chosen])
+        state['evaluations'] += refiner.stats['evaluations'] - evaluations_before
+        # Listas nuevas: los registros ya emitidos conservan su vista de la población
+        population, fitness = list(population), list(fitness)
+        for row, i in enumerate(chosen):
+            if refined_fitness[row] != fitness[i]:
+                population[i] = bits[row].tolist()
+                fitness[i] = float(refined_fitness[row])
+        return population, fitness
+
+    def summary(self) -> Dict[str, Any]:
+        """Construye el diccionario 'ga_results' (sin historiales) de una ejecución terminada"""
+        state = self._state
+        if state is None or not state['done']:
+            raise RuntimeError("La ejecución del AG no ha terminado.")
+        x_min, x_max, n_bits = state['x_min'], state['x_max'], state['n_bits']
+        is_minimizing = state['is_minimizing']
+        population = state['population']
+        final_raw_fitness_report = state['final_fitness']
 
         # Determinar el mejor individuo final (según fitness REAL)
         if final_raw_fitness_report:
@@ -310,17 +555,17 @@ class GeneticAlgorithm:
         if idx_mejor_final is not None:
             best_individual_final = population[idx_mejor_final]
             best_x_final         = binary_to_decimal(best_individual_final, x_min, x_max, n_bits)
-            best_raw_fitness_final = get_raw_function_value(best_x_final)
+            best_raw_fitness_final = final_raw_fitness_report[idx_mejor_final]
         else:
             # En caso extremo, generamos un individuo al azar
             best_individual_final = self.create_individual(n_bits)
             best_x_final = binary_to_decimal(best_individual_final, x_min, x_max, n_bits)
-            best_raw_fitness_final = get_raw_function_value(best_x_final)
+            best_raw_fitness_final = get_raw_function_value(best_x_final, state['function_provider'])
 
         # Calcular mejora sobre los fitness reales (de la primera generación a la última)
         improvement = 0.0
-        if best_raw_fitness_history_data:
-            inicial = best_raw_fitness_history_data[0]
+        if state['initial_best_fitness'] is not None:
+            inicial = state['initial_best_fitness']
             if is_minimizing:
                 improvement = inicial - best_raw_fitness_final
             else:
@@ -334,21 +579,257 @@ class GeneticAlgorithm:
             'x_min': x_min,
             'x_max': x_max,
             'n_bits': n_bits,
-            'pop_size': pop_size,
-            'generations': max_generations,
-            'prob_crossover': prob_crossover,
-            'prob_mutation_i': prob_mutation_i,
-            'prob_mutation_g': prob_mutation_g,
+            'pop_size': state['pop_size'],
+            'generations': state['max_generations'],
+            'prob_crossover': state['prob_crossover'],
+            'prob_mutation_i': state['prob_mutation_i'],
+            'prob_mutation_g': state['prob_mutation_g'],
             'improvement': improvement,
             'final_population': [ind.copy() for ind in population],
             'final_fitness': final_raw_fitness_report,
             'is_minimizing': is_minimizing,
-            'function_text_for_report': function_text_used_by_ga
+            'seed': state['seed'],
+            'function_text_for_report': state['function_text']
         }
+        if state['adaptive_rates']:
+            ga_results_dict['adaptive_rates'] = state['adaptive_rates']
+        if state['elite_count']:
+            ga_results_dict['elite_count'] = state['elite_count']
+        if state['elite_count'] or state['niching'] or state['memetic'] is not None:
+            ga_results_dict['evaluations'] = state['evaluations']
+        if state['memetic'] is not None:
+            ga_results_dict['memetic'] = state['memetic'].options
+            ga_results_dict['memetic_stats'] = dict(state['memetic'].stats)
+        if state['niching']:
+            x_final = decode_population(population, x_min, x_max, n_bits) if population else []
+            ga_results_dict['niching'] = state['niching']
+            ga_results_dict['niche_radius'] = state['niche_radius']
+            # Todos los grupos (también los de un individuo) para contar lo que no se informa
+            groups = find_niches(x_final, final_raw_fitness_report or [], is_minimizing,
+                                 state['niche_radius'], max_niches=None, min_size=1)
+            niches = [group for group in groups if group['size'] >= MIN_NICHE_SIZE]
+            shown = niches if state['max_niches'] is None else niches[:state['max_niches']]
+            ga_results_dict['niches'] = shown
+            ga_results_dict['niches_omitted'] = len(niches) - len(shown)
+            ga_results_dict['niche_isolated'] = sum(group['size'] for group in groups
+                                                    if group['size'] < MIN_NICHE_SIZE)
+
+        return ga_results_dict
+
+    def result(self) -> Dict[str, Any]:
+        """Diccionario de resultados completo (ver run()); requiere setup(keep_history=True)"""
+        state = self._state
+        history = state['history'] if state else None
+        if history is None:
+            history = RunHistory()
+        return history.build(self.summary())
+
+    # ------------------------------------------------------------------
+    # Ejecución completa (envoltorio sobre ask/tell)
+    # ------------------------------------------------------------------
+    def _create_progress_window(self, progress_root_window, max_generations, is_minimizing):
+        """(opcional) Barra de progreso en Tkinter; devuelve (ventana, barra, etiqueta) o Nones"""
+        is_tk_parent = progress_root_window and (
+            isinstance(progress_root_window, tk.Tk) or isinstance(progress_root_window, tk.Toplevel)
+        )
+        if not is_tk_parent:
+            return None, None, None
+        try:
+            internal_progress_window = tk.Toplevel(progress_root_window)
+            internal_progress_window.title("Ejecutando AG (Ejemplo)...")
+            internal_progress_window.geometry("400x120")
+            internal_progress_window.configure(bg='#f0f0f0')
+            modo = "Minimizando" if is_minimizing else "Maximizando"
+            tk.Label(
+                internal_progress_window,
+                text=f"Ejecutando AG de Ejemplo... ({modo})",
+                font=("Arial", 12),
+                bg='#f0f0f0'
+            ).pack(pady=20)
+            local_progress_bar = ttk.Progressbar(
+                internal_progress_window,
+                mode='determinate',
+                maximum=max_generations
+            )
+            local_progress_bar.pack(pady=10, padx=20, fill='x')
+            local_progress_label = tk.Label(
+                internal_progress_window,
+                text="",
+                font=("Arial", 10),
+                bg='#f0f0f0'
+            )
+            local_progress_label.pack()
+            internal_progress_window.update()
+            return internal_progress_window, local_progress_bar, local_progress_label
+        except tk.TclError:
+            return None, None, None
 
-        return {
-            'ga_results': ga_results_dict,
-            'population_history': population_history_data,
-            'fitness_history': raw_fitness_history_data,
-            'best_fitness_history': best_raw_fitness_history_data
-        }
+    def run(
+        self,
+        x_min: float,
+        x_max: float,
+        delta_x: float,
+        pop_size: int,
+        max_generations: int,
+        prob_crossover: float,
+        prob_mutation_i: float,
+        prob_mutation_g: float,
+        is_minimizing: bool,
+        progress_root_window: tk.Tk = None,
+        function_provider=None,
+        evaluator=None,
+        seed: int = None,
+        generation_callback=None,
+        adaptive_rates: Optional[Dict[str, Any]] = None,
+        history_mode: str = 'full',
+        history_param: Optional[int] = None,
+        elite_count: int = 0,
+        niching: Optional[str] = None,
+        niche_radius: Optional[float] = None,
+        memetic: Optional[Dict[str, Any]] = None,
+        max_niches: Optional[int] = DEFAULT_MAX_NICHES
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta el algoritmo genético completo, devolviendo:
+          {
+            'ga_results': {
+                'best_individual': [...],
+                'best_x': float,
+                'best_fitness': float,
+                'objective_function_raw': float,
+                'x_min': ..., 'x_max': ..., 'n_bits': ...,
+                'pop_size': ..., 'generations': ...,
+                'prob_crossover': ..., 'prob_mutation_i': ...,
+                'prob_mutation_g': ..., 'improvement': ...,
+                'final_population': [...],
+                'final_fitness': [...],
+                'is_minimizing': ...,
+                'seed': ...,
+                'function_text_for_report': str
+            },
+            'population_history': [...],       # poblaciones por generación (listas de individuos)
+            'fitness_history': [...],          # fitness real de cada individuo por generación
+            'best_fitness_history': [...]      # mejor fitness real por generación
+          }
+
+        `function_provider` es el proveedor de la función objetivo para esta ejecución.
+        Si no se indica, se usa una copia del proveedor global, de modo que editar la
+        función durante la ejecución no la afecta.
+
+        `evaluator` es el backend que evalúa cada generación en bloque
+        (ver utils.evaluation); por defecto se evalúa en el proceso actual.
+
+        `seed` fija el generador aleatorio para que la ejecución sea reproducible.
+
+        `generation_callback(record)` se llama con el GenerationRecord de cada
+        generación en cuanto se evalúa (p. ej. para graficar en vivo).
+
+        `adaptive_rates` activa las tasas adaptativas (ver setup()); la diversidad
+        y las tasas de cada generación quedan en ga_results['rate_history'].
+
+        Las estadísticas por generación (media, desviación, mediana, peor, genomas
+        distintos y diversidad de Hamming) se calculan dentro del bucle y quedan en
+        ga_results['generation_stats'].
+
+        `history_mode` es la política de retención de poblaciones (ver
+        algorithm/history.py): 'full', 'every_k', 'improved', 'reservoir' o
+        'stats'; `history_param` es la k de 'every_k' o el tamaño de muestra de
+        'reservoir'. Fuera de 'full', ga_results['history_generations'] da la
+        generación de cada entrada de population_history y fitness_history.
+
+        `elite_count` conserva intactos los k mejores de cada generación (ver
+        setup()); ga_results registra entonces 'elite_count' y las 'evaluations'
+        reales de la función.
+
+        `niching='crowding'` mantiene varios óptimos en la población (ver
+        setup()); los nichos de la población final quedan en ga_results['niches'],
+        el mejor primero (a lo sumo `max_niches`; los demás se cuentan en
+        ga_results['niches_omitted']), junto con las 'evaluations' reales.
+
+        `memetic` activa el refinamiento local con derivadas exactas (ver
+        setup()); sus opciones y contadores quedan en ga_results['memetic'] y
+        ga_results['memetic_stats'].
+
+        Raises:
+            ValueError: Si `history_mode` no es uno de HISTORY_MODES o
+                los parámetros de élites, nichos o refinamiento local no son
+                válidos (ver setup()).
+
+        Es un envoltorio sobre stream(): consume los registros de cada generación
+        y reconstruye con ellos el historial completo.
+        """
+        history = RunHistory(history_mode, history_param, is_minimizing, seed)
+        internal_progress_window, local_progress_bar, local_progress_label = \
+            self._create_progress_window(progress_root_window, max_generations, is_minimizing)
+
+        for record in self.stream(
+            x_min, x_max, delta_x, pop_size, max_generations,
+            prob_crossover, prob_mutation_i, prob_mutation_g, is_minimizing,
+            function_provider=function_provider, evaluator=evaluator, seed=seed,
+            include_population=history.keeps_populations, adaptive_rates=adaptive_rates,
+            elite_count=elite_count, niching=niching, niche_radius=niche_radius,
+            memetic=memetic, max_niches=max_niches
+        ):
+            history.add(record)
+            if generation_callback is not None:
+                generation_callback(record)
+
+            # Actualizar barra de progreso (si aplica)
+            if internal_progress_window and local_progress_bar and local_progress_label:
+                local_progress_bar.config(value=record.generation + 1)
+                local_progress_label.config(text=f"Generación {record.generation + 1}/{max_generations}")
+                internal_progress_window.update()
+
+        if internal_progress_window:
+            internal_progress_window.destroy()
+
+        return history.build(self.summary())
+
+    def stream(
+        self,
+        x_min: float,
+        x_max: float,
+        delta_x: float,
+        pop_size: int,
+        max_generations: int,
+        prob_crossover: float,
+        prob_mutation_i: float,
+        prob_mutation_g: float,
+        is_minimizing: bool,
+        function_provider=None,
+        evaluator=None,
+        seed: int = None,
+        include_population: bool = False,
+        adaptive_rates: Optional[Dict[str, Any]] = None,
+        elite_count: int = 0,
+        niching: Optional[str] = None,
+        niche_radius: Optional[float] = None,
+        memetic: Optional[Dict[str, Any]] = None,
+        max_niches: Optional[int] = DEFAULT_MAX_NICHES
+    ) -> Iterator[GenerationRecord]:
+        """
+        Ejecuta el AG generación a generación, produciendo un GenerationRecord por
+        generación a medida que se evalúa. El consumidor puede graficar en vivo,
+        registrar, detenerse antes (basta con dejar de iterar) o descartar lo que
+        no necesite: no se guarda ningún historial internamente.
+
+        Con `include_population=True` cada registro trae también la población y
+        su fitness, suficiente para reconstruir el resultado de run() con RunHistory.
+        Al terminar, summary() devuelve el diccionario 'ga_results'.
+        """
+        self.setup(
+            x_min, x_max, delta_x, pop_size, max_generations,
+            prob_crossover, prob_mutation_i, prob_mutation_g, is_minimizing,
+            function_provider=function_provider, seed=seed,
+            keep_history=False, include_population=include_population,
+            adaptive_rates=adaptive_rates, elite_count=elite_count,
+            niching=niching, niche_radius=niche_radius, memetic=memetic, max_niches=max_niches
+        )
+        if evaluator is None:
+            evaluator = SerialEvaluator(self.function_provider)
+
+        # --- Bucle principal: pedir lote, evaluarlo en bloque y devolver el fitness real ---
+        while not self.is_done:
+            record = self.tell(evaluator.evaluate(self.ask()))
+            if record is not None:
+                yield record
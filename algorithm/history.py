@@ -0,0 +1,189 @@
+"""
+Registros por generación y reconstrucción del historial de una ejecución.
+
+GeneticAlgorithm.stream() produce un GenerationRecord por generación; quien
+consume el flujo decide qué guardar. RunHistory acumula los registros y arma
+el diccionario de resultados clásico de run().
+
+Las estadísticas por generación (algorithm/population_stats.py) y el mejor
+fitness se guardan siempre, en arreglos compactos de float64. La política de
+retención (history_mode) decide qué poblaciones se conservan:
+
+  - 'full': todas las generaciones completas.
+  - 'every_k': una de cada k generaciones (la 0, k, 2k, ...).
+  - 'improved': solo las generaciones en que mejora el mejor fitness acumulado.
+  - 'reservoir': todas las generaciones, pero solo una muestra de s individuos
+    (siempre con el mejor; el resto al azar, sin tocar el generador del AG).
+  - 'stats': ninguna población ni fitness por individuo (memoria mínima).
+
+Fuera de 'full', ga_results['history_generations'] indica a qué generación
+corresponde cada entrada de population_history / fitness_history.
+"""
+
+import random
+from array import array
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from algorithm.population_stats import GENERATION_STAT_NAMES
+
+HISTORY_MODES = ('full', 'every_k', 'improved', 'reservoir', 'stats')
+HISTORY_PARAM_MODES = ('every_k', 'reservoir')   # modos que usan history_param
+DEFAULT_HISTORY_INTERVAL = 10      # k de 'every_k'
+DEFAULT_RESERVOIR_SIZE = 10        # individuos por generación de 'reservoir'
+
+
+def history_generation_numbers(ga_results: Dict[str, Any], n_entries: int) -> np.ndarray:
+    """Generación (desde 0) de cada una de las `n_entries` entradas de population_history"""
+    kept = ga_results.get('history_generations')
+    if kept is None:
+        return np.arange(n_entries)
+    return np.asarray(kept, dtype=int)[:n_entries]
+
+
+def replay_records(results: Dict[str, Any]):
+    """
+    Reconstruye los GenerationRecord de una ejecución ya terminada (p. ej. leída
+    de la caché) para reproducirlos en quien consume el flujo en vivo.
+
+    El mejor fitness sale de best_fitness_history, la media y la desviación de
+    generation_stats (NaN si no se guardaron) y el fitness por individuo de las
+    generaciones conservadas en fitness_history. best_x no se guarda por
+    generación y queda en NaN.
+    """
+    ga_results = results['ga_results']
+    best_fitness_history = results['best_fitness_history']
+    fitness_history = results.get('fitness_history')
+    fitness_history = fitness_history if fitness_history is not None else []
+    kept = {int(g): i for i, g in enumerate(history_generation_numbers(ga_results, len(fitness_history)))}
+    stats = ga_results.get('generation_stats') or {}
+    n_generations = len(best_fitness_history)
+    means = np.asarray(stats.get('mean_fitness', np.full(n_generations, np.nan)), dtype=float)
+    stds = np.asarray(stats.get('std_fitness', np.full(n_generations, np.nan)), dtype=float)
+    for generation in range(n_generations):
+        entry = kept.get(generation)
+        yield GenerationRecord(
+            generation=generation,
+            best_x=float('nan'),
+            best_fitness=float(best_fitness_history[generation]),
+            mean_fitness=float(means[generation]) if generation < means.size else float('nan'),
+            std_fitness=float(stds[generation]) if generation < stds.size else float('nan'),
+            fitness=list(fitness_history[entry]) if entry is not None else None,
+        )
+
+
+class GenerationRecord(NamedTuple):
+    """Resumen ligero de una generación evaluada"""
+    generation: int                          # índice de la generación (desde 0)
+    best_x: float                            # x del mejor individuo de la generación
+    best_fitness: float                      # mejor fitness real f(x) de la generación
+    mean_fitness: float                      # media del fitness real
+    std_fitness: float                       # desviación estándar del fitness real
+    population: Optional[List[List[int]]] = None   # vista de la población (si se pidió)
+    fitness: Optional[List[float]] = None          # fitness real de cada individuo (si se pidió)
+    diversity: Optional[float] = None              # distancia de Hamming media normalizada
+    rates: Optional[Dict[str, float]] = None       # tasas para la siguiente generación (adaptativas)
+    stats: Optional[Dict[str, float]] = None       # estadísticas de GENERATION_STAT_NAMES
+
+
+class RunHistory:
+    """Acumula GenerationRecord y construye el diccionario de resultados de run()"""
+
+    def __init__(self, history_mode: str = 'full', history_param: Optional[int] = None,
+                 is_minimizing: bool = False, seed: Optional[int] = None):
+        """
+        Args:
+            history_mode: Política de retención (ver HISTORY_MODES).
+            history_param: k de 'every_k' o tamaño de la muestra de 'reservoir'.
+            is_minimizing: Sentido de la mejora para 'improved'.
+            seed: Semilla de la muestra de 'reservoir' (independiente de la del AG).
+
+        Raises:
+            ValueError: Si el modo no existe o history_param no es positivo.
+        """
+        if history_mode not in HISTORY_MODES:
+            raise ValueError(f"Modo de historial desconocido: '{history_mode}'. Opciones: {HISTORY_MODES}")
+        if history_param is None:
+            history_param = DEFAULT_RESERVOIR_SIZE if history_mode == 'reservoir' else DEFAULT_HISTORY_INTERVAL
+        if history_param < 1:
+            raise ValueError(f"El parámetro del historial debe ser positivo, se recibió {history_param}.")
+        self.history_mode = history_mode
+        self.history_param = int(history_param)
+        self.is_minimizing = is_minimizing
+        self._sample_rng = random.Random(seed)
+        self._best_so_far = None
+        self.population_history = []
+        self.fitness_history = []
+        self.best_fitness_history = []
+        self.history_generations = []
+        self.rate_history = {}
+        self.generation_stats = {name: array('d') for name in GENERATION_STAT_NAMES}
+
+    @property
+    def keeps_populations(self) -> bool:
+        """Si la política guarda alguna población (los registros deben traerla)"""
+        return self.history_mode != 'stats'
+
+    def _retain(self, record: GenerationRecord) -> bool:
+        """Decide si se conserva la población de la generación del registro"""
+        mode = self.history_mode
+        if mode == 'every_k':
+            return record.generation % self.history_param == 0
+        if mode == 'improved':
+            best = record.best_fitness
+            improved = self._best_so_far is None or (
+                best < self._best_so_far if self.is_minimizing else best > self._best_so_far)
+            if improved:
+                self._best_so_far = best
+            return improved
+        return mode != 'stats'
+
+    def _sample(self, population, fitness):
+        """Muestra de 'reservoir': el mejor más history_param - 1 individuos al azar, en su orden original"""
+        size = self.history_param
+        if len(population) <= size:
+            return population, fitness
+        pick = min if self.is_minimizing else max
+        best = pick(range(len(fitness)), key=fitness.__getitem__)
+        others = [i for i in range(len(population)) if i != best]
+        chosen = sorted(self._sample_rng.sample(others, size - 1) + [best])
+        return [population[i] for i in chosen], [fitness[i] for i in chosen]
+
+    def add(self, record: GenerationRecord) -> None:
+        self.best_fitness_history.append(record.best_fitness)
+        if record.population is not None and self._retain(record):
+            population, fitness = record.population, record.fitness
+            if self.history_mode == 'reservoir':
+                population, fitness = self._sample(population, fitness)
+            self.population_history.append(population)
+            self.fitness_history.append(fitness)
+            self.history_generations.append(record.generation)
+        if record.rates is not None:
+            self.rate_history.setdefault('diversity', []).append(record.diversity)
+            for name, value in record.rates.items():
+                self.rate_history.setdefault(name, []).append(value)
+        if record.stats is not None:
+            for name, values in self.generation_stats.items():
+                values.append(record.stats[name])
+
+    def build(self, ga_results: Dict[str, Any]) -> Dict[str, Any]:
+        extra = {}
+        if self.history_mode != 'full':
+            extra['history_mode'] = self.history_mode
+            extra['history_generations'] = self.history_generations
+            if self.history_mode in HISTORY_PARAM_MODES:
+                extra['history_param'] = self.history_param
+        if self.rate_history:
+            extra['rate_history'] = self.rate_history
+        if len(self.generation_stats[GENERATION_STAT_NAMES[0]]):
+            extra['generation_stats'] = {name: np.frombuffer(values, dtype=np.float64)
+                                         for name, values in self.generation_stats.items()}
+        if extra:
+            ga_results = dict(ga_results, **extra)
+        return {
+            'ga_results': ga_results,
+            'population_history': self.population_history,
+            'fitness_history': self.fitness_history,
+            'best_fitness_history': self.best_fitness_history
+        }
@@ -0,0 +1,198 @@
+"""
+Refinamiento local memético con la derivada simbólica de la función objetivo.
+
+La función es una expresión de sympy, así que f' y f'' exactas se compilan una
+vez por el mismo camino de lambdify que f (CustomFunctionProvider.
+get_derivative_values). Cada `interval` generaciones los `top` mejores
+individuos dan hasta `steps` pasos locales sobre su x decodificado:
+
+  - Newton (x - f'/f'') donde la curvatura apunta a un óptimo del modo actual
+    (f'' < 0 al maximizar, f'' > 0 al minimizar);
+  - si no, un paso de gradiente del tamaño del radio de confianza.
+
+El paso se recorta al radio de confianza y a [x_min, x_max] y se redondea a
+la malla de la codificación (la misma de decode_population, con paso
+(x_max - x_min) / (2**n_bits - 1) <= delta_x). Un paso solo se acepta si mejora
+f; entonces el radio se duplica, y si no, se reduce a la cuarta parte. El
+individuo termina cuando el paso redondeado ya no se mueve de su punto de la
+malla. Los individuos refinados vuelven a la población con sus bits
+(refinamiento lamarckiano).
+
+    python -m algorithm.memetic   # evaluaciones hasta el óptimo de la malla
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+DEFAULT_INTERVAL = 10        # refinar cada k generaciones
+DEFAULT_TOP = 3              # individuos refinados cada vez
+DEFAULT_STEPS = 5            # pasos locales por individuo
+INITIAL_RADIUS_FRACTION = 0.01
+
+
+def encode_grid_indices(indices, n_bits: int) -> np.ndarray:
+    """Índices de la malla (enteros en [0, 2**n_bits)) como bits (N, n_bits), el más significativo primero"""
+    indices = np.asarray(indices, dtype=np.int64)
+    shifts = np.arange(n_bits - 1, -1, -1, dtype=np.int64)
+    return ((indices[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+class MemeticRefiner:
+    """Búsqueda local con derivadas exactas sobre la malla de la codificación"""
+
+    def __init__(
+        self,
+        function_provider,
+        x_min: float,
+        x_max: float,
+        n_bits: int,
+        is_minimizing: bool,
+        interval: int = DEFAULT_INTERVAL,
+        top: int = DEFAULT_TOP,
+        steps: int = DEFAULT_STEPS
+    ):
+        """
+        Raises:
+            ValueError: Si el proveedor no puede derivar la función o algún
+                parámetro no es positivo.
+        """
+        if not hasattr(function_provider, 'get_derivative_values'):
+            raise ValueError("El refinamiento local requiere un proveedor con derivadas simbólicas.")
+        if min(interval, top, steps) < 1:
+            raise ValueError(f"interval, top y steps deben ser positivos: {interval}, {top}, {steps}.")
+        self.function_provider = function_provider
+        self.x_min, self.x_max, self.n_bits = x_min, x_max, n_bits
+        self.is_minimizing = is_minimizing
+        self.interval, self.top, self.steps = int(interval), int(top), int(steps)
+        self.max_index = 2 ** n_bits - 1
+        # Contadores acumulados de la ejecución
+        self.stats = {'refinements': 0, 'evaluations': 0, 'derivative_evaluations': 0, 'improved': 0}
+
+    @property
+    def options(self) -> Dict[str, int]:
+        return {'interval': self.interval, 'top': self.top, 'steps': self.steps}
+
+    def is_due(self, generation: int) -> bool:
+        return generation % self.interval == 0
+
+    def _to_x(self, indices: np.ndarray) -> np.ndarray:
+        # Misma fórmula que decode_population, para que x coincida con los bits
+        return self.x_min + (indices / self.max_index) * (self.x_max - self.x_min)
+
+    def _to_indices(self, x: np.ndarray) -> np.ndarray:
+        span = self.x_max - self.x_min
+        return np.clip(np.rint((x - self.x_min) / span * self.max_index), 0, self.max_index).astype(np.int64)
+
+    def refine(self, bits: np.ndarray, fitness: np.ndarray):
+        """
+        Refina individuos (bits (m, n_bits) y su fitness real (m,)).
+
+        Returns:
+            (bits, fitness) refinados, con el mismo orden; un individuo solo
+            cambia si su fitness mejoró.
+        """
+        fitness = np.asarray(fitness, dtype=float).copy()
+        if self.max_index <= 0 or len(fitness) == 0:
+            return bits, fitness
+        weights = 2 ** np.arange(self.n_bits - 1, -1, -1, dtype=np.int64)
+        indices = np.asarray(bits, dtype=np.int64) @ weights
+        direction = -1.0 if self.is_minimizing else 1.0
+        radius = np.full(len(fitness), INITIAL_RADIUS_FRACTION * (self.x_max - self.x_min))
+        active = np.isfinite(fitness)
+        improved = np.zeros(len(fitness), dtype=bool)
+        self.stats['refinements'] += 1
+
+        for _ in range(self.steps):
+            rows = np.flatnonzero(active)
+            if rows.size == 0:
+                break
+            x = self._to_x(indices[rows])
+            gradient = self.function_provider.get_derivative_values(x, 1)
+            curvature = self.function_provider.get_derivative_values(x, 2)
+            self.stats['derivative_evaluations'] += 2 * rows.size
+
+            with np.errstate(all='ignore'):
+                use_newton = np.isfinite(curvature) & (direction * curvature < 0)
+                step = np.where(use_newton, -gradient / curvature, direction * np.sign(gradient) * radius[rows])
+            step = np.clip(np.nan_to_num(step), -radius[rows], radius[rows])
+            candidates = self._to_indices(x + step)
+            moved = (candidates != indices[rows]) & np.isfinite(gradient) & (gradient != 0)
+            active[rows[~moved]] = False
+            rows, candidates = rows[moved], candidates[moved]
+            if rows.size == 0:
+                break
+
+            candidate_fitness = np.asarray(
+                self.function_provider.get_raw_function_values(self._to_x(candidates)), dtype=float)
+            self.stats['evaluations'] += rows.size
+            better = np.isfinite(candidate_fitness) & (direction * (candidate_fitness - fitness[rows]) > 0)
+            indices[rows[better]] = candidates[better]
+            fitness[rows[better]] = candidate_fitness[better]
+            improved[rows[better]] = True
+            radius[rows] *= np.where(better, 2.0, 0.25)
+
+        self.stats['improved'] += int(improved.sum())
+        return encode_grid_indices(indices, self.n_bits), fitness
+
+
+def make_memetic_refiner(memetic: Optional[Dict[str, Any]], function_provider, x_min: float, x_max: float,
+                         n_bits: int, is_minimizing: bool) -> Optional[MemeticRefiner]:
+    """MemeticRefiner a partir del parámetro 'memetic' de una ejecución (None = sin refinamiento)
+
+    `memetic` es un diccionario con 'interval', 'top' y 'steps' opcionales; un
+    diccionario vacío (o True) usa los valores por defecto.
+    """
+    if memetic is None or memetic is False:
+        return None
+    options = dict(memetic) if isinstance(memetic, dict) else {}
+    return MemeticRefiner(function_provider, x_min, x_max, n_bits, is_minimizing,
+                          interval=options.get('interval', DEFAULT_INTERVAL),
+                          top=options.get('top', DEFAULT_TOP),
+                          steps=options.get('steps', DEFAULT_STEPS))
+
+
+if __name__ == '__main__':
+    from manager.ga_manager import get_ga_instance
+    from algorithm.genetic_algorithm import GeneticAlgorithm
+    from utils.function_provider import CustomFunctionProvider
+    from utils.math_functions import decode_population
+
+    def evaluations_to_grid_optimum(params, target, **kwargs):
+        """Evaluaciones de f (incluidas las del refinamiento) hasta alcanzar el óptimo de la malla"""
+        ga = get_ga_instance('standard_ga')
+        for record in ga.stream(**params, **kwargs):
+            reached = record.best_fitness <= target + 1e-9 if params['is_minimizing'] \
+                else record.best_fitness >= target - 1e-9
+            if reached:
+                state = ga._state
+                refiner = state['memetic']
+                return state['evaluations'], refiner.stats['derivative_evaluations'] if refiner else 0
+        return None, None
+
+    benchmarks = [
+        ("ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)", -10, 10, False),
+        ("x**2 + 10*sin(5*x)", -10, 10, True),
+        ("sin(x)*x**2 - cos(3*x)", -20, 20, False),
+    ]
+    n_seeds = 30
+    for function_text, x_min, x_max, is_minimizing in benchmarks:
+        provider = CustomFunctionProvider(function_text)
+        params = dict(x_min=x_min, x_max=x_max, delta_x=0.0001, pop_size=30, max_generations=300,
+                      prob_crossover=0.8, prob_mutation_i=0.2, prob_mutation_g=0.05,
+                      is_minimizing=is_minimizing, function_provider=provider)
+        # Óptimo exacto de la malla de la codificación (todos sus puntos)
+        n_bits = GeneticAlgorithm.compute_n_bits(x_min, x_max, params['delta_x'])
+        grid = provider.get_raw_function_values(decode_population(
+            encode_grid_indices(np.arange(2 ** n_bits), n_bits), x_min, x_max, n_bits))
+        target = float(grid.min() if is_minimizing else grid.max())
+        print(f"f(x) = {function_text} ({'min' if is_minimizing else 'max'}, {n_bits} bits, "
+              f"óptimo de la malla {target:.8f})")
+        for label, memetic in (('estándar', None), ('memético', {})):
+            results = [evaluations_to_grid_optimum(params, target, seed=seed, memetic=memetic)
+                       for seed in range(n_seeds)]
+            reached = [r for r in results if r[0] is not None]
+            mean_evals = np.mean([r[0] for r in reached]) if reached else float('nan')
+            mean_derivs = np.mean([r[1] for r in reached]) if reached else float('nan')
+            print(f"  {label:9s} exactos {len(reached)}/{n_seeds}, evaluaciones de f medias {mean_evals:.0f}"
+                  + (f" (+ {mean_derivs:.0f} de f'/f'')" if memetic is not None else ""))
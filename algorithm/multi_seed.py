@@ -0,0 +1,199 @@
+"""
+Ejecuciones repetidas con varias semillas y su agregación estadística.
+
+run_seeds() lanza N semillas de la misma configuración en procesos paralelos;
+cada proceso solo devuelve la curva del mejor fitness por generación y los
+tiempos acumulados. aggregate_seed_curves() resume la matriz (N, generaciones)
+con NumPy: mediana y bandas de percentiles, tasa de éxito y tiempo hasta el
+objetivo. Con `on_progress` se recibe el agregado parcial cada vez que termina
+una semilla (p. ej. para dibujar bandas parciales en la UI). Los procesos se
+inician con 'spawn', como los del evaluador: la interfaz Qt no se bifurca.
+"""
+
+import os
+import time
+import random
+import warnings
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from utils.evaluation import DEFAULT_START_METHOD
+
+BAND_PERCENTILES = (10, 25, 50, 75, 90)
+# Claves de ga_results que devuelve cada semilla (las que usa el registro de ejecuciones)
+SEED_RESULT_KEYS = ('seed', 'best_x', 'best_fitness', 'improvement', 'function_text_for_report')
+TARGET_RELATIVE_TOLERANCE = 1e-3   # fracción del rango de fitness observado
+
+
+def _run_single_seed(algorithm_name: str, function_provider, params: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    """Ejecuta una semilla y devuelve su curva de mejor fitness, tiempos y resumen (nivel de módulo: serializable)"""
+    from manager.ga_manager import get_ga_instance
+
+    ga = get_ga_instance(algorithm_name)
+    best = np.empty(params['num_generations'])
+    elapsed = np.empty(params['num_generations'])
+    start = time.perf_counter()
+    count = 0
+    for record in ga.stream(
+        x_min=params['interval_a'], x_max=params['interval_b'], delta_x=params['delta_x'],
+        pop_size=params['pop_size'], max_generations=params['num_generations'],
+        prob_crossover=params['prob_crossover'], prob_mutation_i=params['prob_mutation_i'],
+        prob_mutation_g=params['prob_mutation_g'], is_minimizing=params['is_minimizing'],
+        function_provider=function_provider, seed=seed, adaptive_rates=params.get('adaptive_rates'),
+        elite_count=params.get('elite_count', 0), niching=params.get('niching'),
+        memetic=params.get('memetic')
+    ):
+        best[record.generation] = record.best_fitness
+        elapsed[record.generation] = time.perf_counter() - start
+        count = record.generation + 1
+    ga_results = ga.summary()
+    return {'seed': seed, 'best_fitness_history': best[:count], 'elapsed': elapsed[:count],
+            'ga_results': {key: ga_results.get(key) for key in SEED_RESULT_KEYS}}
+
+
+def _stack_curves(curves: Sequence[np.ndarray]) -> np.ndarray:
+    """Apila curvas en una matriz (N, G), rellenando con NaN si alguna es más corta"""
+    n_generations = max((len(c) for c in curves), default=0)
+    matrix = np.full((len(curves), n_generations), np.nan)
+    for i, curve in enumerate(curves):
+        matrix[i, :len(curve)] = curve
+    return matrix
+
+
+def aggregate_seed_curves(
+    curves,
+    is_minimizing: bool,
+    elapsed=None,
+    target: Optional[float] = None,
+    percentiles: Sequence[float] = BAND_PERCENTILES
+) -> Dict[str, Any]:
+    """
+    Resume una matriz (N, G) de curvas de mejor fitness (una fila por semilla).
+
+    Las estadísticas de éxito usan el mejor valor acumulado de cada semilla. Sin
+    `target` explícito, el objetivo es el mejor valor alcanzado por cualquier
+    semilla (con una tolerancia de TARGET_RELATIVE_TOLERANCE del rango observado).
+
+    Returns:
+        Diccionario con 'percentiles', 'bands' (P, G), 'target', 'success_rate',
+        'generations_to_target' y 'seconds_to_target' (por semilla, NaN si no
+        llegó) y sus medianas.
+    """
+    curves = np.asarray(curves, dtype=float)
+    n_seeds, n_generations = curves.shape
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # generaciones aún sin datos (todo NaN)
+        bands = np.nanpercentile(curves, percentiles, axis=0) if n_seeds else np.empty((len(percentiles), 0))
+
+    finite = np.where(np.isfinite(curves), curves, np.inf if is_minimizing else -np.inf)
+    best_so_far = (np.minimum if is_minimizing else np.maximum).accumulate(finite, axis=1)
+    finite_values = curves[np.isfinite(curves)]
+    spread = float(np.ptp(finite_values)) if finite_values.size else 0.0
+    tolerance = TARGET_RELATIVE_TOLERANCE * spread if spread > 0 else 1e-12
+    if target is None:
+        target = float(best_so_far[:, -1].min() if is_minimizing else best_so_far[:, -1].max()) if n_seeds else np.nan
+    reached = best_so_far <= target + tolerance if is_minimizing else best_so_far >= target - tolerance
+
+    success = reached.any(axis=1)
+    first_generation = np.where(success, reached.argmax(axis=1), -1)
+    generations_to_target = np.where(success, first_generation + 1, np.nan)
+    seconds_to_target = np.full(n_seeds, np.nan)
+    if elapsed is not None and n_seeds:
+        elapsed = np.asarray(elapsed, dtype=float)
+        rows = np.flatnonzero(success)
+        seconds_to_target[rows] = elapsed[rows, first_generation[rows]]
+
+    def _median(values):
+        values = values[np.isfinite(values)]
+        return float(np.median(values)) if values.size else None
+
+    return {
+        'n_seeds': int(n_seeds),
+        'n_generations': int(n_generations),
+        'percentiles': list(percentiles),
+        'bands': bands,
+        'target': float(target),
+        'target_tolerance': tolerance,
+        'success_rate': float(success.mean()) if n_seeds else 0.0,
+        'generations_to_target': generations_to_target,
+        'seconds_to_target': seconds_to_target,
+        'median_generations_to_target': _median(generations_to_target),
+        'median_seconds_to_target': _median(seconds_to_target),
+    }
+
+
+def run_seeds(
+    algorithm_name: str,
+    function_provider,
+    params: Dict[str, Any],
+    n_seeds: int,
+    base_seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    target: Optional[float] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Ejecuta `n_seeds` semillas consecutivas (base_seed, base_seed + 1, ...) en paralelo.
+
+    Args:
+        function_provider: Proveedor serializable (se envía a cada proceso).
+        params: Parámetros en el formato de execute_specific_ga.
+        on_progress: Recibe el agregado parcial (más 'seeds_done') cada vez que
+            termina una semilla.
+
+    Returns:
+        El agregado final más 'seeds', 'curves' (N, G), 'final_best' y
+        'seed_results' (ga_results resumido de SEED_RESULT_KEYS y 'duration' de
+        cada semilla), en el orden de las semillas.
+    """
+    if base_seed is None:
+        base_seed = random.SystemRandom().randrange(2**31 - n_seeds)
+    seeds = [base_seed + i for i in range(n_seeds)]
+    max_workers = min(n_seeds, max_workers or os.cpu_count() or 1)
+    is_minimizing = params['is_minimizing']
+
+    finished: Dict[int, Dict[str, Any]] = {}
+
+    def _collect(result):
+        finished[result['seed']] = result
+        if on_progress is not None:
+            done = [finished[s] for s in seeds if s in finished]
+            partial = aggregate_seed_curves(
+                _stack_curves([r['best_fitness_history'] for r in done]), is_minimizing,
+                _stack_curves([r['elapsed'] for r in done]), target
+            )
+            partial['seeds_done'] = len(done)
+            on_progress(partial)
+
+    if max_workers <= 1:
+        for seed in seeds:
+            _collect(_run_single_seed(algorithm_name, function_provider, params, seed))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context(DEFAULT_START_METHOD)) as executor:
+            futures = [executor.submit(_run_single_seed, algorithm_name, function_provider, params, seed)
+                       for seed in seeds]
+            for future in as_completed(futures):
+                _collect(future.result())
+
+    ordered: List[Dict[str, Any]] = [finished[s] for s in seeds]
+    curves = _stack_curves([r['best_fitness_history'] for r in ordered])
+    summary = aggregate_seed_curves(curves, is_minimizing, _stack_curves([r['elapsed'] for r in ordered]), target)
+    summary['seeds'] = seeds
+    summary['curves'] = curves
+    summary['final_best'] = curves[:, -1] if curves.size else np.empty(0)
+    summary['seed_results'] = [
+        {'ga_results': r['ga_results'], 'duration': float(r['elapsed'][-1]) if len(r['elapsed']) else None}
+        for r in ordered
+    ]
+    return summary
+
+
+def median_seed(summary: Dict[str, Any]) -> int:
+    """Semilla cuyo mejor fitness final es la mediana (la ejecución 'típica')"""
+    final_best = np.asarray(summary['final_best'], dtype=float)
+    order = np.argsort(final_best, kind='stable')
+    return summary['seeds'][int(order[(len(order) - 1) // 2])]
@@ -0,0 +1,142 @@
+"""
+Nichos para funciones multimodales: crowding determinista y detección de óptimos.
+
+Con niching='crowding' GeneticAlgorithm reemplaza la poda aleatoria por
+crowding determinista (Mahfoud): la población se empareja al azar sin
+reemplazo, cada pareja produce dos hijos con la cruza y mutación de siempre y
+cada hijo compite solo con el padre más cercano en x. El hijo sustituye a ese
+padre si es estrictamente mejor. Como cada individuo solo compite con su
+vecino, las subpoblaciones de picos distintos no se desplazan entre sí y la
+población se reparte entre varios óptimos.
+
+Las distancias son solo padre-hijo (O(N) por generación). Para informar los
+nichos al final, find_niches() ordena los x (O(N log N)) y corta los grupos
+donde la separación entre vecinos supera el radio de nicho, sin matriz de
+distancias por pares. GeneticAlgorithm informa a lo sumo `max_niches` nichos
+(los mejores) y cuenta aparte los que quedan fuera y los individuos aislados.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+NICHING_MODES = ('crowding',)
+DEFAULT_NICHE_RADIUS_FRACTION = 0.005   # radio de nicho por defecto: fracción de (x_max - x_min)
+DEFAULT_MAX_NICHES = 10                 # nichos informados por defecto (None = todos)
+MIN_NICHE_SIZE = 2                      # individuos mínimos para informar un nicho
+
+
+def default_niche_radius(x_min: float, x_max: float) -> float:
+    return DEFAULT_NICHE_RADIUS_FRACTION * abs(x_max - x_min)
+
+
+def crowding_replacement(parent_x, parent_fitness, child_x, child_fitness, is_minimizing: bool):
+    """
+    Torneos de crowding determinista de P parejas, vectorizados.
+
+    Los argumentos son arreglos (P, 2): columna 0 = padre/hijo 1, columna 1 =
+    padre/hijo 2. Cada hijo compite con el padre más cercano en x: si la
+    asignación cruzada (hijo 2 con padre 1) suma menos distancia, se usa esa.
+
+    Returns:
+        (swap, wins): swap (P,) indica las parejas con asignación cruzada;
+        wins (P, 2) es True si el hijo que compite con ese padre lo reemplaza
+        (estrictamente mejor; un NaN nunca gana).
+    """
+    parent_x, child_x = np.asarray(parent_x, dtype=float), np.asarray(child_x, dtype=float)
+    parent_fitness = np.asarray(parent_fitness, dtype=float)
+    child_fitness = np.asarray(child_fitness, dtype=float)
+    direct = np.abs(parent_x[:, 0] - child_x[:, 0]) + np.abs(parent_x[:, 1] - child_x[:, 1])
+    crossed = np.abs(parent_x[:, 0] - child_x[:, 1]) + np.abs(parent_x[:, 1] - child_x[:, 0])
+    swap = crossed < direct
+    rivals = np.where(swap[:, None], child_fitness[:, ::-1], child_fitness)
+    rivals = np.where(np.isnan(rivals), np.inf if is_minimizing else -np.inf, rivals)
+    wins = rivals < parent_fitness if is_minimizing else rivals > parent_fitness
+    return swap, wins
+
+
+def find_niches(
+    x_values,
+    fitness,
+    is_minimizing: bool,
+    radius: float,
+    max_niches: Optional[int] = DEFAULT_MAX_NICHES,
+    min_size: int = MIN_NICHE_SIZE
+) -> List[Dict[str, Any]]:
+    """
+    Agrupa la población en nichos y devuelve el mejor individuo de cada uno.
+
+    Los x se ordenan y se corta un grupo nuevo donde dos vecinos consecutivos
+    están a más de `radius`. Se descartan los grupos con menos de `min_size`
+    individuos (mutantes aislados).
+
+    Returns:
+        Lista (mejor nicho primero, a lo sumo `max_niches`; None = sin límite)
+        de diccionarios con 'x', 'fitness', 'size' y el rango 'x_low'/'x_high'
+        del grupo.
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    fitness = np.asarray(fitness, dtype=float)
+    valid = np.isfinite(x_values) & np.isfinite(fitness)
+    x_values, fitness = x_values[valid], fitness[valid]
+    if x_values.size == 0:
+        return []
+
+    order = np.argsort(x_values, kind='stable')
+    x_sorted, f_sorted = x_values[order], fitness[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(x_sorted) > radius) + 1]
+    sizes = np.diff(np.r_[starts, x_sorted.size])
+    # Mejor de cada grupo con reduceat (mínimo o máximo por segmento)
+    best_values = (np.minimum if is_minimizing else np.maximum).reduceat(f_sorted, starts)
+
+    niches = []
+    for start, size, best in zip(starts, sizes, best_values):
+        if size < min_size:
+            continue
+        segment = slice(start, start + size)
+        best_index = start + int(np.flatnonzero(f_sorted[segment] == best)[0])
+        niches.append({
+            'x': float(x_sorted[best_index]),
+            'fitness': float(best),
+            'size': int(size),
+            'x_low': float(x_sorted[start]),
+            'x_high': float(x_sorted[start + size - 1]),
+        })
+    niches.sort(key=lambda niche: niche['fitness'], reverse=not is_minimizing)
+    return niches if max_niches is None else niches[:max_niches]
+
+
+if __name__ == '__main__':
+    from manager.ga_manager import get_ga_instance
+    from utils.function_provider import CustomFunctionProvider
+    from utils.math_functions import decode_population
+
+    function_text = "ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)"
+    provider = CustomFunctionProvider(function_text)
+    params = dict(x_min=-10, x_max=10, delta_x=0.001, pop_size=100, max_generations=100,
+                  prob_crossover=0.8, prob_mutation_i=0.2, prob_mutation_g=0.05,
+                  is_minimizing=False, function_provider=provider)
+
+    # Máximos locales de referencia sobre una malla fina
+    grid_x = np.linspace(params['x_min'], params['x_max'], 400_001)
+    grid_y = provider.get_raw_function_values(grid_x)
+    peaks = np.flatnonzero((grid_y[1:-1] > grid_y[:-2]) & (grid_y[1:-1] > grid_y[2:])) + 1
+    peak_x, peak_y = grid_x[peaks], grid_y[peaks]
+    highest = np.argsort(-peak_y)[:10]
+
+    print(f"f(x) = {function_text} (maximizando, {len(peaks)} máximos locales)")
+    for mode in (None, 'crowding'):
+        located, located_top = [], []
+        for seed in range(10):
+            ga_results = get_ga_instance('standard_ga').run(
+                seed=seed, niching=mode, history_mode='stats', **params)['ga_results']
+            x_final = decode_population(ga_results['final_population'], params['x_min'], params['x_max'],
+                                        ga_results['n_bits'])
+            fitness = np.asarray(ga_results['final_fitness'])
+            # Un pico está localizado si algún individuo está a < 5 delta_x y a < 0.01 de su valor
+            hits = np.array([np.any((np.abs(x_final - x) < 0.005) & (fitness >= y - 0.01))
+                             for x, y in zip(peak_x, peak_y)])
+            located.append(hits.sum())
+            located_top.append(hits[highest].sum())
+        print(f"  {mode or 'estándar':10s} picos localizados por ejecución: {np.mean(located):.1f} "
+              f"(de los 10 más altos: {np.mean(located_top):.1f})")
@@ -0,0 +1,59 @@
+"""
+Estadísticas de una generación calculadas dentro del bucle del AG.
+
+Todo se calcula con NumPy sobre los arreglos de la generación (bits uint8
+(N, n_bits) y fitness real (N,)), de modo que la UI y los reportes no necesitan
+recorrer de nuevo el historial completo de fitness.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+# Nombres de las estadísticas por generación (claves de ga_results['generation_stats'])
+GENERATION_STAT_NAMES = (
+    'mean_fitness', 'std_fitness', 'median_fitness', 'worst_fitness', 'unique_genomes', 'hamming_diversity'
+)
+
+
+def population_diversity(population) -> float:
+    """Distancia de Hamming media entre pares de individuos, normalizada por n_bits
+
+    No hace falta comparar los N² pares: si c_j individuos tienen un 1 en el bit j,
+    ese bit aporta c_j * (N - c_j) pares distintos.
+    """
+    bits = np.asarray(population, dtype=np.uint8)
+    if bits.ndim != 2 or bits.shape[0] < 2 or bits.shape[1] == 0:
+        return 0.0
+    n_individuals, n_bits = bits.shape
+    ones = bits.sum(axis=0, dtype=np.int64)
+    return float((ones * (n_individuals - ones)).sum() * 2 / (n_individuals * (n_individuals - 1) * n_bits))
+
+
+def unique_genome_count(population) -> int:
+    """Número de genomas distintos (cada individuo empaquetado en bytes y comparado como un bloque)"""
+    bits = np.asarray(population, dtype=np.uint8)
+    if bits.ndim != 2 or bits.shape[0] == 0:
+        return 0
+    if bits.shape[1] == 0:
+        return 1
+    packed = np.packbits(bits, axis=1)
+    return int(np.unique(packed.view(np.dtype((np.void, packed.shape[1]))).ravel()).size)
+
+
+def generation_statistics(bits: np.ndarray, fitness: np.ndarray, is_minimizing: bool) -> Dict[str, float]:
+    """Estadísticas de GENERATION_STAT_NAMES para una generación evaluada"""
+    if fitness.size:
+        mean, std = float(fitness.mean()), float(fitness.std())
+        median = float(np.median(fitness))
+        worst = float(fitness.max() if is_minimizing else fitness.min())
+    else:
+        mean = std = median = worst = np.nan
+    return {
+        'mean_fitness': mean,
+        'std_fitness': std,
+        'median_fitness': median,
+        'worst_fitness': worst,
+        'unique_genomes': unique_genome_count(bits),
+        'hamming_diversity': population_diversity(bits),
+    }
@@ -0,0 +1,247 @@
+"""
+Ajuste automático de parámetros por reducción sucesiva (successive halving).
+
+Se muestrean `n_configs` configuraciones (tamaño de población, probabilidad de
+cruza, PMI y PMG) y se evalúan con pocas generaciones; solo la mejor fracción
+1/eta pasa a la siguiente ronda, que dispone de más generaciones por
+configuración. El presupuesto total se expresa en evaluaciones de la función
+objetivo: cada ronda recibe una parte igual de lo que queda sin gastar. Las
+generaciones de una ronda se calculan con el costo real de una ejecución: la
+población inicial más pop_size - élites evaluaciones por generación, corregido
+por el sobrecosto medido en la ronda anterior (p. ej. las evaluaciones del
+refinamiento memético, que se cuentan con ga_results['evaluations']).
+
+Las configuraciones de una ronda se ejecutan a la vez con el motor por lotes
+(algorithm/batched_ga.py): una ejecución vectorizada por cada tamaño de
+población, con `repeats` repeticiones por configuración para reducir el ruido.
+
+Si base_params activa opciones que el motor por lotes no implementa (élites,
+nichos, refinamiento memético o tasas adaptativas), cada configuración se
+evalúa con GeneticAlgorithm y esas mismas opciones, una ejecución por
+repetición: el ajuste se hace para el algoritmo que luego se ejecuta. Con tasas
+adaptativas las probabilidades no se ajustan (son los máximos de sus límites y
+las gobierna el controlador); solo se busca el tamaño de población.
+
+El resultado incluye los parámetros ganadores en el mismo formato de diccionario
+que acepta execute_specific_ga. Con `registry` cada ejecución del barrido se
+anota en el registro de ejecuciones, una transacción por ronda (record_runs).
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from algorithm.adaptive_rates import RATE_NAMES
+from algorithm.batched_ga import BatchedGeneticAlgorithm
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from utils.math_functions import get_function_provider
+
+# Espacio de búsqueda: lista = opciones discretas, tupla (mín, máx) = rango uniforme.
+# Las probabilidades se redondean a la precisión de los controles del panel.
+DEFAULT_SEARCH_SPACE = {
+    'pop_size': [10, 20, 40, 80, 160],
+    'prob_crossover': (0.5, 1.0),
+    'prob_mutation_i': (0.05, 1.0),
+    'prob_mutation_g': (0.01, 0.5),
+}
+PROBABILITY_DECIMALS = 2
+DEFAULT_N_CONFIGS = 27
+DEFAULT_ETA = 3
+# Opciones de execute_specific_ga que solo implementa GeneticAlgorithm
+SEQUENTIAL_OPTIONS = ('elite_count', 'niching', 'memetic', 'adaptive_rates')
+# Parámetros del panel que no describen una ejecución del barrido
+_NON_RUN_PARAMS = ('seed', 'num_seeds')
+
+
+def _sample_configurations(search_space: Dict[str, Any], n_configs: int, rng) -> List[Dict[str, Any]]:
+    configs = [{} for _ in range(n_configs)]
+    for name, domain in search_space.items():
+        if isinstance(domain, list):
+            values = [domain[i] for i in rng.integers(0, len(domain), n_configs)]
+        else:
+            low, high = domain
+            values = np.round(rng.uniform(low, high, n_configs), PROBABILITY_DECIMALS).tolist()
+        for config, value in zip(configs, values):
+            config[name] = value
+    return configs
+
+
+def _run_sequential(base_params: Dict[str, Any], pop_size: int, rates: Dict[str, np.ndarray],
+                    generations: int, function_provider, rng):
+    """Una ejecución de GeneticAlgorithm por fila de `rates`, con las opciones de base_params
+
+    Returns:
+        (mejor fitness final de cada ejecución, evaluaciones usadas,
+        lista de (ga_results, segundos) de cada ejecución)
+    """
+    ga = GeneticAlgorithm()
+    elite_count = min(int(base_params.get('elite_count') or 0), max(0, pop_size - 1))
+    n_runs = len(rates['prob_crossover'])
+    best = np.empty(n_runs)
+    evaluations = 0
+    runs = []
+    for i in range(n_runs):
+        start = time.perf_counter()
+        ga_results = ga.run(
+            x_min=base_params['interval_a'], x_max=base_params['interval_b'], delta_x=base_params['delta_x'],
+            pop_size=pop_size, max_generations=generations, prob_crossover=float(rates['prob_crossover'][i]),
+            prob_mutation_i=float(rates['prob_mutation_i'][i]), prob_mutation_g=float(rates['prob_mutation_g'][i]),
+            is_minimizing=base_params['is_minimizing'], function_provider=function_provider,
+            seed=int(rng.integers(2**31)), history_mode='stats', adaptive_rates=base_params.get('adaptive_rates'),
+            elite_count=elite_count, niching=base_params.get('niching'), memetic=base_params.get('memetic')
+        )['ga_results']
+        runs.append((ga_results, time.perf_counter() - start))
+        best[i] = ga_results['best_fitness']
+        evaluations += ga_results.get('evaluations', pop_size * (generations + 1))
+    return best, evaluations, runs
+
+
+def rung_sizes(n_configs: int, eta: int) -> List[int]:
+    """Configuraciones por ronda: n, n/eta, n/eta², ..., 1"""
+    sizes = [n_configs]
+    while sizes[-1] > 1:
+        sizes.append(max(1, sizes[-1] // eta))
+    return sizes
+
+
+def successive_halving(
+    base_params: Dict[str, Any],
+    evaluation_budget: int,
+    function_provider=None,
+    search_space: Optional[Dict[str, Any]] = None,
+    n_configs: int = DEFAULT_N_CONFIGS,
+    eta: int = DEFAULT_ETA,
+    repeats: int = 3,
+    seed: Optional[int] = None,
+    on_rung: Optional[Callable[[Dict[str, Any]], None]] = None,
+    registry=None
+) -> Dict[str, Any]:
+    """
+    Busca pop_size, prob_crossover, PMI y PMG para la función y el intervalo de `base_params`.
+
+    Args:
+        base_params: Parámetros en el formato de execute_specific_ga; fijan el
+            intervalo, delta_x, el modo, el máximo de generaciones por ejecución
+            y las opciones del AG (SEQUENTIAL_OPTIONS) con que se evalúa cada
+            configuración.
+        evaluation_budget: Número total de evaluaciones de la función objetivo.
+        search_space: Dominios a explorar (ver DEFAULT_SEARCH_SPACE); con tasas
+            adaptativas se excluyen las probabilidades.
+        n_configs, eta: Configuraciones iniciales y factor de reducción por ronda.
+        repeats: Ejecuciones (semillas) por configuración; la puntuación es la media.
+        on_rung: Recibe el resumen de cada ronda al terminarla.
+        registry: RunRegistry donde se anotan todas las ejecuciones (algoritmo
+            'batched_ga' o 'standard_ga', con 'tuning_rung' en sus parámetros).
+
+    Returns:
+        Diccionario con 'params' (base_params con los valores ganadores), 'score'
+        (mejor fitness real medio del ganador), 'rungs' (detalle por ronda),
+        'evaluations' (evaluaciones usadas) y 'budget'.
+
+    Raises:
+        ValueError: Si el presupuesto no alcanza para una generación por configuración.
+    """
+    search_space = search_space or DEFAULT_SEARCH_SPACE
+    if base_params.get('adaptive_rates'):
+        # Las probabilidades del panel son los máximos de los límites adaptativos
+        search_space = {name: domain for name, domain in search_space.items() if name not in RATE_NAMES}
+    sequential = any(base_params.get(name) for name in SEQUENTIAL_OPTIONS)
+    function_provider = function_provider or get_function_provider().copy()
+    is_minimizing = base_params['is_minimizing']
+    max_generations = int(base_params['num_generations'])
+    rng = np.random.default_rng(seed)
+    engine = BatchedGeneticAlgorithm()
+
+    configs = _sample_configurations(search_space, n_configs, rng)
+    sizes = rung_sizes(n_configs, eta)
+    elite_count = int(base_params.get('elite_count') or 0)
+    overhead = 1.0   # evaluaciones medidas / previstas en la ronda anterior
+    evaluations = 0
+    rungs = []
+    run_params = {k: v for k, v in base_params.items() if k not in _NON_RUN_PARAMS}
+
+    for rung_index, _ in enumerate(sizes):
+        pop_sizes = [int(c.get('pop_size', base_params['pop_size'])) for c in configs]
+        rung_budget = (evaluation_budget - evaluations) / (len(sizes) - rung_index)
+        # Costo de la ronda = initial + generations * per_generation: cada ejecución
+        # evalúa su población inicial y luego pop_size - élites individuos por generación
+        initial = repeats * sum(pop_sizes)
+        new_per_generation = repeats * sum(p - min(elite_count, max(0, p - 1)) for p in pop_sizes)
+        generations = min(max_generations, int((rung_budget - initial) // (new_per_generation * overhead)))
+        if generations < 1:
+            if rung_index == 0:
+                minimum = int(np.ceil((initial + new_per_generation * overhead) * len(sizes)))
+                raise ValueError(f"Presupuesto insuficiente: se necesitan al menos {minimum} evaluaciones "
+                                 f"para {n_configs} configuraciones.")
+            generations = 1
+        rung_start = evaluations
+
+        scores = np.empty(len(configs))
+        entries = []   # (algoritmo, parámetros, ga_results, duración, archivo) para el registro
+
+        def _entry_params(pop_size, rates, i, **extra):
+            return dict(run_params, pop_size=pop_size, num_generations=generations, tuning_rung=rung_index,
+                        **{name: float(rates[name][i]) for name in RATE_NAMES}, **extra)
+
+        for pop_size in sorted(set(pop_sizes)):
+            members = [i for i, p in enumerate(pop_sizes) if p == pop_size]
+            rates = {name: np.repeat([configs[i].get(name, base_params[name]) for i in members], repeats)
+                     for name in RATE_NAMES}
+            if sequential:
+                best, used, runs = _run_sequential(base_params, pop_size, rates, generations,
+                                                   function_provider, rng)
+                scores[members] = best.reshape(len(members), repeats).mean(axis=1)
+                evaluations += used
+                entries.extend(('standard_ga', _entry_params(pop_size, rates, i), ga_results, seconds, None)
+                               for i, (ga_results, seconds) in enumerate(runs))
+                continue
+            start = time.perf_counter()
+            batch = engine.run_batch(
+                x_min=base_params['interval_a'], x_max=base_params['interval_b'],
+                delta_x=base_params['delta_x'], pop_size=pop_size, max_generations=generations,
+                prob_crossover=rates['prob_crossover'], prob_mutation_i=rates['prob_mutation_i'],
+                prob_mutation_g=rates['prob_mutation_g'], is_minimizing=is_minimizing,
+                function_provider=function_provider, seed=int(rng.integers(2**31)), keep_history=False
+            )
+            seconds = (time.perf_counter() - start) / len(batch)
+            best = np.array([r['ga_results']['best_fitness'] for r in batch]).reshape(len(members), repeats)
+            scores[members] = best.mean(axis=1)
+            evaluations += len(batch) * pop_size * (generations + 1)
+            entries.extend(('batched_ga', _entry_params(pop_size, rates, i, batch_seed=r['ga_results']['batch_seed'],
+                                                         batch_index=i), r['ga_results'], seconds, None)
+                           for i, r in enumerate(batch))
+
+        if registry is not None:
+            try:
+                registry.record_runs(entries)
+            except Exception as e:
+                # El registro es auxiliar: un fallo no interrumpe el ajuste
+                print(f"Advertencia: no se pudieron registrar las ejecuciones del ajuste: {e}")
+
+        overhead = (evaluations - rung_start) / (initial + generations * new_per_generation)
+
+        # Mejores primero (orden estable: a igual puntuación, la configuración anterior)
+        order = np.argsort(scores if is_minimizing else -scores, kind='stable')
+        rung = {
+            'rung': rung_index,
+            'generations': generations,
+            'configs': [configs[i] for i in order],
+            'scores': scores[order].tolist(),
+            'evaluations': evaluations,
+        }
+        rungs.append(rung)
+        if on_rung is not None:
+            on_rung(rung)
+
+        if rung_index + 1 < len(sizes):
+            configs = [configs[i] for i in order[:sizes[rung_index + 1]]]
+
+    winner = rungs[-1]['configs'][0]
+    return {
+        'params': dict(base_params, **winner),
+        'score': rungs[-1]['scores'][0],
+        'rungs': rungs,
+        'evaluations': evaluations,
+        'budget': evaluation_budget,
+    }
@@ -5,17 +5,46 @@ Aplicación para visualizar el funcionamiento de algoritmos genéticos
 en la resolución de problemas de optimización de funciones.
 """
 
+import os
 import sys
+import time
 from PySide6.QtWidgets import QApplication, QMessageBox
 from ui.main_window import MainWindow  # Debes crear esta versión Qt de tu ventana principal
 
 from manager.ga_manager import get_ga_instance, get_available_ga_names
+from utils.math_functions import get_function_provider
+from utils.evaluation import create_evaluator
+from utils.run_registry import get_run_registry
+from utils.result_cache import get_result_cache, result_cache_key
+from algorithm.multi_seed import run_seeds, median_seed
+from algorithm.history import replay_records
+from algorithm.niching import DEFAULT_MAX_NICHES
 
 SELECTED_GA_NAME = "standard_ga"  # O "standard_ga" para probar el otro
 
-def execute_specific_ga(params: dict, root_qt_window=None, algorithm_name: str = SELECTED_GA_NAME):
+def _register_run(results: dict, algorithm_name: str, params: dict, duration_seconds, archive_path):
+    """Anota la ejecución en el registro y deja su id en results['registry_id']"""
+    try:
+        results['registry_id'] = get_run_registry().record_run(
+            algorithm_name, params, results['ga_results'], duration_seconds, archive_path
+        )
+    except Exception as e:
+        # El registro es auxiliar: un fallo no invalida la ejecución
+        print(f"Advertencia: no se pudo registrar la ejecución: {e}")
+
+
+def execute_specific_ga(params: dict, root_qt_window=None, algorithm_name: str = SELECTED_GA_NAME,
+                        generation_callback=None):
     """
     Ejecuta un AG específico y devuelve los resultados en el formato esperado por MainWindow.
+
+    `generation_callback(record)` recibe el registro de cada generación durante la ejecución.
+    Cada ejecución completada se anota en el registro de ejecuciones (utils/run_registry.py);
+    su id queda en results['registry_id']. Las ejecuciones con semilla (params['seed'])
+    se guardan en la caché de resultados y, si se repiten, se devuelven desde ella
+    (results['cache_hit'] = True) sin volver a ejecutar el AG: el acierto también
+    se registra (apuntando al archivo de la caché) y sus generaciones se
+    reproducen en `generation_callback`.
     """
     print(f"Solicitando ejecución del AG: '{algorithm_name}'")
     print("Recibidos parámetros para el AG:", params)
@@ -27,7 +56,40 @@ def execute_specific_ga(params: dict, root_qt_window=None, algorithm_name: str =
         print(f"Error cargando el AG: {e}")
         return None
 
+    # Proveedor propio de esta ejecución y backend de evaluación. 'auto' mide el
+    # costo de la función: las baratas se evalúan en este proceso y las costosas
+    # en un pool cuyos trabajadores arrancan con 'spawn' (la interfaz Qt no se
+    # bifurca). params['evaluation_backend'] permite forzar 'serial' o 'process'.
+    function_provider = get_function_provider().copy()
+    default_backend = 'auto'
+    seed = params.get('seed')
+    evaluator = None
+    start_time = time.perf_counter()
     try:
+        # Solo las expresiones son deterministas: un simulador externo podría no serlo
+        cache, cache_key = None, None
+        if seed is not None and hasattr(function_provider, 'set_function'):
+            try:
+                cache = get_result_cache()
+                cache_key = result_cache_key(algorithm_name, function_provider.function_text, params, seed,
+                                             getattr(function_provider, 'backend', None))
+                cached = cache.get(cache_key)
+            except Exception as e:
+                print(f"Advertencia: caché de resultados no disponible: {e}")
+                cache, cached = None, None
+            if cached is not None:
+                print(f"Resultado reutilizado desde la caché "
+                      f"(tasa de aciertos: {cache.stats()['hit_rate']:.0%})")
+                cached['cache_hit'] = True
+                if generation_callback is not None:
+                    for record in replay_records(cached):
+                        generation_callback(record)
+                _register_run(cached, algorithm_name, params, time.perf_counter() - start_time,
+                              cached.get('cache_path'))
+                return cached
+
+        evaluator = create_evaluator(function_provider, params.get('evaluation_backend', default_backend))
+        start_time = time.perf_counter()
         results = ga_instance.run(
             x_min=params['interval_a'],
             x_max=params['interval_b'],
@@ -38,8 +100,27 @@ def execute_specific_ga(params: dict, root_qt_window=None, algorithm_name: str =
             prob_mutation_i=params['prob_mutation_i'],
             prob_mutation_g=params['prob_mutation_g'],
             is_minimizing=params['is_minimizing'],
-            progress_root_window=root_qt_window  # Qt parent para diálogos de progreso
+            progress_root_window=root_qt_window,  # Qt parent para diálogos de progreso
+            function_provider=function_provider,
+            evaluator=evaluator,
+            seed=seed,
+            generation_callback=generation_callback,
+            adaptive_rates=params.get('adaptive_rates'),
+            history_mode=params.get('history_mode', 'full'),
+            history_param=params.get('history_param'),
+            elite_count=params.get('elite_count', 0),
+            niching=params.get('niching'),
+            max_niches=params.get('max_niches', DEFAULT_MAX_NICHES),
+            memetic=params.get('memetic')
         )
+        duration_seconds = time.perf_counter() - start_time
+        archive_path = None
+        if cache is not None:
+            try:
+                archive_path = cache.put(cache_key, results)
+            except Exception as e:
+                print(f"Advertencia: no se pudo guardar en la caché de resultados: {e}")
+        _register_run(results, algorithm_name, params, duration_seconds, archive_path)
         return results
     except Exception as e:
         QMessageBox.critical(root_qt_window, "Error en AG", f"Falló la ejecución del AG '{algorithm_name}': {e}")
@@ -47,6 +128,61 @@ def execute_specific_ga(params: dict, root_qt_window=None, algorithm_name: str =
         import traceback
         traceback.print_exc()
         return None
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+        if hasattr(function_provider, 'close'):
+            function_provider.close()
+
+MULTI_SEED_SUMMARY_KEYS = (
+    'n_seeds', 'seeds', 'percentiles', 'bands', 'target', 'target_tolerance', 'success_rate',
+    'median_generations_to_target', 'median_seconds_to_target', 'final_best'
+)
+
+
+def execute_multi_seed_ga(params: dict, root_qt_window=None, algorithm_name: str = SELECTED_GA_NAME,
+                          seeds_callback=None):
+    """
+    Ejecuta params['num_seeds'] semillas de la misma configuración en procesos paralelos.
+
+    Devuelve los resultados completos de la semilla mediana (ejecutada con historial,
+    por la vía normal de caché y registro) con el resumen estadístico de todas las
+    semillas en ga_results['multi_seed']. El resto de las semillas se anota en el
+    registro de ejecuciones en una sola transacción. `seeds_callback(parcial)` recibe el agregado
+    parcial cada vez que termina una semilla.
+    """
+    single_params = {k: v for k, v in params.items() if k != 'num_seeds'}
+    function_provider = get_function_provider().copy()
+    try:
+        summary = run_seeds(algorithm_name, function_provider, single_params, int(params['num_seeds']),
+                            base_seed=params.get('seed'), on_progress=seeds_callback)
+    except Exception as e:
+        QMessageBox.critical(root_qt_window, "Error en AG", f"Falló la ejecución con varias semillas: {e}")
+        print(f"Error ejecutando varias semillas del AG '{algorithm_name}': {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+    finally:
+        if hasattr(function_provider, 'close'):
+            function_provider.close()
+
+    typical_seed = median_seed(summary)
+    # Las demás semillas se registran juntas (una transacción); la mediana se
+    # registra al ejecutarse de nuevo con historial
+    try:
+        get_run_registry().record_runs(
+            (algorithm_name, dict(single_params, seed=seed), seed_result['ga_results'], seed_result['duration'], None)
+            for seed, seed_result in zip(summary['seeds'], summary['seed_results']) if seed != typical_seed
+        )
+    except Exception as e:
+        print(f"Advertencia: no se pudieron registrar las semillas: {e}")
+
+    results = execute_specific_ga(dict(single_params, seed=typical_seed), root_qt_window, algorithm_name)
+    if results is None:
+        return None
+    results['ga_results']['multi_seed'] = {key: summary[key] for key in MULTI_SEED_SUMMARY_KEYS}
+    return results
+
 
 def main():
     app = QApplication(sys.argv)
@@ -68,9 +204,25 @@ def main():
     else:
         actual_ga_to_use = SELECTED_GA_NAME
 
-    main_window = MainWindow()  # Debe ser tu ventana principal basada en PySide6
+    # Objetivo externo opcional: GA_EXTERNAL_OBJECTIVE="python mi_simulador.py"
+    # (ver utils/external_provider.py para el protocolo)
+    external_command = os.environ.get("GA_EXTERNAL_OBJECTIVE")
+    function_provider = None
+    if external_command:
+        from utils.external_provider import ExternalFunctionProvider
+        function_provider = ExternalFunctionProvider(
+            external_command,
+            pool_size=int(os.environ.get("GA_EXTERNAL_POOL_SIZE", "1")),
+            timeout=float(os.environ.get("GA_EXTERNAL_TIMEOUT", "30"))
+        )
+        print(f"Usando función objetivo externa: {function_provider.function_text}")
+
+    main_window = MainWindow(function_provider)  # Debe ser tu ventana principal basada en PySide6
 
-    configured_ga_executor = lambda p, r: execute_specific_ga(p, r, algorithm_name=actual_ga_to_use)
+    def configured_ga_executor(p, r, generation_callback=None, seeds_callback=None):
+        if int(p.get('num_seeds', 1) or 1) > 1:
+            return execute_multi_seed_ga(p, r, algorithm_name=actual_ga_to_use, seeds_callback=seeds_callback)
+        return execute_specific_ga(p, r, algorithm_name=actual_ga_to_use, generation_callback=generation_callback)
     main_window.set_ga_executor(configured_ga_executor)
 
     main_window.show()
@@ -0,0 +1,72 @@
+"""Interfaz ask/tell: con semilla reproduce exactamente a run() y a stream()"""
+
+import numpy as np
+import pytest
+
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from utils.function_provider import CustomFunctionProvider
+
+FUNCTION_TEXT = "ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)"
+PARAMS = dict(x_min=-10, x_max=10, delta_x=0.01, pop_size=30, max_generations=15,
+              prob_crossover=0.8, prob_mutation_i=0.3, prob_mutation_g=0.1, is_minimizing=False)
+
+
+@pytest.fixture
+def provider():
+    return CustomFunctionProvider(FUNCTION_TEXT)
+
+
+def _ask_tell(provider, seed):
+    ga = GeneticAlgorithm()
+    ga.setup(**PARAMS, function_provider=provider, seed=seed)
+    while not ga.is_done:
+        ga.tell(provider.get_raw_function_values(ga.ask()))
+    return ga.result()
+
+
+def test_ask_tell_matches_run(provider):
+    expected = GeneticAlgorithm().run(**PARAMS, function_provider=provider, seed=7)
+    result = _ask_tell(provider, seed=7)
+
+    assert result['best_fitness_history'] == expected['best_fitness_history']
+    assert result['population_history'] == expected['population_history']
+    assert result['fitness_history'] == expected['fitness_history']
+    for key in ('best_individual', 'best_x', 'best_fitness', 'improvement', 'final_population', 'final_fitness'):
+        assert result['ga_results'][key] == expected['ga_results'][key]
+    for name, values in expected['ga_results']['generation_stats'].items():
+        np.testing.assert_array_equal(result['ga_results']['generation_stats'][name], values)
+
+
+def test_stream_is_deterministic_with_seed(provider):
+    def best_curve(seed):
+        ga = GeneticAlgorithm()
+        curve = [record.best_fitness for record in ga.stream(**PARAMS, function_provider=provider, seed=seed)]
+        return curve, ga.summary()['best_x']
+
+    assert best_curve(3) == best_curve(3)
+    assert best_curve(3) != best_curve(4)
+
+
+def test_batches_cover_every_generation_and_the_final_population(provider):
+    ga = GeneticAlgorithm()
+    ga.setup(**PARAMS, function_provider=provider, seed=1, keep_history=False)
+    batches = 0
+    while not ga.is_done:
+        x_values = ga.ask()
+        assert len(x_values) == PARAMS['pop_size']
+        record = ga.tell(provider.get_raw_function_values(x_values))
+        assert (record is None) == ga.is_done
+        batches += 1
+    assert batches == PARAMS['max_generations'] + 1
+
+
+def test_tell_requires_a_pending_batch(provider):
+    ga = GeneticAlgorithm()
+    with pytest.raises(RuntimeError):
+        ga.ask()
+    ga.setup(**PARAMS, function_provider=provider, seed=0)
+    with pytest.raises(RuntimeError):
+        ga.tell([0.0] * PARAMS['pop_size'])
+    ga.ask()
+    with pytest.raises(ValueError):
+        ga.tell([0.0] * (PARAMS['pop_size'] - 1))
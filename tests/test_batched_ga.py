@@ -0,0 +1,85 @@
+"""Motor por lotes: mismos resultados (formato y calidad) que GeneticAlgorithm"""
+
+import numpy as np
+import pytest
+
+from algorithm.batched_ga import BatchedGeneticAlgorithm
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from utils.function_provider import CustomFunctionProvider
+from utils.math_functions import decode_population
+
+FUNCTION_TEXT = "-(x-1)**2"
+PARAMS = dict(x_min=-4, x_max=4, delta_x=0.01, pop_size=30, max_generations=25,
+              prob_crossover=0.8, prob_mutation_i=0.3, prob_mutation_g=0.1, is_minimizing=False)
+
+
+@pytest.fixture
+def provider():
+    return CustomFunctionProvider(FUNCTION_TEXT)
+
+
+def _standard_summary(provider, seed):
+    ga = GeneticAlgorithm()
+    for _ in ga.stream(**PARAMS, function_provider=provider, seed=seed):
+        pass
+    return ga.summary()
+
+
+def test_results_have_the_standard_format(provider):
+    batch = BatchedGeneticAlgorithm().run_batch(**PARAMS, n_runs=3, function_provider=provider, seed=0)
+    expected_keys = set(_standard_summary(provider, seed=0)) | {'batch_seed', 'batch_index'}
+
+    assert len(batch) == 3
+    for index, result in enumerate(batch):
+        ga_results = result['ga_results']
+        assert set(ga_results) == expected_keys
+        assert (ga_results['batch_seed'], ga_results['batch_index'], ga_results['seed']) == (0, index, None)
+        assert result['population_history'].shape == (PARAMS['max_generations'], PARAMS['pop_size'],
+                                                      ga_results['n_bits'])
+        assert result['fitness_history'].shape == (PARAMS['max_generations'], PARAMS['pop_size'])
+        # El mejor individuo, su x y su fitness son coherentes entre sí
+        best_x = decode_population(np.array([ga_results['best_individual']]), PARAMS['x_min'],
+                                   PARAMS['x_max'], ga_results['n_bits'])[0]
+        assert ga_results['best_x'] == pytest.approx(best_x)
+        assert ga_results['best_fitness'] == pytest.approx(provider.get_raw_function_value(best_x))
+        assert ga_results['best_fitness'] == max(ga_results['final_fitness'])
+        np.testing.assert_array_equal(result['best_fitness_history'], result['fitness_history'].max(axis=1))
+
+
+def test_encoding_matches_the_standard_engine(provider):
+    standard = _standard_summary(provider, seed=1)
+    ga_results = BatchedGeneticAlgorithm().run_batch(**PARAMS, function_provider=provider, seed=1)[0]['ga_results']
+    assert ga_results['n_bits'] == standard['n_bits']
+    assert ga_results['improvement'] >= 0
+
+
+def test_batch_quality_matches_independent_runs(provider):
+    n_runs = 24
+    batch = BatchedGeneticAlgorithm().run_batch(**PARAMS, n_runs=n_runs, function_provider=provider,
+                                                seed=2, keep_history=False)
+    batched_best = np.array([r['ga_results']['best_fitness'] for r in batch])
+    standard_best = np.array([_standard_summary(provider, seed)['best_fitness'] for seed in range(n_runs)])
+    # Mismos operadores, distinto flujo aleatorio: ambos llegan cerca del máximo f(1) = 0
+    # (f va de -25 a 0 en el intervalo)
+    assert np.median(batched_best) == pytest.approx(0.0, abs=1e-2)
+    assert np.median(standard_best) == pytest.approx(0.0, abs=1e-2)
+    assert np.median(batched_best) == pytest.approx(np.median(standard_best), abs=1e-2)
+
+
+def test_per_run_rates_and_seed_reproducibility(provider):
+    rates = [0.0, 0.1, 0.5]
+    params = dict(PARAMS, prob_mutation_g=rates)
+    first = BatchedGeneticAlgorithm().run_batch(**params, function_provider=provider, seed=7, keep_history=False)
+    second = BatchedGeneticAlgorithm().run_batch(**params, function_provider=provider, seed=7, keep_history=False)
+
+    assert [r['ga_results']['prob_mutation_g'] for r in first] == rates
+    for a, b in zip(first, second):
+        assert a['ga_results']['final_population'] == b['ga_results']['final_population']
+        np.testing.assert_array_equal(a['best_fitness_history'], b['best_fitness_history'])
+    assert first[0]['population_history'] == []
+
+
+def test_rates_with_the_wrong_length_raise(provider):
+    with pytest.raises(ValueError):
+        BatchedGeneticAlgorithm().run_batch(**dict(PARAMS, prob_crossover=[0.5, 0.6], prob_mutation_g=[0.1] * 3),
+                                            function_provider=provider)
@@ -0,0 +1,63 @@
+"""Elitismo k: los k mejores pasan intactos y no se vuelven a evaluar"""
+
+import numpy as np
+import pytest
+
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from utils.function_provider import CustomFunctionProvider
+
+PARAMS = dict(x_min=-10, x_max=10, delta_x=0.01, pop_size=20, max_generations=12,
+              prob_crossover=0.8, prob_mutation_i=0.5, prob_mutation_g=0.2)
+ELITE_COUNT = 4
+
+
+@pytest.fixture
+def provider():
+    return CustomFunctionProvider("ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)")
+
+
+@pytest.mark.parametrize('is_minimizing', [False, True])
+def test_elites_are_the_top_k_and_are_not_reevaluated(provider, is_minimizing):
+    ga = GeneticAlgorithm()
+    ga.setup(**PARAMS, is_minimizing=is_minimizing, function_provider=provider, seed=3, elite_count=ELITE_COUNT)
+    while True:
+        fitness = list(provider.get_raw_function_values(ga.ask()))
+        previous = ga._state['known_fitness'] + fitness
+        population = list(ga._state['population'])
+        ga.tell(fitness)
+        if ga.is_done:
+            break
+        ranked = sorted(previous, reverse=not is_minimizing)
+        assert ga._state['known_fitness'] == ranked[:ELITE_COUNT]
+        for elite, known in zip(ga._state['population'][:ELITE_COUNT], ga._state['known_fitness']):
+            assert known == previous[population.index(elite)]
+        # El siguiente ask() solo pide a los hijos nuevos
+        assert len(ga._state['population']) - len(ga._state['known_fitness']) == PARAMS['pop_size'] - ELITE_COUNT
+
+
+def test_evaluations_count_only_new_individuals(provider):
+    results = GeneticAlgorithm().run(**PARAMS, is_minimizing=False, function_provider=provider, seed=5,
+                                     elite_count=ELITE_COUNT)
+    ga_results = results['ga_results']
+    assert ga_results['elite_count'] == ELITE_COUNT
+    assert ga_results['evaluations'] == (PARAMS['pop_size']
+                                         + PARAMS['max_generations'] * (PARAMS['pop_size'] - ELITE_COUNT))
+    # Las élites conservan al mejor: la curva del mejor nunca empeora
+    assert np.all(np.diff(results['best_fitness_history']) >= 0)
+
+
+def test_nan_fitness_is_never_an_elite():
+    ga = GeneticAlgorithm()
+    ga.setup(**PARAMS, is_minimizing=False, function_provider=CustomFunctionProvider("x"), seed=0,
+             elite_count=ELITE_COUNT)
+    x_values = ga.ask()
+    fitness = np.where(np.arange(len(x_values)) % 2 == 0, np.nan, x_values)
+    ga.tell(fitness)
+    assert not np.isnan(ga._state['known_fitness']).any()
+
+
+@pytest.mark.parametrize('elite_count', [-1, PARAMS['pop_size']])
+def test_invalid_elite_count_raises(provider, elite_count):
+    with pytest.raises(ValueError):
+        GeneticAlgorithm().setup(**PARAMS, is_minimizing=False, function_provider=provider,
+                                 elite_count=elite_count)
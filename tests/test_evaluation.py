@@ -0,0 +1,54 @@
+"""Backends de evaluación: el pool de procesos devuelve lo mismo que la evaluación en serie"""
+
+import numpy as np
+import pytest
+
+from utils.evaluation import ProcessPoolEvaluator, SerialEvaluator, create_evaluator
+from utils.function_provider import CustomFunctionProvider
+from utils.math_functions import decode_population
+
+FUNCTION_TEXT = "ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)"
+
+
+class _SelfManagedProvider:
+    manages_own_workers = True
+
+    def get_raw_function_values(self, x_values):
+        return np.asarray(x_values, dtype=float)
+
+
+@pytest.fixture
+def population_x():
+    rng = np.random.default_rng(0)
+    bits = rng.integers(0, 2, size=(2000, 15), dtype=np.uint8)
+    return decode_population(bits, -10, 10, 15)
+
+
+def test_process_pool_matches_serial(population_x):
+    provider = CustomFunctionProvider(FUNCTION_TEXT)
+    expected = SerialEvaluator(provider).evaluate(population_x)
+    # Umbral 0: el lote se reparte en el pool aunque la función sea barata
+    with ProcessPoolEvaluator(provider, max_workers=2, min_parallel_seconds=0.0) as evaluator:
+        evaluator.evaluate(population_x)   # primera llamada: mide el costo
+        result = evaluator.evaluate(population_x)
+        assert evaluator._executor is not None
+        assert evaluator._executor._mp_context.get_start_method() == 'spawn'
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_auto_keeps_cheap_functions_in_process(population_x):
+    provider = CustomFunctionProvider(FUNCTION_TEXT)
+    with create_evaluator(provider, 'auto') as evaluator:
+        assert isinstance(evaluator, ProcessPoolEvaluator)
+        result = evaluator.evaluate(population_x)
+        assert evaluator._executor is None
+    np.testing.assert_array_equal(result, provider.get_raw_function_values(population_x))
+
+
+def test_auto_is_serial_for_providers_with_own_workers():
+    assert isinstance(create_evaluator(_SelfManagedProvider(), 'auto'), SerialEvaluator)
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        create_evaluator(CustomFunctionProvider(FUNCTION_TEXT), 'gpu')
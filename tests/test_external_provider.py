@@ -0,0 +1,71 @@
+"""Protocolo GAEV del proveedor externo: encuadre de mensajes y ida y vuelta con un proceso real"""
+
+import io
+import os
+import struct
+import sys
+
+import numpy as np
+import pytest
+
+from utils.external_provider import MAGIC, ExternalFunctionProvider, read_message, serve, write_message
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIMULATOR = (f"import sys; sys.path.insert(0, {ROOT!r}); import numpy as np; "
+             f"from utils.external_provider import serve; serve(lambda x: np.sin(x) * x)")
+
+
+def test_message_framing():
+    stream = io.BytesIO()
+    write_message(stream, [1.5, -2.0, 3.25])
+    data = stream.getvalue()
+
+    assert data[:4] == MAGIC
+    assert struct.unpack('<I', data[4:8]) == (3,)
+    assert np.frombuffer(data[8:], dtype='<f8').tolist() == [1.5, -2.0, 3.25]
+    stream.seek(0)
+    assert read_message(stream).tolist() == [1.5, -2.0, 3.25]
+    assert read_message(stream) is None   # fin de la conexión
+
+
+def test_empty_message_round_trips():
+    stream = io.BytesIO()
+    write_message(stream, [])
+    stream.seek(0)
+    assert read_message(stream).size == 0
+
+
+def test_bad_magic_and_truncated_messages_raise():
+    with pytest.raises(ValueError):
+        read_message(io.BytesIO(struct.pack('<4sI', b'XXXX', 0)))
+    stream = io.BytesIO()
+    write_message(stream, [1.0, 2.0])
+    with pytest.raises(EOFError):
+        read_message(io.BytesIO(stream.getvalue()[:-4]))
+
+
+def test_serve_answers_each_request():
+    requests = io.BytesIO()
+    write_message(requests, [1.0, 2.0])
+    write_message(requests, [3.0])
+    requests.seek(0)
+    responses = io.BytesIO()
+    serve(lambda x: x * 10, stdin=requests, stdout=responses)
+
+    responses.seek(0)
+    assert read_message(responses).tolist() == [10.0, 20.0]
+    assert read_message(responses).tolist() == [30.0]
+    assert read_message(responses) is None
+
+
+@pytest.mark.parametrize('pool_size', [1, 3])
+def test_external_process_matches_local_evaluation(pool_size):
+    provider = ExternalFunctionProvider([sys.executable, '-c', SIMULATOR], pool_size=pool_size, label='x*sin(x)')
+    x_values = np.linspace(-10, 10, 101).reshape(1, -1)
+    try:
+        result = provider.get_raw_function_values(x_values)
+        assert result.shape == x_values.shape
+        np.testing.assert_array_equal(result, np.sin(x_values) * x_values)
+        assert provider.get_raw_function_value(2.0) == np.sin(2.0) * 2.0
+    finally:
+        provider.close()
@@ -0,0 +1,92 @@
+"""Políticas de retención de RunHistory"""
+
+import pytest
+
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from algorithm.history import GenerationRecord, RunHistory, history_generation_numbers, replay_records
+from utils.function_provider import CustomFunctionProvider
+
+# Mejor fitness por generación (al maximizar, mejora en las generaciones 0, 1 y 3)
+BEST_FITNESS = [1.0, 3.0, 2.0, 5.0, 5.0, 4.0]
+POP_SIZE = 6
+
+
+def _records(best_fitness):
+    for generation, best in enumerate(best_fitness):
+        fitness = [best - 1.0 - i for i in range(POP_SIZE - 1)] + [best]
+        population = [[generation, i] for i in range(POP_SIZE)]
+        yield GenerationRecord(generation=generation, best_x=float(generation), best_fitness=best,
+                               mean_fitness=sum(fitness) / POP_SIZE, std_fitness=0.0,
+                               population=population, fitness=fitness)
+
+
+def _build(history_mode, history_param=None, is_minimizing=False, seed=0, best_fitness=BEST_FITNESS):
+    history = RunHistory(history_mode, history_param, is_minimizing, seed)
+    for record in _records(best_fitness):
+        history.add(record)
+    return history.build({'is_minimizing': is_minimizing})
+
+
+def test_full_keeps_every_generation():
+    results = _build('full')
+    assert len(results['population_history']) == len(BEST_FITNESS)
+    assert 'history_generations' not in results['ga_results']
+    assert list(history_generation_numbers(results['ga_results'], len(BEST_FITNESS))) == list(range(len(BEST_FITNESS)))
+
+
+def test_every_k_keeps_one_generation_in_k():
+    results = _build('every_k', 2)
+    assert results['ga_results']['history_generations'] == [0, 2, 4]
+    assert results['ga_results']['history_param'] == 2
+    assert [population[0][0] for population in results['population_history']] == [0, 2, 4]
+    assert results['best_fitness_history'] == BEST_FITNESS
+
+
+@pytest.mark.parametrize('is_minimizing, best_fitness, expected', [
+    (False, BEST_FITNESS, [0, 1, 3]),
+    (True, [5.0, 6.0, 4.0, 4.0, 7.0, 1.0], [0, 2, 5]),
+])
+def test_improved_keeps_generations_that_improve_the_best(is_minimizing, best_fitness, expected):
+    results = _build('improved', is_minimizing=is_minimizing, best_fitness=best_fitness)
+    assert results['ga_results']['history_generations'] == expected
+
+
+def test_reservoir_keeps_a_sample_with_the_best():
+    results = _build('reservoir', 3, seed=5)
+    assert results['ga_results']['history_generations'] == list(range(len(BEST_FITNESS)))
+    for fitness, best in zip(results['fitness_history'], BEST_FITNESS):
+        assert len(fitness) == 3
+        assert best in fitness
+    assert results['population_history'] == _build('reservoir', 3, seed=5)['population_history']
+
+
+def test_stats_keeps_no_populations():
+    history = RunHistory('stats')
+    assert not history.keeps_populations
+    results = _build('stats')
+    assert results['population_history'] == [] and results['fitness_history'] == []
+    assert results['best_fitness_history'] == BEST_FITNESS
+
+
+@pytest.mark.parametrize('history_mode, history_param', [('ultimas', None), ('every_k', 0), ('reservoir', -1)])
+def test_invalid_policies_raise(history_mode, history_param):
+    with pytest.raises(ValueError):
+        RunHistory(history_mode, history_param)
+
+
+def test_every_k_run_is_a_subset_of_the_full_run():
+    provider = CustomFunctionProvider("x*sin(3*x)")
+    params = dict(x_min=-5, x_max=5, delta_x=0.01, pop_size=20, max_generations=12, prob_crossover=0.8,
+                  prob_mutation_i=0.3, prob_mutation_g=0.1, is_minimizing=True,
+                  function_provider=provider, seed=11)
+    full = GeneticAlgorithm().run(**params)
+    every_3 = GeneticAlgorithm().run(**params, history_mode='every_k', history_param=3)
+
+    assert every_3['population_history'] == full['population_history'][::3]
+    assert every_3['fitness_history'] == full['fitness_history'][::3]
+    assert every_3['best_fitness_history'] == full['best_fitness_history']
+    assert every_3['ga_results']['best_x'] == full['ga_results']['best_x']
+    # Reproducir los registros conserva el fitness solo de las generaciones guardadas
+    replayed = list(replay_records(every_3))
+    assert [r.best_fitness for r in replayed] == full['best_fitness_history']
+    assert [r.generation for r in replayed if r.fitness is not None] == [0, 3, 6, 9]
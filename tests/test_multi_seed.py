@@ -0,0 +1,53 @@
+"""Agregación de curvas de varias semillas"""
+
+import numpy as np
+import pytest
+
+from algorithm.multi_seed import BAND_PERCENTILES, _stack_curves, aggregate_seed_curves, median_seed
+
+CURVES = [[1.0, 2.0, 3.0, 3.0],
+          [1.0, 1.0, 1.0, 2.0],
+          [0.0, 3.0, 3.0, 3.0]]
+ELAPSED = [[0.1, 0.2, 0.3, 0.4],
+           [0.1, 0.2, 0.3, 0.4],
+           [0.5, 1.0, 1.5, 2.0]]
+
+
+def test_bands_are_percentiles_per_generation():
+    summary = aggregate_seed_curves(CURVES, is_minimizing=False)
+    assert summary['percentiles'] == list(BAND_PERCENTILES)
+    assert summary['bands'].shape == (len(BAND_PERCENTILES), 4)
+    np.testing.assert_allclose(summary['bands'][BAND_PERCENTILES.index(50)], np.median(CURVES, axis=0))
+    assert (summary['n_seeds'], summary['n_generations']) == (3, 4)
+
+
+def test_success_and_time_to_target():
+    summary = aggregate_seed_curves(CURVES, is_minimizing=False, elapsed=ELAPSED)
+    assert summary['target'] == 3.0
+    assert summary['success_rate'] == pytest.approx(2 / 3)
+    np.testing.assert_array_equal(summary['generations_to_target'], [3, np.nan, 2])
+    np.testing.assert_array_equal(summary['seconds_to_target'], [0.3, np.nan, 1.0])
+    assert summary['median_generations_to_target'] == 2.5
+    assert summary['median_seconds_to_target'] == pytest.approx(0.65)
+
+
+def test_explicit_target_and_minimizing():
+    curves = -np.asarray(CURVES)
+    summary = aggregate_seed_curves(curves, is_minimizing=True, target=-2.0)
+    assert summary['success_rate'] == 1.0
+    np.testing.assert_array_equal(summary['generations_to_target'], [2, 4, 2])
+    assert np.isnan(summary['seconds_to_target']).all()   # sin tiempos
+
+
+def test_shorter_curves_are_padded_with_nan():
+    curves = _stack_curves([np.array([1.0, 2.0, 3.0]), np.array([1.0])])
+    assert curves.shape == (2, 3)
+    assert np.isnan(curves[1, 1:]).all()
+    summary = aggregate_seed_curves(curves, is_minimizing=False)
+    np.testing.assert_allclose(summary['bands'][BAND_PERCENTILES.index(50)], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(summary['generations_to_target'], [3, np.nan])
+
+
+def test_median_seed_is_the_typical_run():
+    summary = {'seeds': [10, 11, 12], 'final_best': [3.0, 2.0, 5.0]}
+    assert median_seed(summary) == 10
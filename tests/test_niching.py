@@ -0,0 +1,74 @@
+"""Nichos: torneos de crowding determinista y agrupación de óptimos"""
+
+import numpy as np
+import pytest
+
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from algorithm.niching import MIN_NICHE_SIZE, crowding_replacement, find_niches
+from utils.function_provider import CustomFunctionProvider
+from utils.math_functions import decode_population
+
+
+def test_each_child_competes_with_the_closest_parent():
+    parent_x = [[0.0, 10.0], [0.0, 10.0]]
+    child_x = [[0.5, 9.5], [9.5, 0.5]]          # la segunda pareja tiene los hijos cruzados
+    parent_fitness = [[1.0, 1.0], [1.0, 1.0]]
+    child_fitness = [[2.0, 0.0], [2.0, 0.0]]
+
+    swap, wins = crowding_replacement(parent_x, parent_fitness, child_x, child_fitness, is_minimizing=False)
+    np.testing.assert_array_equal(swap, [False, True])
+    # Directo: el hijo 1 (2.0) reemplaza al padre 1. Cruzado: el hijo 2 (0.0) compite con el padre 1
+    np.testing.assert_array_equal(wins, [[True, False], [False, True]])
+
+
+def test_only_strictly_better_children_win():
+    parent_x, child_x = [[0.0, 5.0]], [[0.0, 5.0]]
+    parent_fitness = [[1.0, 1.0]]
+
+    _, wins = crowding_replacement(parent_x, parent_fitness, child_x, [[1.0, 0.5]], is_minimizing=True)
+    np.testing.assert_array_equal(wins, [[False, True]])
+    _, wins = crowding_replacement(parent_x, parent_fitness, child_x, [[np.nan, np.nan]], is_minimizing=True)
+    assert not wins.any()
+    _, wins = crowding_replacement(parent_x, parent_fitness, child_x, [[np.nan, np.nan]], is_minimizing=False)
+    assert not wins.any()
+
+
+def test_find_niches_groups_by_radius_and_sorts_by_fitness():
+    x_values = [0.0, 0.05, 0.1, 5.0, 5.05, 9.0, np.nan]
+    fitness = [1.0, 2.0, 1.5, 4.0, 3.0, 10.0, 100.0]
+
+    niches = find_niches(x_values, fitness, is_minimizing=False, radius=0.2)
+    assert [niche['x'] for niche in niches] == [5.0, 0.05]
+    assert [niche['size'] for niche in niches] == [2, 3]
+    assert (niches[1]['x_low'], niches[1]['x_high']) == (0.0, 0.1)
+
+    # El individuo aislado en x = 9 solo aparece con min_size=1; el NaN nunca
+    everything = find_niches(x_values, fitness, False, 0.2, max_niches=None, min_size=1)
+    assert [niche['x'] for niche in everything] == [9.0, 5.0, 0.05]
+    assert find_niches(x_values, fitness, False, 0.2, max_niches=1) == niches[:1]
+    assert find_niches(x_values, fitness, True, 0.2)[0]['x'] == 0.0
+
+
+def test_crowding_run_reports_consistent_niches():
+    function_text = "ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)"
+    params = dict(x_min=-10, x_max=10, delta_x=0.01, pop_size=60, max_generations=30, prob_crossover=0.8,
+                  prob_mutation_i=0.2, prob_mutation_g=0.05, is_minimizing=False,
+                  function_provider=CustomFunctionProvider(function_text), seed=4, history_mode='stats')
+    ga_results = GeneticAlgorithm().run(**params, niching='crowding', max_niches=2)['ga_results']
+
+    all_niches = find_niches(
+        decode_population(ga_results['final_population'], -10, 10, ga_results['n_bits']),
+        ga_results['final_fitness'], False, ga_results['niche_radius'], max_niches=None)
+    assert ga_results['niches'] == all_niches[:2]
+    assert ga_results['niches_omitted'] == len(all_niches) - len(ga_results['niches'])
+    assert ga_results['niches'][0]['fitness'] == ga_results['best_fitness']
+    assert sum(n['size'] for n in all_niches) + ga_results['niche_isolated'] == params['pop_size']
+    # Crowding: una evaluación por hijo, sin reevaluar a los padres
+    assert ga_results['evaluations'] == params['pop_size'] * (params['max_generations'] + 1)
+    assert all(n['size'] >= MIN_NICHE_SIZE for n in ga_results['niches'])
+
+
+def test_crowding_rejects_elitism():
+    with pytest.raises(ValueError):
+        GeneticAlgorithm().setup(-1, 1, 0.01, 10, 5, 0.8, 0.2, 0.1, False,
+                                 function_provider=CustomFunctionProvider("x"), niching='crowding', elite_count=1)
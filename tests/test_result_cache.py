@@ -0,0 +1,85 @@
+"""Caché de resultados: claves por contenido, aciertos/fallos y desalojo LRU"""
+
+import os
+
+import numpy as np
+import pytest
+
+from utils.result_cache import ResultCache, result_cache_key
+
+PARAMS = {'interval_a': -10, 'interval_b': 10, 'delta_x': 0.01, 'pop_size': 20, 'num_generations': 5,
+          'prob_crossover': 0.8, 'prob_mutation_i': 0.3, 'prob_mutation_g': 0.1, 'is_minimizing': False}
+
+
+def _results(value, generations=5, pop_size=20, n_bits=11):
+    return {
+        'ga_results': {'best_x': value, 'best_fitness': value, 'seed': 1},
+        'population_history': np.zeros((generations, pop_size, n_bits), dtype=np.uint8),
+        'fitness_history': np.full((generations, pop_size), value),
+        'best_fitness_history': np.full(generations, value),
+    }
+
+
+def test_key_depends_on_what_determines_the_result():
+    key = result_cache_key('standard_ga', 'x**2', PARAMS, seed=1)
+    assert key == result_cache_key('standard_ga', 'x**2', dict(PARAMS), seed=1)
+    assert key != result_cache_key('standard_ga', 'x**3', PARAMS, seed=1)
+    assert key != result_cache_key('standard_ga', 'x**2', PARAMS, seed=2)
+    assert key != result_cache_key('standard_ga', 'x**2', dict(PARAMS, pop_size=21), seed=1)
+    assert key != result_cache_key('otro_ga', 'x**2', PARAMS, seed=1)
+    assert key != result_cache_key('standard_ga', 'x**2', PARAMS, seed=1, function_backend='numexpr')
+
+
+def test_key_ignores_execution_only_params():
+    key = result_cache_key('standard_ga', 'x**2', PARAMS, seed=1)
+    assert key == result_cache_key('standard_ga', 'x**2', dict(PARAMS, evaluation_backend='process'), seed=1)
+    # La semilla cuenta por su argumento, no por la copia que viaja en params
+    assert key == result_cache_key('standard_ga', 'x**2', dict(PARAMS, seed=99), seed=1)
+
+
+def test_get_and_put_count_hits_and_misses(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    assert cache.get('a') is None
+    cache.put('a', _results(1.5))
+    cached = cache.get('a')
+
+    assert isinstance(cached['fitness_history'], np.memmap)
+    np.testing.assert_array_equal(cached['best_fitness_history'], np.full(5, 1.5))
+    assert cached['cache_path'] == os.path.join(str(tmp_path), 'a.npz')
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+    assert stats['hit_rate'] == pytest.approx(0.5)
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    cache.put('a', _results(1.0))
+    cache.put('b', _results(2.0))
+    entry_bytes = cache.stats()['bytes'] // 2
+    # Fechas de uso explícitas: 'a' es la más antigua, pero un acierto la renueva
+    os.utime(os.path.join(str(tmp_path), 'a.npz'), (1_000, 1_000))
+    os.utime(os.path.join(str(tmp_path), 'b.npz'), (2_000, 2_000))
+    assert cache.get('a') is not None
+
+    cache.max_bytes = 2 * entry_bytes
+    cache.put('c', _results(3.0))
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.stats()['bytes'] <= cache.max_bytes
+
+
+def test_entry_larger_than_the_limit_is_kept_alone(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=1)
+    cache.put('a', _results(1.0))
+    cache.put('b', _results(2.0))
+    assert cache.stats()['entries'] == 1
+    assert cache.get('b') is not None
+
+
+def test_damaged_entry_counts_as_miss_and_is_removed(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    with open(os.path.join(str(tmp_path), 'a.npz'), 'wb') as f:
+        f.write(b'no es un zip')
+    assert cache.get('a') is None
+    assert cache.stats()['entries'] == 0
@@ -0,0 +1,66 @@
+"""Archivo de ejecución .npz: ida y vuelta y carga mapeada en memoria"""
+
+import zipfile
+
+import numpy as np
+import pytest
+
+from algorithm.genetic_algorithm import GeneticAlgorithm
+from utils.function_provider import CustomFunctionProvider
+from utils.run_archive import load_run_archive, save_run_archive
+
+PARAMS = dict(x_min=-10, x_max=10, delta_x=0.01, pop_size=24, max_generations=10,
+              prob_crossover=0.8, prob_mutation_i=0.3, prob_mutation_g=0.1, is_minimizing=False, seed=2)
+
+
+def _save(path, results):
+    return save_run_archive(str(path), results['ga_results'], results['population_history'],
+                            results['fitness_history'], results['best_fitness_history'])
+
+
+@pytest.fixture(scope='module')
+def results():
+    return GeneticAlgorithm().run(**PARAMS, function_provider=CustomFunctionProvider("x*cos(x)"))
+
+
+def test_round_trip_restores_histories_and_results(tmp_path, results):
+    loaded = load_run_archive(_save(tmp_path / 'run.npz', results))
+
+    np.testing.assert_array_equal(loaded['population_history'], np.asarray(results['population_history']))
+    np.testing.assert_array_equal(loaded['fitness_history'], np.asarray(results['fitness_history']))
+    np.testing.assert_array_equal(loaded['best_fitness_history'], results['best_fitness_history'])
+    assert loaded['population_history'].shape == (PARAMS['max_generations'], PARAMS['pop_size'],
+                                                  results['ga_results']['n_bits'])
+    for key in ('best_x', 'best_fitness', 'best_individual', 'final_population', 'seed', 'function_text_for_report'):
+        assert loaded['ga_results'][key] == results['ga_results'][key]
+    stats = results['ga_results']['generation_stats']
+    np.testing.assert_array_equal(loaded['ga_results']['generation_stats']['mean_fitness'], stats['mean_fitness'])
+
+
+def test_histories_are_memory_mapped(tmp_path, results):
+    loaded = load_run_archive(_save(tmp_path / 'run.npz', results))
+    for name in ('population_history', 'fitness_history', 'best_fitness_history'):
+        assert isinstance(loaded[name], np.memmap)
+        assert not loaded[name].flags.writeable
+    assert loaded['population_history'].dtype == np.uint8
+    # Un .npz estándar: np.load lee lo mismo
+    with np.load(tmp_path / 'run.npz') as archive:
+        np.testing.assert_array_equal(archive['fitness_history'], loaded['fitness_history'])
+
+
+def test_stats_only_run_round_trips_with_empty_histories(tmp_path):
+    results = GeneticAlgorithm().run(**PARAMS, function_provider=CustomFunctionProvider("x*cos(x)"),
+                                     history_mode='stats')
+    loaded = load_run_archive(_save(tmp_path / 'stats.npz', results))
+    assert loaded['population_history'].size == 0
+    assert loaded['fitness_history'].size == 0
+    np.testing.assert_array_equal(loaded['best_fitness_history'], results['best_fitness_history'])
+    assert loaded['ga_results']['history_mode'] == 'stats'
+
+
+def test_archive_without_metadata_is_rejected(tmp_path):
+    path = tmp_path / 'otro.npz'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('datos.npy', b'')
+    with pytest.raises(ValueError):
+        load_run_archive(str(path))
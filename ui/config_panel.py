@@ -6,11 +6,12 @@ Panel de configuración de la aplicación
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QDoubleSpinBox, QPushButton,
-    QLabel, QMessageBox, QSpinBox, QRadioButton, QGroupBox
+    QLabel, QMessageBox, QSpinBox, QRadioButton, QGroupBox, QCheckBox, QComboBox
 )
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtCore import QFile, QIODevice, Qt
 from utils.math_functions import set_function_provider
+from algorithm.history import HISTORY_MODES, HISTORY_PARAM_MODES
 import numpy as np
 
 class ConfigPanel(QWidget):
@@ -31,6 +32,16 @@ class ConfigPanel(QWidget):
         self.prob_crossover_spinbox = None
         self.prob_mutation_i_spinbox = None
         self.prob_mutation_g_spinbox = None
+        self.seed_spinbox = None
+        self.num_seeds_spinbox = None
+        self.elite_count_spinbox = None
+        self.niching_checkbox = None
+        self.memetic_checkbox = None
+        self.memetic_spinboxes = {}
+        self.adaptive_rates_checkbox = None
+        self.adaptive_min_spinboxes = {}
+        self.history_mode_combo = None
+        self.history_param_spinbox = None
         self.minimize_radio = None
         self.maximize_radio = None
         self.function_display_label = None
@@ -39,15 +50,20 @@ class ConfigPanel(QWidget):
         self.max_decimal_label = None
         self.editFunctionButton = None
         self.execute_ag_btn = None
+        self.tuneParamsButton = None
         self.scrollable_widget_content = None
 
         # Nuevos botones
         self.objectiveGraphButton = None
         self.bestEvolutionGraphButton = None
         self.allEvolutionGraphButton = None
+        self.statisticsGraphButton = None
         self.animatedEvolutionButton = None
         self.generateReportButton = None
         self.downloadAnimationButton = None
+        self.saveRunButton = None
+        self.openRunButton = None
+        self.runRegistryButton = None
         self.clearResultsButton = None
         self.graph_buttons_list = []
 
@@ -67,6 +83,17 @@ class ConfigPanel(QWidget):
                 self.editFunctionButton.clicked.connect(self.open_function_editor)
             if self.execute_ag_btn:
                 self.execute_ag_btn.clicked.connect(self.run_example_algorithm_from_config)
+            if self.tuneParamsButton:
+                self.tuneParamsButton.clicked.connect(self.tune_parameters_slot)
+            if self.adaptive_rates_checkbox:
+                self.adaptive_rates_checkbox.toggled.connect(self.update_adaptive_rate_controls)
+            if self.history_mode_combo:
+                self.history_mode_combo.currentIndexChanged.connect(self.update_history_controls)
+            if self.niching_checkbox and self.elite_count_spinbox:
+                # El crowding ya conserva a los mejores: no se combina con elitismo
+                self.niching_checkbox.toggled.connect(lambda checked: self.elite_count_spinbox.setEnabled(not checked))
+            if self.memetic_checkbox:
+                self.memetic_checkbox.toggled.connect(self.update_memetic_controls)
 
             # Conexiones para nuevos botones
             if self.objectiveGraphButton:
@@ -75,6 +102,8 @@ class ConfigPanel(QWidget):
                 self.bestEvolutionGraphButton.clicked.connect(lambda: self.show_graph_slot("evolution_best"))
             if self.allEvolutionGraphButton:
                 self.allEvolutionGraphButton.clicked.connect(lambda: self.show_graph_slot("evolution_all"))
+            if self.statisticsGraphButton:
+                self.statisticsGraphButton.clicked.connect(lambda: self.show_graph_slot("statistics"))
             if self.animatedEvolutionButton:
                 self.animatedEvolutionButton.clicked.connect(self.start_animation_slot)
 
@@ -82,6 +111,12 @@ class ConfigPanel(QWidget):
                 self.generateReportButton.clicked.connect(self.generate_report_slot)
             if self.downloadAnimationButton:
                 self.downloadAnimationButton.clicked.connect(self.save_animation_slot)
+            if self.saveRunButton:
+                self.saveRunButton.clicked.connect(self.save_run_slot)
+            if self.openRunButton:
+                self.openRunButton.clicked.connect(self.open_run_slot)
+            if self.runRegistryButton:
+                self.runRegistryButton.clicked.connect(self.run_registry_slot)
             if self.clearResultsButton:
                 self.clearResultsButton.clicked.connect(self.clear_results_slot)
 
@@ -128,6 +163,24 @@ class ConfigPanel(QWidget):
         self.prob_crossover_spinbox = self.scrollable_widget_content.findChild(QDoubleSpinBox, "prob_crossover_spinbox")
         self.prob_mutation_i_spinbox = self.scrollable_widget_content.findChild(QDoubleSpinBox, "prob_mutation_i_spinbox")
         self.prob_mutation_g_spinbox = self.scrollable_widget_content.findChild(QDoubleSpinBox, "prob_mutation_g_spinbox")
+        self.seed_spinbox = self.scrollable_widget_content.findChild(QSpinBox, "seed_spinbox")
+        self.num_seeds_spinbox = self.scrollable_widget_content.findChild(QSpinBox, "num_seeds_spinbox")
+        self.elite_count_spinbox = self.scrollable_widget_content.findChild(QSpinBox, "elite_count_spinbox")
+        self.niching_checkbox = self.scrollable_widget_content.findChild(QCheckBox, "niching_checkbox")
+        self.memetic_checkbox = self.scrollable_widget_content.findChild(QCheckBox, "memetic_checkbox")
+        self.memetic_spinboxes = {
+            'interval': self.scrollable_widget_content.findChild(QSpinBox, "memetic_interval_spinbox"),
+            'top': self.scrollable_widget_content.findChild(QSpinBox, "memetic_top_spinbox"),
+            'steps': self.scrollable_widget_content.findChild(QSpinBox, "memetic_steps_spinbox"),
+        }
+        self.adaptive_rates_checkbox = self.scrollable_widget_content.findChild(QCheckBox, "adaptive_rates_checkbox")
+        self.adaptive_min_spinboxes = {
+            'prob_crossover': self.scrollable_widget_content.findChild(QDoubleSpinBox, "adaptive_min_crossover_spinbox"),
+            'prob_mutation_i': self.scrollable_widget_content.findChild(QDoubleSpinBox, "adaptive_min_mutation_i_spinbox"),
+            'prob_mutation_g': self.scrollable_widget_content.findChild(QDoubleSpinBox, "adaptive_min_mutation_g_spinbox"),
+        }
+        self.history_mode_combo = self.scrollable_widget_content.findChild(QComboBox, "history_mode_combo")
+        self.history_param_spinbox = self.scrollable_widget_content.findChild(QSpinBox, "history_param_spinbox")
         self.minimize_radio = self.scrollable_widget_content.findChild(QRadioButton, "minimize_radio")
         self.maximize_radio = self.scrollable_widget_content.findChild(QRadioButton, "maximize_radio")
         self.function_display_label = self.scrollable_widget_content.findChild(QLabel, "functionDisplayLabel")
@@ -136,20 +189,26 @@ class ConfigPanel(QWidget):
         self.max_decimal_label = self.scrollable_widget_content.findChild(QLabel, "max_decimal_label")
         self.editFunctionButton = self.scrollable_widget_content.findChild(QPushButton, "editFunctionButton")
         self.execute_ag_btn = self.scrollable_widget_content.findChild(QPushButton, "execute_ag_btn")
+        self.tuneParamsButton = self.scrollable_widget_content.findChild(QPushButton, "tuneParamsButton")
 
         # --- Acceso a botones añadidos al .ui (si se hizo con Designer) ---
         self.objectiveGraphButton = self.scrollable_widget_content.findChild(QPushButton, "objectiveGraphButton")
         self.bestEvolutionGraphButton = self.scrollable_widget_content.findChild(QPushButton, "bestEvolutionGraphButton")
         self.allEvolutionGraphButton = self.scrollable_widget_content.findChild(QPushButton, "allEvolutionGraphButton")
+        self.statisticsGraphButton = self.scrollable_widget_content.findChild(QPushButton, "statisticsGraphButton")
         self.animatedEvolutionButton = self.scrollable_widget_content.findChild(QPushButton, "animatedEvolutionButton")
         self.generateReportButton = self.scrollable_widget_content.findChild(QPushButton, "generateReportButton")
         self.downloadAnimationButton = self.scrollable_widget_content.findChild(QPushButton, "downloadAnimationButton")
+        self.saveRunButton = self.scrollable_widget_content.findChild(QPushButton, "saveRunButton")
+        self.openRunButton = self.scrollable_widget_content.findChild(QPushButton, "openRunButton")
+        self.runRegistryButton = self.scrollable_widget_content.findChild(QPushButton, "runRegistryButton")
         self.clearResultsButton = self.scrollable_widget_content.findChild(QPushButton, "clearResultsButton")
         
         # Llenar graph_buttons_list
         if self.objectiveGraphButton: self.graph_buttons_list.append(self.objectiveGraphButton)
         if self.bestEvolutionGraphButton: self.graph_buttons_list.append(self.bestEvolutionGraphButton)
         if self.allEvolutionGraphButton: self.graph_buttons_list.append(self.allEvolutionGraphButton)
+        if self.statisticsGraphButton: self.graph_buttons_list.append(self.statisticsGraphButton)
         if self.animatedEvolutionButton: self.graph_buttons_list.append(self.animatedEvolutionButton)
 
         # Verificar que los widgets esenciales (del .ui original y los nuevos) fueron encontrados
@@ -184,8 +243,17 @@ class ConfigPanel(QWidget):
 
 
     def open_function_editor(self):
+        if not hasattr(self.function_provider, 'set_function'):
+            QMessageBox.information(self, "Función Externa",
+                                    f"La función objetivo la calcula un proceso externo:\n{self.function_provider.function_text}")
+            return
         from ui.function_editor import FunctionEditor
-        editor = FunctionEditor(self)
+        preview_interval = None
+        if self.interval_a_spinbox and self.interval_b_spinbox:
+            a, b = self.interval_a_spinbox.value(), self.interval_b_spinbox.value()
+            if b > a:
+                preview_interval = (a, b)
+        editor = FunctionEditor(self, preview_interval=preview_interval)
 
         if self.function_provider and self.function_provider.function_text:
             editor.function_entry.setText(self.function_provider.function_text)
@@ -265,7 +333,8 @@ class ConfigPanel(QWidget):
             if self.max_decimal_label: self.max_decimal_label.setText("Error")
 
 
-    def run_example_algorithm_from_config(self):
+    def get_params(self):
+        """Parámetros del panel en el formato de execute_specific_ga (None si falta algún control)"""
         required_widgets_for_run = [
             self.interval_a_spinbox, self.interval_b_spinbox, self.delta_x_spinbox,
             self.pop_size_spinbox, self.num_generations_spinbox, self.prob_crossover_spinbox,
@@ -273,7 +342,7 @@ class ConfigPanel(QWidget):
         ]
         if not all(w for w in required_widgets_for_run):
             QMessageBox.critical(self, "Error de Configuración", "Faltan componentes de UI. Verifique objectNames en .ui y código.")
-            return
+            return None
 
         params = {
             'interval_a': self.interval_a_spinbox.value(),
@@ -284,13 +353,70 @@ class ConfigPanel(QWidget):
             'prob_crossover': self.prob_crossover_spinbox.value(),
             'prob_mutation_i': self.prob_mutation_i_spinbox.value(),
             'prob_mutation_g': self.prob_mutation_g_spinbox.value(),
-            'is_minimizing': self.minimize_radio.isChecked() if self.minimize_radio else True
+            'is_minimizing': self.minimize_radio.isChecked() if self.minimize_radio else True,
+            # -1 ("Aleatoria") = sin semilla
+            'seed': self.seed_spinbox.value() if self.seed_spinbox and self.seed_spinbox.value() >= 0 else None
+        }
+        if self.num_seeds_spinbox and self.num_seeds_spinbox.value() > 1:
+            params['num_seeds'] = self.num_seeds_spinbox.value()
+        if self.niching_checkbox and self.niching_checkbox.isChecked():
+            params['niching'] = 'crowding'
+        elif self.elite_count_spinbox and self.elite_count_spinbox.value() > 0:
+            # Al menos un individuo nuevo por generación
+            params['elite_count'] = min(self.elite_count_spinbox.value(), max(0, params['pop_size'] - 1))
+        if self.adaptive_rates_checkbox and self.adaptive_rates_checkbox.isChecked():
+            # Límites (mínimo, máximo): los controles de probabilidad hacen de máximo
+            params['adaptive_rates'] = {
+                name: tuple(sorted((spinbox.value(), params[name])))
+                for name, spinbox in self.adaptive_min_spinboxes.items() if spinbox
+            }
+        if self.memetic_checkbox and self.memetic_checkbox.isChecked():
+            params['memetic'] = {name: spinbox.value() for name, spinbox in self.memetic_spinboxes.items() if spinbox}
+        history_mode = HISTORY_MODES[self.history_mode_combo.currentIndex()] if self.history_mode_combo else 'full'
+        if history_mode != 'full':
+            params['history_mode'] = history_mode
+            if history_mode in HISTORY_PARAM_MODES and self.history_param_spinbox:
+                params['history_param'] = self.history_param_spinbox.value()
+        return params
+
+    def update_adaptive_rate_controls(self, checked):
+        for spinbox in self.adaptive_min_spinboxes.values():
+            if spinbox: spinbox.setEnabled(checked)
+
+    def update_memetic_controls(self, checked):
+        for spinbox in self.memetic_spinboxes.values():
+            if spinbox: spinbox.setEnabled(checked)
+
+    def update_history_controls(self, index):
+        if self.history_param_spinbox:
+            self.history_param_spinbox.setEnabled(HISTORY_MODES[index] in HISTORY_PARAM_MODES)
+
+    def set_params(self, params):
+        """Carga en los controles los parámetros de población y probabilidades de `params`"""
+        spinboxes = {
+            'pop_size': self.pop_size_spinbox,
+            'prob_crossover': self.prob_crossover_spinbox,
+            'prob_mutation_i': self.prob_mutation_i_spinbox,
+            'prob_mutation_g': self.prob_mutation_g_spinbox,
         }
+        for name, spinbox in spinboxes.items():
+            if spinbox and name in params:
+                spinbox.setValue(params[name])
+
+    def run_example_algorithm_from_config(self):
+        params = self.get_params()
+        if params is None:
+            return
         if self.main_window:
             self.main_window.run_example_algorithm(params)
         else:
             QMessageBox.critical(self, "Error Interno", "Referencia a MainWindow no encontrada.")
 
+    def tune_parameters_slot(self):
+        params = self.get_params()
+        if params is not None and self.main_window:
+            self.main_window.tune_parameters(params)
+
 
     def show_graph_slot(self, graph_type: str):
         if not self.main_window or not self.main_window.ga_results:
@@ -303,7 +429,8 @@ class ConfigPanel(QWidget):
                 self.main_window.ga_results,
                 self.main_window.population_history,
                 self.main_window.fitness_history,
-                self.main_window.best_fitness_history
+                self.main_window.best_fitness_history,
+                run_id=getattr(self.main_window, 'run_id', None)
             )
 
     def start_animation_slot(self):
@@ -330,6 +457,15 @@ class ConfigPanel(QWidget):
     def save_animation_slot(self):
         if self.main_window: self.main_window.save_animation()
 
+    def save_run_slot(self):
+        if self.main_window: self.main_window.save_run()
+
+    def open_run_slot(self):
+        if self.main_window: self.main_window.open_run()
+
+    def run_registry_slot(self):
+        if self.main_window: self.main_window.show_run_registry()
+
     def clear_results_slot(self):
         if self.main_window: self.main_window.clear_results()
 
@@ -339,6 +475,7 @@ class ConfigPanel(QWidget):
             "objective": self.objectiveGraphButton,
             "evolution_best": self.bestEvolutionGraphButton,
             "evolution_all": self.allEvolutionGraphButton,
+            "statistics": self.statisticsGraphButton,
         }
         for graph_name, button_widget in buttons_map.items():
             if button_widget:
@@ -377,6 +514,8 @@ class ConfigPanel(QWidget):
         
         if self.generateReportButton: self.generateReportButton.setEnabled(has_results)
         if self.downloadAnimationButton: self.downloadAnimationButton.setEnabled(has_results)
+        if self.saveRunButton: self.saveRunButton.setEnabled(has_results)
+        if self.openRunButton: self.openRunButton.setEnabled(True)
         if self.clearResultsButton: self.clearResultsButton.setEnabled(True)
         
         if has_results:
@@ -396,6 +535,8 @@ class ConfigPanel(QWidget):
         
         if self.generateReportButton: self.generateReportButton.setEnabled(False)
         if self.downloadAnimationButton: self.downloadAnimationButton.setEnabled(False)
+        if self.saveRunButton: self.saveRunButton.setEnabled(False)
+        if self.openRunButton: self.openRunButton.setEnabled(True)
         if self.clearResultsButton: self.clearResultsButton.setEnabled(True) 
         
         self.update_graph_button_selection(None)
\ No newline at end of file
@@ -15,10 +15,10 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QDoubleSpinBox, QGridLayout, QGroupBox,
-    QHBoxLayout, QLabel, QPushButton, QRadioButton,
-    QSizePolicy, QSpacerItem, QSpinBox, QVBoxLayout,
-    QWidget)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDoubleSpinBox,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QPushButton, QRadioButton, QSizePolicy, QSpacerItem,
+    QSpinBox, QVBoxLayout, QWidget)
 
 class Ui_ConfigPanelWidget(object):
     def setupUi(self, ConfigPanelWidget):
@@ -186,6 +186,171 @@ class Ui_ConfigPanelWidget(object):
 
         self.gridLayout.addLayout(self.horizontalLayout, 8, 0, 1, 2)
 
+        self.label_seed = QLabel(self.paramsGroup)
+        self.label_seed.setObjectName(u"label_seed")
+
+        self.gridLayout.addWidget(self.label_seed, 9, 0, 1, 1)
+
+        self.seed_spinbox = QSpinBox(self.paramsGroup)
+        self.seed_spinbox.setObjectName(u"seed_spinbox")
+        self.seed_spinbox.setMinimum(-1)
+        self.seed_spinbox.setMaximum(2147483647)
+        self.seed_spinbox.setValue(-1)
+
+        self.gridLayout.addWidget(self.seed_spinbox, 9, 1, 1, 1)
+
+        self.label_num_seeds = QLabel(self.paramsGroup)
+        self.label_num_seeds.setObjectName(u"label_num_seeds")
+
+        self.gridLayout.addWidget(self.label_num_seeds, 10, 0, 1, 1)
+
+        self.num_seeds_spinbox = QSpinBox(self.paramsGroup)
+        self.num_seeds_spinbox.setObjectName(u"num_seeds_spinbox")
+        self.num_seeds_spinbox.setMinimum(1)
+        self.num_seeds_spinbox.setMaximum(1000)
+        self.num_seeds_spinbox.setValue(1)
+
+        self.gridLayout.addWidget(self.num_seeds_spinbox, 10, 1, 1, 1)
+
+        self.tuneParamsButton = QPushButton(self.paramsGroup)
+        self.tuneParamsButton.setObjectName(u"tuneParamsButton")
+
+        self.gridLayout.addWidget(self.tuneParamsButton, 11, 0, 1, 2)
+
+        self.adaptive_rates_checkbox = QCheckBox(self.paramsGroup)
+        self.adaptive_rates_checkbox.setObjectName(u"adaptive_rates_checkbox")
+
+        self.gridLayout.addWidget(self.adaptive_rates_checkbox, 12, 0, 1, 2)
+
+        self.label_adaptive_min = QLabel(self.paramsGroup)
+        self.label_adaptive_min.setObjectName(u"label_adaptive_min")
+
+        self.gridLayout.addWidget(self.label_adaptive_min, 13, 0, 1, 1)
+
+        self.adaptiveMinLayout = QHBoxLayout()
+        self.adaptiveMinLayout.setObjectName(u"adaptiveMinLayout")
+        self.adaptive_min_crossover_spinbox = QDoubleSpinBox(self.paramsGroup)
+        self.adaptive_min_crossover_spinbox.setObjectName(u"adaptive_min_crossover_spinbox")
+        self.adaptive_min_crossover_spinbox.setEnabled(False)
+        self.adaptive_min_crossover_spinbox.setDecimals(2)
+        self.adaptive_min_crossover_spinbox.setMaximum(1.000000000000000)
+        self.adaptive_min_crossover_spinbox.setSingleStep(0.010000000000000)
+        self.adaptive_min_crossover_spinbox.setValue(0.500000000000000)
+
+        self.adaptiveMinLayout.addWidget(self.adaptive_min_crossover_spinbox)
+
+        self.adaptive_min_mutation_i_spinbox = QDoubleSpinBox(self.paramsGroup)
+        self.adaptive_min_mutation_i_spinbox.setObjectName(u"adaptive_min_mutation_i_spinbox")
+        self.adaptive_min_mutation_i_spinbox.setEnabled(False)
+        self.adaptive_min_mutation_i_spinbox.setDecimals(2)
+        self.adaptive_min_mutation_i_spinbox.setMaximum(1.000000000000000)
+        self.adaptive_min_mutation_i_spinbox.setSingleStep(0.010000000000000)
+        self.adaptive_min_mutation_i_spinbox.setValue(0.050000000000000)
+
+        self.adaptiveMinLayout.addWidget(self.adaptive_min_mutation_i_spinbox)
+
+        self.adaptive_min_mutation_g_spinbox = QDoubleSpinBox(self.paramsGroup)
+        self.adaptive_min_mutation_g_spinbox.setObjectName(u"adaptive_min_mutation_g_spinbox")
+        self.adaptive_min_mutation_g_spinbox.setEnabled(False)
+        self.adaptive_min_mutation_g_spinbox.setDecimals(2)
+        self.adaptive_min_mutation_g_spinbox.setMaximum(1.000000000000000)
+        self.adaptive_min_mutation_g_spinbox.setSingleStep(0.010000000000000)
+        self.adaptive_min_mutation_g_spinbox.setValue(0.010000000000000)
+
+        self.adaptiveMinLayout.addWidget(self.adaptive_min_mutation_g_spinbox)
+
+
+        self.gridLayout.addLayout(self.adaptiveMinLayout, 13, 1, 1, 1)
+
+        self.label_history_mode = QLabel(self.paramsGroup)
+        self.label_history_mode.setObjectName(u"label_history_mode")
+
+        self.gridLayout.addWidget(self.label_history_mode, 14, 0, 1, 1)
+
+        self.historyLayout = QHBoxLayout()
+        self.historyLayout.setObjectName(u"historyLayout")
+        self.history_mode_combo = QComboBox(self.paramsGroup)
+        self.history_mode_combo.addItem("")
+        self.history_mode_combo.addItem("")
+        self.history_mode_combo.addItem("")
+        self.history_mode_combo.addItem("")
+        self.history_mode_combo.addItem("")
+        self.history_mode_combo.setObjectName(u"history_mode_combo")
+
+        self.historyLayout.addWidget(self.history_mode_combo)
+
+        self.history_param_spinbox = QSpinBox(self.paramsGroup)
+        self.history_param_spinbox.setObjectName(u"history_param_spinbox")
+        self.history_param_spinbox.setEnabled(False)
+        self.history_param_spinbox.setMinimum(1)
+        self.history_param_spinbox.setMaximum(100000)
+        self.history_param_spinbox.setValue(10)
+
+        self.historyLayout.addWidget(self.history_param_spinbox)
+
+
+        self.gridLayout.addLayout(self.historyLayout, 14, 1, 1, 1)
+
+        self.label_elite_count = QLabel(self.paramsGroup)
+        self.label_elite_count.setObjectName(u"label_elite_count")
+
+        self.gridLayout.addWidget(self.label_elite_count, 15, 0, 1, 1)
+
+        self.elite_count_spinbox = QSpinBox(self.paramsGroup)
+        self.elite_count_spinbox.setObjectName(u"elite_count_spinbox")
+        self.elite_count_spinbox.setMinimum(0)
+        self.elite_count_spinbox.setMaximum(1000)
+        self.elite_count_spinbox.setValue(0)
+
+        self.gridLayout.addWidget(self.elite_count_spinbox, 15, 1, 1, 1)
+
+        self.niching_checkbox = QCheckBox(self.paramsGroup)
+        self.niching_checkbox.setObjectName(u"niching_checkbox")
+
+        self.gridLayout.addWidget(self.niching_checkbox, 16, 0, 1, 2)
+
+        self.memetic_checkbox = QCheckBox(self.paramsGroup)
+        self.memetic_checkbox.setObjectName(u"memetic_checkbox")
+
+        self.gridLayout.addWidget(self.memetic_checkbox, 17, 0, 1, 2)
+
+        self.label_memetic = QLabel(self.paramsGroup)
+        self.label_memetic.setObjectName(u"label_memetic")
+
+        self.gridLayout.addWidget(self.label_memetic, 18, 0, 1, 1)
+
+        self.memeticLayout = QHBoxLayout()
+        self.memeticLayout.setObjectName(u"memeticLayout")
+        self.memetic_interval_spinbox = QSpinBox(self.paramsGroup)
+        self.memetic_interval_spinbox.setObjectName(u"memetic_interval_spinbox")
+        self.memetic_interval_spinbox.setEnabled(False)
+        self.memetic_interval_spinbox.setMinimum(1)
+        self.memetic_interval_spinbox.setMaximum(100000)
+        self.memetic_interval_spinbox.setValue(10)
+
+        self.memeticLayout.addWidget(self.memetic_interval_spinbox)
+
+        self.memetic_top_spinbox = QSpinBox(self.paramsGroup)
+        self.memetic_top_spinbox.setObjectName(u"memetic_top_spinbox")
+        self.memetic_top_spinbox.setEnabled(False)
+        self.memetic_top_spinbox.setMinimum(1)
+        self.memetic_top_spinbox.setMaximum(1000)
+        self.memetic_top_spinbox.setValue(3)
+
+        self.memeticLayout.addWidget(self.memetic_top_spinbox)
+
+        self.memetic_steps_spinbox = QSpinBox(self.paramsGroup)
+        self.memetic_steps_spinbox.setObjectName(u"memetic_steps_spinbox")
+        self.memetic_steps_spinbox.setEnabled(False)
+        self.memetic_steps_spinbox.setMinimum(1)
+        self.memetic_steps_spinbox.setMaximum(100)
+        self.memetic_steps_spinbox.setValue(5)
+
+        self.memeticLayout.addWidget(self.memetic_steps_spinbox)
+
+
+        self.gridLayout.addLayout(self.memeticLayout, 18, 1, 1, 1)
+
 
         self.mainVerticalLayout.addWidget(self.paramsGroup)
 
@@ -254,6 +419,11 @@ class Ui_ConfigPanelWidget(object):
 
         self.verticalLayout_graphs.addWidget(self.allEvolutionGraphButton)
 
+        self.statisticsGraphButton = QPushButton(self.graphSelectionGroup)
+        self.statisticsGraphButton.setObjectName(u"statisticsGraphButton")
+
+        self.verticalLayout_graphs.addWidget(self.statisticsGraphButton)
+
         self.animatedEvolutionButton = QPushButton(self.graphSelectionGroup)
         self.animatedEvolutionButton.setObjectName(u"animatedEvolutionButton")
 
@@ -276,6 +446,21 @@ class Ui_ConfigPanelWidget(object):
 
         self.verticalLayout_actions.addWidget(self.downloadAnimationButton)
 
+        self.saveRunButton = QPushButton(self.actionsGroup)
+        self.saveRunButton.setObjectName(u"saveRunButton")
+
+        self.verticalLayout_actions.addWidget(self.saveRunButton)
+
+        self.openRunButton = QPushButton(self.actionsGroup)
+        self.openRunButton.setObjectName(u"openRunButton")
+
+        self.verticalLayout_actions.addWidget(self.openRunButton)
+
+        self.runRegistryButton = QPushButton(self.actionsGroup)
+        self.runRegistryButton.setObjectName(u"runRegistryButton")
+
+        self.verticalLayout_actions.addWidget(self.runRegistryButton)
+
         self.clearResultsButton = QPushButton(self.actionsGroup)
         self.clearResultsButton.setObjectName(u"clearResultsButton")
 
@@ -309,6 +494,68 @@ class Ui_ConfigPanelWidget(object):
         self.label_prob_crossover.setText(QCoreApplication.translate("ConfigPanelWidget", u"Prob. Cruzamiento:", None))
         self.label_prob_mutation_i.setText(QCoreApplication.translate("ConfigPanelWidget", u"PMI (Individuo):", None))
         self.label_prob_mutation_g.setText(QCoreApplication.translate("ConfigPanelWidget", u"PMG (Gen):", None))
+        self.label_seed.setText(QCoreApplication.translate("ConfigPanelWidget", u"Semilla:", None))
+#if QT_CONFIG(tooltip)
+        self.seed_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Con semilla la ejecuci\u00f3n es reproducible y su resultado se reutiliza desde la cach\u00e9", None))
+#endif // QT_CONFIG(tooltip)
+        self.seed_spinbox.setSpecialValueText(QCoreApplication.translate("ConfigPanelWidget", u"Aleatoria", None))
+        self.label_num_seeds.setText(QCoreApplication.translate("ConfigPanelWidget", u"Repeticiones:", None))
+#if QT_CONFIG(tooltip)
+        self.num_seeds_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"N\u00famero de semillas a ejecutar en paralelo (1 = una sola ejecuci\u00f3n)", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.tuneParamsButton.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Busca poblaci\u00f3n, cruzamiento, PMI y PMG con un presupuesto de evaluaciones", None))
+#endif // QT_CONFIG(tooltip)
+        self.tuneParamsButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Ajustar Par\u00e1metros", None))
+#if QT_CONFIG(tooltip)
+        self.adaptive_rates_checkbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Ajusta cruzamiento, PMI y PMG cada generaci\u00f3n seg\u00fan la diversidad de la poblaci\u00f3n; los valores de arriba son los m\u00e1ximos", None))
+#endif // QT_CONFIG(tooltip)
+        self.adaptive_rates_checkbox.setText(QCoreApplication.translate("ConfigPanelWidget", u"Tasas adaptativas (diversidad)", None))
+        self.label_adaptive_min.setText(QCoreApplication.translate("ConfigPanelWidget", u"M\u00edn. cruza/PMI/PMG:", None))
+        self.label_history_mode.setText(QCoreApplication.translate("ConfigPanelWidget", u"Historial:", None))
+        self.history_mode_combo.setItemText(0, QCoreApplication.translate("ConfigPanelWidget", u"Completo", None))
+        self.history_mode_combo.setItemText(1, QCoreApplication.translate("ConfigPanelWidget", u"Cada k generaciones", None))
+        self.history_mode_combo.setItemText(2, QCoreApplication.translate("ConfigPanelWidget", u"Solo mejoras", None))
+        self.history_mode_combo.setItemText(3, QCoreApplication.translate("ConfigPanelWidget", u"Muestra por generaci\u00f3n", None))
+        self.history_mode_combo.setItemText(4, QCoreApplication.translate("ConfigPanelWidget", u"Solo estad\u00edsticas", None))
+
+#if QT_CONFIG(tooltip)
+        self.history_mode_combo.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Qu\u00e9 poblaciones se guardan; las estad\u00edsticas y el mejor fitness se guardan siempre", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.history_param_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"k (cada k generaciones) o individuos por generaci\u00f3n (muestra)", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_elite_count.setText(QCoreApplication.translate("ConfigPanelWidget", u"\u00c9lites:", None))
+#if QT_CONFIG(tooltip)
+        self.elite_count_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Mejores individuos que pasan intactos a la siguiente generaci\u00f3n, sin reevaluarse (0 = sin elitismo)", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.niching_checkbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Crowding determinista: cada hijo compite con el padre m\u00e1s cercano, de modo que la poblaci\u00f3n conserva varios \u00f3ptimos; se marcan en la gr\u00e1fica de la funci\u00f3n objetivo", None))
+#endif // QT_CONFIG(tooltip)
+        self.niching_checkbox.setText(QCoreApplication.translate("ConfigPanelWidget", u"Nichos (varios \u00f3ptimos)", None))
+#if QT_CONFIG(tooltip)
+        self.memetic_checkbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Cada k generaciones los mejores individuos dan pasos de Newton (o de gradiente) con la derivada simb\u00f3lica de f y vuelven a la poblaci\u00f3n ya refinados", None))
+#endif // QT_CONFIG(tooltip)
+        self.memetic_checkbox.setText(QCoreApplication.translate("ConfigPanelWidget", u"Refinamiento local (derivada)", None))
+        self.label_memetic.setText(QCoreApplication.translate("ConfigPanelWidget", u"Cada k / mejores / pasos:", None))
+#if QT_CONFIG(tooltip)
+        self.memetic_interval_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Refinar cada k generaciones", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.memetic_top_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Mejores individuos refinados cada vez", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.memetic_steps_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Pasos de Newton/gradiente por individuo", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.adaptive_min_crossover_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"Probabilidad de cruzamiento m\u00ednima", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.adaptive_min_mutation_i_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"PMI m\u00ednima", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.adaptive_min_mutation_g_spinbox.setToolTip(QCoreApplication.translate("ConfigPanelWidget", u"PMG m\u00ednima", None))
+#endif // QT_CONFIG(tooltip)
         self.label_mode.setText(QCoreApplication.translate("ConfigPanelWidget", u"Modo:", None))
         self.minimize_radio.setText(QCoreApplication.translate("ConfigPanelWidget", u"Minimizar", None))
         self.maximize_radio.setText(QCoreApplication.translate("ConfigPanelWidget", u"Maximizar", None))
@@ -324,10 +571,14 @@ class Ui_ConfigPanelWidget(object):
         self.objectiveGraphButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Funci\u00f3n Objetivo", None))
         self.bestEvolutionGraphButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Evoluci\u00f3n Mejor", None))
         self.allEvolutionGraphButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Evoluci\u00f3n Poblaci\u00f3n", None))
+        self.statisticsGraphButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Estad\u00edsticas", None))
         self.animatedEvolutionButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Evoluci\u00f3n Animada", None))
         self.actionsGroup.setTitle(QCoreApplication.translate("ConfigPanelWidget", u"Acciones", None))
         self.generateReportButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Generar Reporte", None))
         self.downloadAnimationButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Descargar Animaci\u00f3n", None))
+        self.saveRunButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Guardar Ejecuci\u00f3n", None))
+        self.openRunButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Abrir Ejecuci\u00f3n", None))
+        self.runRegistryButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Historial de Ejecuciones", None))
         self.clearResultsButton.setText(QCoreApplication.translate("ConfigPanelWidget", u"Limpiar Resultados", None))
     # retranslateUi
 
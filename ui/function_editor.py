@@ -12,13 +12,24 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 import numpy as np
-from sympy import symbols, sympify, lambdify, SympifyError
+from sympy import SympifyError
+
+# CustomFunctionProvider vive en utils.function_provider para poder usarse en procesos
+# trabajadores sin importar la interfaz; se re-exporta aquí por compatibilidad.
+from utils.function_provider import CustomFunctionProvider, compile_function_text
+from utils.curve_sampling import sample_function_curve
 
 class FunctionEditor(QDialog):
-    def __init__(self, parent, callback_function=None, initial_function=None):
+    DEFAULT_PREVIEW_INTERVAL = (-10.0, 10.0)
+
+    def __init__(self, parent, callback_function=None, initial_function=None, preview_interval=None):
         super().__init__(parent)
         self.callback_function = callback_function
+        # Intervalo de la gráfica de vista previa (el del AG, si lo indica quien abre el editor)
+        self.preview_interval = preview_interval or self.DEFAULT_PREVIEW_INTERVAL
         self.default_function = "ln(1+abs(x^7)) + pi*cos(x) + sin(15.5*x)"
         current_initial = initial_function if initial_function is not None else self.default_function
         self.compiled_function_result = None
@@ -84,6 +95,12 @@ class FunctionEditor(QDialog):
         self.preview_label.setFont(QFont("Consolas", 14))
         main_layout.addWidget(self.preview_label)
 
+        # Gráfica de vista previa (misma curva cacheada que la gráfica de la función objetivo)
+        self.preview_figure = Figure(figsize=(6, 2))
+        self.preview_canvas = FigureCanvasQTAgg(self.preview_figure)
+        self.preview_canvas.setMinimumHeight(160)
+        main_layout.addWidget(self.preview_canvas)
+
         # Validation
         self.validation_label = QLabel("...")
         main_layout.addWidget(self.validation_label)
@@ -129,7 +146,33 @@ class FunctionEditor(QDialog):
 
     def update_preview_and_validate(self):
         self.update_preview()
-        self.validate_function()
+        if self.validate_function():
+            self.update_preview_plot()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.validate_function():
+            self.update_preview_plot()
+
+    def update_preview_plot(self):
+        """Dibuja f(x) en el intervalo de vista previa; solo si el diálogo está visible"""
+        if not self.isVisible():
+            return
+        self.preview_figure.clear()
+        ax = self.preview_figure.add_subplot(111)
+        x_min, x_max = self.preview_interval
+        try:
+            provider = CustomFunctionProvider(self.function_entry.text())
+            x_vals, y_vals = sample_function_curve(provider, x_min, x_max)
+            ax.plot(x_vals, y_vals, 'b-', linewidth=1.5)
+        except Exception as e:
+            ax.text(0.5, 0.5, f"Sin vista previa: {type(e).__name__}",
+                    ha='center', va='center', transform=ax.transAxes)
+        ax.set_xlim(x_min, x_max)
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='both', which='major', labelsize=8)
+        self.preview_figure.tight_layout()
+        self.preview_canvas.draw_idle()
 
     def update_preview(self):
         func_text = self.function_entry.text()
@@ -147,12 +190,8 @@ class FunctionEditor(QDialog):
             self.validation_label.setStyleSheet("color: orange;")
             return False
         try:
-            eval_text = func_text.replace('π', 'pi').replace('^', '**').replace('ln(', 'log(')
-            x = symbols('x')
-            expr = sympify(eval_text)
-            self.compiled_function_result = lambdify(
-                x, expr, ['numpy', {'ln': np.log, 'log': np.log10, 'abs': np.abs, 'sign': np.sign}]
-            )
+            # Misma compilación que usa el proveedor, así se valida exactamente lo que evaluará el AG
+            self.compiled_function_result = compile_function_text(func_text)
             test_value = np.array([1.5, 0.0, -1.5])
             result = self.compiled_function_result(test_value)
             if np.all(np.isfinite(result)) and not np.any(np.isnan(result)):
@@ -179,45 +218,3 @@ class FunctionEditor(QDialog):
             self.accept()
         else:
             QMessageBox.critical(self, "Error de Validación", "La función no es válida.")
-
-# Adaptador para math_functions.py
-class CustomFunctionProvider:
-    def __init__(self):
-        self.function_text = "ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)"
-        self.compiled_function = None
-        self._compile_current_function()
-
-    def _compile_current_function(self):
-        try:
-            eval_text = self.function_text.replace('π', 'pi').replace('^', '**').replace('ln(','log(')
-            x_sym = symbols('x')
-            expr = sympify(eval_text)
-            numpy_modules = ['numpy', {'abs': np.abs, 'sign': np.sign}]
-            self.compiled_function = lambdify(x_sym, expr, modules=numpy_modules)
-        except Exception:
-            print(f"Warning: Failed to compile '{self.function_text}'. Using x**2 as fallback.")
-            x_sym = symbols('x')
-            self.compiled_function = lambdify(x_sym, x_sym**2, modules=['numpy'])
-
-    def set_function(self, text, compiled_func):
-        self.function_text = text
-        self.compiled_function = compiled_func
-
-    def evaluate(self, x_val, is_minimizing):
-        if not self.compiled_function:
-            self._compile_current_function()
-            if not self.compiled_function:
-                raise ValueError("Función objetivo no compilada o no válida.")
-        raw_value = self.get_raw_function_value(x_val)
-        return -raw_value if is_minimizing else raw_value
-
-    def get_raw_function_value(self, x_val):
-        if not self.compiled_function:
-            self._compile_current_function()
-            if not self.compiled_function:
-                raise ValueError("Función objetivo no compilada o no válida.")
-        try:
-            return float(self.compiled_function(x_val))
-        except Exception as e:
-            print(f"Error evaluating function '{self.function_text}' at x={x_val}: {e}")
-            return np.nan
\ No newline at end of file
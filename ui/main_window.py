@@ -7,7 +7,8 @@
 Ventana principal de la aplicación - Visualizador de Resultados de AG (Versión PySide6)
 """
 
-from PySide6.QtWidgets import QMainWindow, QWidget, QSplitter, QMessageBox, QVBoxLayout, QFileDialog, QProgressDialog, QApplication
+import os
+from PySide6.QtWidgets import QMainWindow, QWidget, QSplitter, QMessageBox, QVBoxLayout, QFileDialog, QProgressDialog, QApplication, QInputDialog
 from PySide6.QtCore import Qt, QUrl
 # from PySide6.QtGui import QDesktopServices # No se usa directamente aquí si open_file lo maneja
 
@@ -15,6 +16,8 @@ from PySide6.QtCore import Qt, QUrl
 from ui.config_panel import ConfigPanel
 from ui.visualization_panel import VisualizationPanel # Asumimos que este es PySide6
 from utils.export import ReportGenerator, AnimationGenerator
+from utils.run_archive import save_run_archive, load_run_archive, RUN_ARCHIVE_FILTER
+from utils.run_registry import get_run_registry
 from utils.math_functions import set_function_provider
 # Asegúrate que CustomFunctionProvider es la versión adaptada para PySide6/Sympy
 from ui.function_editor import CustomFunctionProvider, FunctionEditor # Asumimos que FunctionEditor es PySide6
@@ -23,8 +26,13 @@ from utils.helpers import open_file # Usaremos el helper para abrir archivos
 class MainWindow(QMainWindow):
     """Clase principal que maneja la ventana y coordina los componentes (PySide6)"""
 
-    def __init__(self):
-        """Inicializa la ventana principal y sus componentes"""
+    def __init__(self, function_provider=None):
+        """Inicializa la ventana principal y sus componentes
+
+        Args:
+            function_provider: Proveedor de la función objetivo (por defecto, uno
+                editable CustomFunctionProvider; puede ser un ExternalFunctionProvider).
+        """
         super().__init__()
         self.setWindowTitle("Algoritmo Genético - Visualizador de Resultados (PySide6)")
         self.setGeometry(100, 100, 1400, 800)
@@ -34,10 +42,13 @@ class MainWindow(QMainWindow):
         self.population_history = []
         self.fitness_history = []
         self.best_fitness_history = []
+        # Identificador de la ejecución mostrada (clave de la caché de figuras)
+        self.run_id = 0
+        self.registry_run_id = None
 
         self.report_generator = ReportGenerator()
         self.animation_generator = AnimationGenerator() # Asegúrate que usa QMessageBox/QProgressDialog
-        self.ui_function_provider = CustomFunctionProvider()
+        self.ui_function_provider = function_provider or CustomFunctionProvider()
         set_function_provider(self.ui_function_provider)
 
         self.ga_executor = None
@@ -88,53 +99,87 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", "No se ha configurado un ejecutor de Algoritmo Genético.")
             return
 
-        progress_dialog = QProgressDialog("Ejecutando AG...", "Cancelar", 0, 0, self)
+        # Con varias semillas la barra avanza por semilla terminada
+        num_seeds = int(params.get('num_seeds', 1) or 1)
+        progress_maximum = num_seeds if num_seeds > 1 else params['num_generations']
+        progress_dialog = QProgressDialog("Ejecutando AG...", "Cancelar", 0, progress_maximum, self)
         progress_dialog.setWindowModality(Qt.WindowModal)
         progress_dialog.setWindowTitle("Procesando")
         progress_dialog.show()
 
+        # Convergencia en vivo: el panel agrupa los redibujados a una tasa fija,
+        # y la barra de progreso se actualiza solo cuando el panel redibuja.
+        if self.visualization_panel and num_seeds == 1:
+            self.visualization_panel.start_live_plot(params['is_minimizing'], params['num_generations'])
+
+        def on_generation(record):
+            if self.visualization_panel and self.visualization_panel.update_live_plot(record):
+                progress_dialog.setValue(record.generation + 1)
+
+        def on_seeds(partial_summary):
+            # Bandas parciales a medida que terminan las semillas
+            if self.visualization_panel:
+                self.visualization_panel.show_seed_bands(partial_summary, params['is_minimizing'], num_seeds)
+            progress_dialog.setValue(partial_summary['seeds_done'])
+
         try:
-            results = self.ga_executor(params, self)
+            results = self.ga_executor(params, self, generation_callback=on_generation, seeds_callback=on_seeds)
+            if self.visualization_panel:
+                self.visualization_panel.finish_live_plot()
 
             if results is None:
                 progress_dialog.close()
                 return
 
-            self.ga_results = results['ga_results']
-            self.population_history = results['population_history']
-            self.fitness_history = results['fitness_history']
-            self.best_fitness_history = results['best_fitness_history']
-
-            function_text_from_ga = self.ga_results.get('function_text_for_report')
-            if function_text_from_ga and self.config_panel: # Verificar config_panel
-                # Asumiendo que FunctionEditor es un QDialog
-                temp_editor = FunctionEditor(self)
-                if hasattr(temp_editor, 'function_entry'):
-                    temp_editor.function_entry.setText(function_text_from_ga)
-                    is_valid = temp_editor.validate_function()
-                    if is_valid and hasattr(temp_editor, 'compiled_function_result'):
-                        self.ui_function_provider.set_function(function_text_from_ga, temp_editor.compiled_function_result)
-                        self.config_panel.update_function_display()
-                    elif not is_valid:
-                        QMessageBox.critical(self, "Error de Función", "La función reportada por el AG no pudo ser validada por la UI.")
-                else:
-                    QMessageBox.warning(self, "Advertencia", "Editor de funciones no compatible para actualización automática.")
+            self._apply_results(results)
 
             if self.config_panel: self.config_panel.enable_buttons()
             mode_text = "Minimización" if params['is_minimizing'] else "Maximización"
+            cache_text = "\n\n(Resultado reutilizado desde la caché)" if results.get('cache_hit') else ""
             QMessageBox.information(self, "Completado",
                                 f"Algoritmo de ejemplo completado! ({mode_text})\n\n"
                                 f"Mejor solución: x = {self.ga_results['best_x']:.6f}\n"
-                                f"Mejor fitness (real): f(x) = {self.ga_results['best_fitness']:.6f}")
+                                f"Mejor fitness (real): f(x) = {self.ga_results['best_fitness']:.6f}"
+                                f"{cache_text}")
 
         except Exception as e:
             QMessageBox.critical(self, "Error en AG", f"Error durante la ejecución del AG: {str(e)}")
             import traceback
             traceback.print_exc()
         finally:
+            if self.visualization_panel:
+                self.visualization_panel.finish_live_plot()
             progress_dialog.close()
 
 
+    def _apply_results(self, results):
+        """Muestra un diccionario de resultados (de una ejecución o de un archivo)"""
+        self.ga_results = results['ga_results']
+        self.population_history = results['population_history']
+        self.fitness_history = results['fitness_history']
+        self.best_fitness_history = results['best_fitness_history']
+        # Id de la ejecución en el registro (None para ejecuciones no registradas)
+        self.registry_run_id = results.get('registry_id')
+        self.run_id += 1
+        if self.visualization_panel:
+            self.visualization_panel.invalidate_figure_cache()
+
+        function_text_from_ga = self.ga_results.get('function_text_for_report')
+        # Solo los proveedores editables (expresiones) se sincronizan con el texto del AG
+        if function_text_from_ga and self.config_panel and hasattr(self.ui_function_provider, 'set_function'):
+            # Asumiendo que FunctionEditor es un QDialog
+            temp_editor = FunctionEditor(self)
+            if hasattr(temp_editor, 'function_entry'):
+                temp_editor.function_entry.setText(function_text_from_ga)
+                is_valid = temp_editor.validate_function()
+                if is_valid and hasattr(temp_editor, 'compiled_function_result'):
+                    self.ui_function_provider.set_function(function_text_from_ga, temp_editor.compiled_function_result)
+                    self.config_panel.update_function_display()
+                elif not is_valid:
+                    QMessageBox.critical(self, "Error de Función", "La función reportada por el AG no pudo ser validada por la UI.")
+            else:
+                QMessageBox.warning(self, "Advertencia", "Editor de funciones no compatible para actualización automática.")
+
     def generate_report(self):
         if not self.ga_results:
             QMessageBox.warning(self, "Advertencia", "No hay resultados para generar el reporte.")
@@ -146,10 +191,11 @@ class MainWindow(QMainWindow):
         if not filename: return False
 
         try:
-            self.report_generator.generate(
-                filename, self.ga_results, self.best_fitness_history
+            written_files = self.report_generator.generate(
+                filename, self.ga_results, self.best_fitness_history,
+                self.population_history, self.fitness_history
             )
-            QMessageBox.information(self, "Reporte Guardado", f"Reporte guardado en:\n{filename}")
+            QMessageBox.information(self, "Reporte Guardado", "Reporte guardado en:\n" + "\n".join(written_files))
             if QMessageBox.question(self, "Abrir Reporte", "¿Desea abrir el reporte generado?") == QMessageBox.Yes:
                 # utils.helpers.open_file debe ser compatible con PySide6 (no usar tkinter.messagebox)
                 if not open_file(filename):
@@ -165,6 +211,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Advertencia", "Primero debe ejecutar el algoritmo.")
             return False
 
+        animation_modes = ["Evolución del mejor fitness", "Población sobre la función objetivo"]
+        animate_population = False
+        if len(self.population_history) > 0:
+            mode, ok = QInputDialog.getItem(self, "Tipo de Animación", "Animar:", animation_modes, 0, False)
+            if not ok:
+                return False
+            animate_population = mode == animation_modes[1]
+
         filename, selected_filter = QFileDialog.getSaveFileName(
             self, "Guardar Animación", "", "MP4 files (*.mp4);;GIF files (*.gif);;All files (*.*)"
         )
@@ -178,12 +232,20 @@ class MainWindow(QMainWindow):
         QApplication.processEvents()  # Asegura que el diálogo se muestre
     
         try:
-            # LLAMADA SIN EL 5to ARGUMENTO
-            result_info = self.animation_generator.generate(
-                filename,
-                self.best_fitness_history,
-                self.ga_results['is_minimizing']
-            )
+            if animate_population:
+                result_info = self.animation_generator.generate_population(
+                    filename,
+                    self.ga_results,
+                    self.population_history,
+                    self.fitness_history,
+                    self.best_fitness_history
+                )
+            else:
+                result_info = self.animation_generator.generate(
+                    filename,
+                    self.best_fitness_history,
+                    self.ga_results['is_minimizing']
+                )
             progress_dialog_anim.close()
     
             if result_info and result_info.get("success"):
@@ -205,13 +267,106 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error de Animación", f"Excepción al generar la animación: {str(e)}")
             return False
 
+    def save_run(self):
+        if not self.ga_results:
+            QMessageBox.warning(self, "Advertencia", "No hay resultados para guardar.")
+            return False
+        filename, _ = QFileDialog.getSaveFileName(self, "Guardar Ejecución", "", RUN_ARCHIVE_FILTER)
+        if not filename:
+            return False
+        if not filename.endswith('.npz'):
+            filename += '.npz'
+        try:
+            save_run_archive(filename, self.ga_results, self.population_history,
+                             self.fitness_history, self.best_fitness_history)
+            if self.registry_run_id is not None:
+                get_run_registry().set_archive_path(self.registry_run_id, os.path.abspath(filename))
+            QMessageBox.information(self, "Ejecución Guardada", f"Ejecución guardada en:\n{filename}")
+            return True
+        except Exception as e:
+            QMessageBox.critical(self, "Error al Guardar", f"No se pudo guardar la ejecución: {str(e)}")
+            return False
+
+    def open_run(self, filename=None):
+        if filename is None:
+            filename, _ = QFileDialog.getOpenFileName(self, "Abrir Ejecución", "", RUN_ARCHIVE_FILTER)
+        if not filename:
+            return False
+        try:
+            # Los historiales quedan mapeados en memoria: se leen al graficar
+            self._apply_results(load_run_archive(filename))
+        except Exception as e:
+            QMessageBox.critical(self, "Error al Abrir", f"No se pudo abrir la ejecución: {str(e)}")
+            return False
+        if self.visualization_panel:
+            self.visualization_panel.clear_graph_area()
+            self.visualization_panel.create_welcome_message()
+        if self.config_panel:
+            self.config_panel.enable_buttons()
+            self.config_panel.update_graph_button_selection(None)
+        return True
+
+    def show_run_registry(self):
+        from ui.run_registry_dialog import RunRegistryDialog
+        try:
+            dialog = RunRegistryDialog(self, open_archive_callback=self.open_run)
+        except Exception as e:
+            QMessageBox.critical(self, "Historial de Ejecuciones", f"No se pudo abrir el registro: {str(e)}")
+            return
+        dialog.exec()
+
+    def tune_parameters(self, params: dict):
+        """Busca pop_size, cruza, PMI y PMG por reducción sucesiva y los carga en el panel"""
+        from algorithm.tuning import successive_halving, rung_sizes, DEFAULT_N_CONFIGS, DEFAULT_ETA
+
+        budget, ok = QInputDialog.getInt(
+            self, "Ajustar Parámetros", "Presupuesto (evaluaciones de la función objetivo):",
+            200000, 10000, 100000000, 10000
+        )
+        if not ok:
+            return
+
+        progress_dialog = QProgressDialog("Ajustando parámetros...", None, 0, len(rung_sizes(DEFAULT_N_CONFIGS, DEFAULT_ETA)), self)
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setWindowTitle("Procesando")
+        progress_dialog.show()
+        QApplication.processEvents()
+
+        def on_rung(rung):
+            progress_dialog.setValue(rung['rung'] + 1)
+            progress_dialog.setLabelText(f"Ronda {rung['rung'] + 1}: {len(rung['configs'])} configuraciones, "
+                                         f"{rung['generations']} generaciones")
+            QApplication.processEvents()
+
+        try:
+            result = successive_halving(params, budget, on_rung=on_rung, registry=get_run_registry())
+        except Exception as e:
+            QMessageBox.critical(self, "Ajustar Parámetros", f"No se pudo completar el ajuste: {str(e)}")
+            return
+        finally:
+            progress_dialog.close()
+
+        tuned = result['params']
+        if self.config_panel:
+            self.config_panel.set_params(tuned)
+        QMessageBox.information(self, "Parámetros Ajustados",
+                                f"Población: {tuned['pop_size']}\n"
+                                f"Prob. cruzamiento: {tuned['prob_crossover']:.2f}\n"
+                                f"PMI: {tuned['prob_mutation_i']:.2f}\n"
+                                f"PMG: {tuned['prob_mutation_g']:.2f}\n\n"
+                                f"Mejor fitness medio: {result['score']:.6f}\n"
+                                f"Evaluaciones usadas: {result['evaluations']} de {result['budget']}")
+
     def clear_results(self):
         self.ga_results = None
+        self.registry_run_id = None
         self.population_history = []
         self.fitness_history = []
         self.best_fitness_history = []
+        self.run_id += 1
         
         if self.visualization_panel:
+            self.visualization_panel.invalidate_figure_cache()
             self.visualization_panel.clear_graph_area()
             self.visualization_panel.create_welcome_message()
 
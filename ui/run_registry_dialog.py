@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Diálogo del registro de ejecuciones: lista, filtra y abre ejecuciones anteriores
+"""
+
+import os
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QPushButton, QLabel,
+    QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView, QMessageBox
+)
+from PySide6.QtCore import Qt
+
+from utils.run_registry import get_run_registry
+
+
+class RunRegistryDialog(QDialog):
+    """Tabla de ejecuciones registradas con filtros por función, modo y orden"""
+
+    # (columna del registro, encabezado)
+    COLUMNS = [
+        ('id', 'Id'), ('created_at', 'Fecha'), ('function_text', 'f(x)'), ('is_minimizing', 'Modo'),
+        ('x_min', 'a'), ('x_max', 'b'), ('delta_x', 'Δx'), ('pop_size', 'Población'),
+        ('num_generations', 'Generaciones'), ('prob_crossover', 'P. cruza'),
+        ('prob_mutation_i', 'PMI'), ('prob_mutation_g', 'PMG'), ('seed', 'Semilla'),
+        ('best_x', 'Mejor x'), ('best_fitness', 'Mejor f(x)'), ('duration_seconds', 'Duración (s)'),
+        ('archive_path', 'Archivo'),
+    ]
+    ORDER_OPTIONS = [
+        ('Más recientes', 'created_at', True), ('Mejor f(x) (mayor)', 'best_fitness', True),
+        ('Mejor f(x) (menor)', 'best_fitness', False), ('Más rápidas', 'duration_seconds', False),
+    ]
+    ROW_LIMIT = 500
+
+    def __init__(self, parent, open_archive_callback=None, registry=None):
+        super().__init__(parent)
+        self.registry = registry or get_run_registry()
+        self.open_archive_callback = open_archive_callback
+        self.rows = []
+
+        self.setWindowTitle("Historial de Ejecuciones")
+        self.setMinimumSize(1100, 550)
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Función contiene:"))
+        self.function_filter = QLineEdit()
+        self.function_filter.returnPressed.connect(self.refresh)
+        filter_layout.addWidget(self.function_filter)
+        self.mode_filter = QComboBox()
+        self.mode_filter.addItems(["Todos", "Minimización", "Maximización"])
+        self.mode_filter.currentIndexChanged.connect(self.refresh)
+        filter_layout.addWidget(self.mode_filter)
+        self.order_combo = QComboBox()
+        self.order_combo.addItems([label for label, _, _ in self.ORDER_OPTIONS])
+        self.order_combo.currentIndexChanged.connect(self.refresh)
+        filter_layout.addWidget(self.order_combo)
+        search_btn = QPushButton("Buscar")
+        search_btn.clicked.connect(self.refresh)
+        filter_layout.addWidget(search_btn)
+        main_layout.addLayout(filter_layout)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([header for _, header in self.COLUMNS])
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.doubleClicked.connect(self.open_selected)
+        main_layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        self.count_label = QLabel("")
+        button_layout.addWidget(self.count_label)
+        button_layout.addStretch()
+        open_btn = QPushButton("Abrir Ejecución")
+        open_btn.clicked.connect(self.open_selected)
+        button_layout.addWidget(open_btn)
+        close_btn = QPushButton("Cerrar")
+        close_btn.clicked.connect(self.reject)
+        button_layout.addWidget(close_btn)
+        main_layout.addLayout(button_layout)
+
+    def refresh(self):
+        filters = {}
+        mode_index = self.mode_filter.currentIndex()
+        if mode_index > 0:
+            filters['is_minimizing'] = mode_index == 1
+        _, order_by, descending = self.ORDER_OPTIONS[self.order_combo.currentIndex()]
+        self.rows = self.registry.query_runs(
+            function_contains=self.function_filter.text().strip() or None,
+            order_by=order_by, descending=descending, limit=self.ROW_LIMIT, **filters
+        )
+
+        self.table.setRowCount(len(self.rows))
+        for row_index, run in enumerate(self.rows):
+            for column_index, (column, _) in enumerate(self.COLUMNS):
+                item = QTableWidgetItem(self._format_value(column, run[column]))
+                if isinstance(run[column], (int, float)) and column != 'is_minimizing':
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row_index, column_index, item)
+        self.count_label.setText(f"{len(self.rows)} de {self.registry.count()} ejecuciones")
+
+    @staticmethod
+    def _format_value(column, value):
+        if value is None:
+            return ""
+        if column == 'is_minimizing':
+            return "Min" if value else "Max"
+        if column == 'archive_path':
+            return os.path.basename(value)
+        if isinstance(value, float):
+            return f"{value:.6g}"
+        return str(value)
+
+    def open_selected(self):
+        selected = self.table.selectionModel().selectedRows()
+        if not selected:
+            return
+        run = self.rows[selected[0].row()]
+        archive_path = run.get('archive_path')
+        if not archive_path or not os.path.exists(archive_path):
+            QMessageBox.information(self, "Sin Archivo",
+                                    "Esta ejecución no tiene un archivo guardado (use 'Guardar Ejecución').")
+            return
+        if self.open_archive_callback and self.open_archive_callback(archive_path):
+            self.accept()
@@ -5,24 +5,53 @@
 Panel de visualización de gráficas
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+import time
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QApplication
 from PySide6.QtCore import Qt, QTimer
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 import numpy as np
 import matplotlib.pyplot as plt
 
-from utils.math_functions import binary_to_decimal, get_function_provider
+from utils.math_functions import decode_population, get_function_provider
+from utils.curve_sampling import sample_function_curve
+from utils.export import compute_generation_statistics
+from algorithm.history import history_generation_numbers
 
 class VisualizationPanel(QWidget):
     """Clase que maneja el panel de visualización (derecho)"""
-    
+
+    # "Evolución Población": por encima de este número de puntos se usa el mapa de densidad
+    DENSITY_POINT_THRESHOLD = 200_000
+    DENSITY_X_BINS = 400
+    DENSITY_MAX_GEN_BINS = 500
+
+    # Animación: cuadros máximos, intervalos (ms) y límite para dibujar marcadores en la línea
+    ANIMATION_MAX_FRAMES = 400
+    ANIMATION_INTERVAL_MS = 200
+    ANIMATION_DECIMATED_INTERVAL_MS = 50
+    ANIMATION_MARKER_LIMIT = 200
+
+    # Gráfica en vivo durante la ejecución: redibujados agrupados a una tasa fija
+    # y, como máximo, LIVE_MAX_DRAW_FRACTION del tiempo dedicado a dibujar
+    LIVE_REFRESH_SECONDS = 0.1
+    LIVE_MAX_DRAW_FRACTION = 0.2
+    LIVE_HISTOGRAM_BINS = 30
+
+    # Caché de figuras de show_graph: máximo de entradas y de memoria estimada
+    FIGURE_CACHE_MAX_ENTRIES = 6
+    FIGURE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
     def __init__(self, parent, main_window):
         """Inicializa el panel de visualización"""
         super().__init__(parent)
         self.main_window = main_window
         self.current_canvas_widget = None
         self.current_figure = None
+        self._figure_cache = OrderedDict()  # (graph_type, run_id, función) -> (canvas, figure, bytes)
+        self._figure_cache_bytes = 0
         
         # Variables para animación
         self.is_animating = False
@@ -33,8 +62,22 @@ class VisualizationPanel(QWidget):
         self.anim_is_minimizing = True
         self.ax = None
         self.line = None
+        self.improvement_markers = None
         self.gen_text = None
         self.fitness_text = None
+        self.anim_x = np.empty(0)
+        self.anim_y = np.empty(0)
+        self.anim_improvement_indices = np.empty(0, dtype=int)
+        self.anim_frame_generations = np.empty(0, dtype=int)
+        self._anim_background = None
+        self._anim_draw_cid = None
+
+        # Variables para la gráfica en vivo
+        self.live_active = False
+        self.live_best = np.empty(0)
+        self.live_count = 0
+        self.live_last_fitness = None
+        self._live_next_draw = 0.0
 
         # Crear interfaz
         self.init_ui()
@@ -65,20 +108,99 @@ class VisualizationPanel(QWidget):
         self.current_canvas_widget = welcome_label
 
     def clear_graph_area(self):
-        """Limpia el área de gráficas"""
+        """Limpia el área de gráficas
+
+        Los lienzos que están en la caché de figuras solo se ocultan.
+        """
         self.stop_animation()
+        self.live_active = False
+        if self._anim_draw_cid is not None:
+            # El lienzo de la animación es siempre el actual hasta que se limpia el área
+            if self.current_canvas_widget is not None:
+                self.current_canvas_widget.mpl_disconnect(self._anim_draw_cid)
+            self._anim_draw_cid = None
+            self._anim_background = None
         if self.current_canvas_widget:
             self.layout.removeWidget(self.current_canvas_widget)
-            self.current_canvas_widget.deleteLater()
+            if self._is_cached_canvas(self.current_canvas_widget):
+                self.current_canvas_widget.hide()
+            else:
+                self.current_canvas_widget.deleteLater()
+                if self.current_figure:
+                    plt.close(self.current_figure)
             self.current_canvas_widget = None
-        if self.current_figure:
-            plt.close(self.current_figure)
-            self.current_figure = None
+        self.current_figure = None
+
+    # --- Caché de figuras por (tipo de gráfica, id de ejecución) ---
+    def _is_cached_canvas(self, widget):
+        return any(entry[0] is widget for entry in self._figure_cache.values())
+
+    def invalidate_figure_cache(self):
+        """Descarta todas las figuras cacheadas (nueva ejecución o resultados limpiados)"""
+        current = self.current_canvas_widget
+        for canvas, figure, _ in self._figure_cache.values():
+            if canvas is current:
+                continue  # el lienzo visible se libera al limpiar el área
+            canvas.deleteLater()
+            plt.close(figure)
+        cached_current = current is not None and self._is_cached_canvas(current)
+        self._figure_cache.clear()
+        self._figure_cache_bytes = 0
+        if cached_current:
+            self.clear_graph_area()
+
+    def _estimate_figure_bytes(self, figure):
+        """Estimación de memoria de una figura: búfer RGBA del lienzo + datos graficados"""
+        width, height = figure.get_size_inches() * figure.dpi
+        nbytes = int(width * height * 4)
+        for ax in figure.axes:
+            for line in ax.lines:
+                nbytes += np.asarray(line.get_xydata()).nbytes
+            for collection in ax.collections:
+                nbytes += np.asarray(collection.get_offsets()).nbytes
+                array = collection.get_array()
+                nbytes += array.nbytes if array is not None else 0
+            for image in ax.images:
+                nbytes += np.asarray(image.get_array()).nbytes
+        return nbytes
+
+    def _store_in_figure_cache(self, key, canvas, figure):
+        nbytes = self._estimate_figure_bytes(figure)
+        self._figure_cache[key] = (canvas, figure, nbytes)
+        self._figure_cache_bytes += nbytes
+        # Expulsar las menos usadas recientemente (nunca la que se acaba de añadir)
+        while len(self._figure_cache) > 1 and (
+            len(self._figure_cache) > self.FIGURE_CACHE_MAX_ENTRIES
+            or self._figure_cache_bytes > self.FIGURE_CACHE_MAX_BYTES
+        ):
+            _, (old_canvas, old_figure, old_bytes) = self._figure_cache.popitem(last=False)
+            self._figure_cache_bytes -= old_bytes
+            old_canvas.deleteLater()
+            plt.close(old_figure)
+
+    def show_graph(self, graph_type, ga_results, population_history, fitness_history, best_fitness_history,
+                   run_id=None):
+        """Muestra la gráfica seleccionada
 
-    def show_graph(self, graph_type, ga_results, population_history, fitness_history, best_fitness_history):
-        """Muestra la gráfica seleccionada"""
+        Con `run_id` la figura se cachea por (graph_type, run_id) y volver a una
+        gráfica ya vista es instantáneo. La gráfica de la función objetivo dibuja
+        el proveedor global actual, así que su clave incluye también el texto de
+        la función: si se edita, se vuelve a dibujar.
+        """
         # Limpiar área de gráficas
         self.clear_graph_area()
+
+        function_text = get_function_provider().function_text if graph_type == "objective" else None
+        key = (graph_type, run_id, function_text)
+        if run_id is not None and key in self._figure_cache:
+            self._figure_cache.move_to_end(key)
+            canvas, figure, _ = self._figure_cache[key]
+            self.current_figure = figure
+            self.layout.addWidget(canvas)
+            self.current_canvas_widget = canvas
+            canvas.show()
+            return
+
         self.current_figure = Figure(figsize=(14, 9), dpi=100)
         canvas = FigureCanvasQTAgg(self.current_figure)
 
@@ -88,10 +210,15 @@ class VisualizationPanel(QWidget):
             self._create_evolution_best_graph(self.current_figure, ga_results, best_fitness_history)
         elif graph_type == "evolution_all":
             self._create_evolution_all_graph(self.current_figure, ga_results, population_history, fitness_history)
+        elif graph_type == "statistics":
+            self._create_statistics_graph(self.current_figure, ga_results, population_history,
+                                          fitness_history, best_fitness_history)
 
         self.layout.addWidget(canvas)
         self.current_canvas_widget = canvas
         canvas.draw()
+        if run_id is not None:
+            self._store_in_figure_cache(key, canvas, self.current_figure)
 
     def _create_objective_graph(self, fig, ga_results):
         """Crea la gráfica de la función objetivo"""
@@ -99,7 +226,6 @@ class VisualizationPanel(QWidget):
         
         x_min = ga_results['x_min']
         x_max = ga_results['x_max']
-        x_vals = np.linspace(x_min, x_max, 1000)
         
         # Obtener la función personalizada para la etiqueta
         function_provider = get_function_provider()
@@ -110,8 +236,8 @@ class VisualizationPanel(QWidget):
         display_text = display_text.replace('*', '·')
         display_text = display_text.replace('pi', 'π')
         
-        # Usar el raw_function_value (siempre es positivo)
-        y_vals = [function_provider.get_raw_function_value(x) for x in x_vals]
+        # Curva muestreada en bloque y refinada donde hace falta (cacheada por función e intervalo)
+        x_vals, y_vals = sample_function_curve(function_provider, x_min, x_max)
         
         # Determinar el texto del modo
         mode_text = "Minimizando" if ga_results['is_minimizing'] else "Maximizando"
@@ -123,6 +249,19 @@ class VisualizationPanel(QWidget):
         ax.scatter([ga_results['best_x']], [ga_results['best_fitness']], 
                   color='red', s=200, zorder=5, 
                   label=f'f(x) = {ga_results["objective_function_raw"]:.3f}')
+        niches = ga_results.get('niches')
+        if niches:
+            # Óptimos de cada nicho (crowding): numerados del mejor al peor
+            niche_x = [niche['x'] for niche in niches]
+            niche_y = [niche['fitness'] for niche in niches]
+            omitted = ga_results.get('niches_omitted', 0)
+            niche_label = f'Nichos ({len(niches)}; {omitted} adicionales omitidos)' if omitted \
+                else f'Nichos ({len(niches)})'
+            ax.scatter(niche_x, niche_y, color='orange', edgecolors='black', marker='D', s=120,
+                       zorder=6, label=niche_label)
+            for i, (x, y) in enumerate(zip(niche_x, niche_y), 1):
+                ax.annotate(str(i), (x, y), textcoords='offset points', xytext=(0, 12),
+                            ha='center', fontsize=12, fontweight='bold')
         
         ax.set_xlabel('x', fontsize=16)
         ax.set_ylabel('f(x)', fontsize=16)
@@ -136,7 +275,14 @@ class VisualizationPanel(QWidget):
 
     def _create_evolution_best_graph(self, fig, ga_results, best_fitness_history):
         """Crea la gráfica de evolución del mejor individuo"""
-        ax = fig.add_subplot(111)
+        rate_history = ga_results.get('rate_history')
+        if rate_history:
+            # Tasas adaptativas: diversidad y probabilidades debajo, con el mismo eje x
+            grid = fig.add_gridspec(2, 1, height_ratios=[2, 1])
+            ax = fig.add_subplot(grid[0])
+            self._draw_rate_history(fig.add_subplot(grid[1], sharex=ax), rate_history)
+        else:
+            ax = fig.add_subplot(111)
         
         generations = range(len(best_fitness_history))
         y_vals = best_fitness_history.copy()
@@ -173,7 +319,13 @@ class VisualizationPanel(QWidget):
         ax.tick_params(axis='both', which='major', labelsize=12)
         
         # Añadir estadísticas
-        ax.text(0.02, 0.98, f'Mejora total: {improvement:.4f}', 
+        stats_text = f'Mejora total: {improvement:.4f}'
+        multi_seed = ga_results.get('multi_seed')
+        if multi_seed:
+            # Ejecución repetida: bandas de todas las semillas detrás de la ejecución mostrada
+            self._draw_seed_bands(ax, multi_seed)
+            stats_text += '\n' + self._seed_summary_text(multi_seed)
+        ax.text(0.02, 0.98, stats_text, 
                transform=ax.transAxes, fontsize=14, 
                verticalalignment='top', 
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
@@ -181,69 +333,255 @@ class VisualizationPanel(QWidget):
         # Ajustar márgenes
         fig.tight_layout()
 
-    def _create_evolution_all_graph(self, fig, ga_results, population_history, fitness_history):
-        """Crea la gráfica de evolución de toda la población"""
+    def _draw_rate_history(self, ax, rate_history):
+        """Diversidad de la población y tasas adaptativas por generación"""
+        labels = {'diversity': 'Diversidad', 'prob_crossover': 'Prob. cruzamiento',
+                  'prob_mutation_i': 'PMI', 'prob_mutation_g': 'PMG'}
+        for name, label in labels.items():
+            values = rate_history.get(name)
+            if values is not None and len(values):
+                ax.plot(np.arange(len(values)), values, linewidth=2,
+                        linestyle='--' if name == 'diversity' else '-', label=label)
+        ax.set_xlabel('Generación', fontsize=14)
+        ax.set_ylabel('Tasa / diversidad', fontsize=14)
+        ax.set_ylim(0, 1)
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='upper right', fontsize=10, ncol=4)
+
+    def _draw_seed_bands(self, ax, seed_summary):
+        """Mediana y bandas de percentiles (simétricas alrededor de la mediana) de varias semillas"""
+        bands = np.asarray(seed_summary['bands'], dtype=float)
+        percentiles = list(seed_summary['percentiles'])
+        if bands.size == 0:
+            return
+        generations = np.arange(bands.shape[1])
+        n_pairs = len(percentiles) // 2
+        for i in range(n_pairs):
+            low, high = percentiles[i], percentiles[-1 - i]
+            ax.fill_between(generations, bands[i], bands[-1 - i], color='tab:blue',
+                            alpha=0.15 + 0.15 * i, linewidth=0, label=f'Percentiles {low:g}–{high:g}')
+        if len(percentiles) % 2:
+            ax.plot(generations, bands[n_pairs], color='tab:blue', linewidth=2, label='Mediana')
+        ax.legend(loc='lower right', fontsize=12)
+
+    @staticmethod
+    def _seed_summary_text(seed_summary):
+        text = (f"Semillas: {seed_summary.get('seeds_done', seed_summary['n_seeds'])}"
+                f" | Éxito: {100 * seed_summary['success_rate']:.0f}%")
+        if seed_summary.get('median_generations_to_target') is not None:
+            text += f"\nGeneraciones hasta el objetivo (mediana): {seed_summary['median_generations_to_target']:.0f}"
+        return text
+
+    def show_seed_bands(self, seed_summary, is_minimizing, n_seeds=None):
+        """Dibuja (o redibuja) las bandas parciales mientras terminan las semillas"""
+        self.clear_graph_area()
+        self.current_figure = Figure(figsize=(14, 9), dpi=100)
+        canvas = FigureCanvasQTAgg(self.current_figure)
+        ax = self.current_figure.add_subplot(111)
+        mode_text = "Minimizando" if is_minimizing else "Maximizando"
+        done = seed_summary.get('seeds_done', seed_summary['n_seeds'])
+        total = n_seeds or seed_summary['n_seeds']
+        ax.set_title(f'Convergencia de {done}/{total} semillas ({mode_text})', fontsize=18, fontweight='bold')
+        ax.set_xlabel('Generación', fontsize=16)
+        ax.set_ylabel('Mejor Fitness (Valor real de f(x))', fontsize=16)
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='both', which='major', labelsize=12)
+        self._draw_seed_bands(ax, seed_summary)
+        ax.text(0.02, 0.98, self._seed_summary_text(seed_summary), transform=ax.transAxes, fontsize=14,
+                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        self.current_figure.tight_layout()
+        self.layout.addWidget(canvas)
+        self.current_canvas_widget = canvas
+        canvas.draw()
+        QApplication.processEvents()
+
+    def _decode_population_history(self, ga_results, population_history):
+        """Decodifica todo el historial a un arreglo (generaciones, individuos) de valores x.
+
+        Se decodifica generación a generación para no materializar el historial
+        completo de bits como flotantes.
+        """
+        if len(population_history) == 0:
+            return np.empty((0, 0))
+        return np.array([
+            decode_population(gen_pop, ga_results['x_min'], ga_results['x_max'], ga_results['n_bits'])
+            for gen_pop in population_history
+        ])
+
+    def _create_evolution_all_graph(self, fig, ga_results, population_history, fitness_history, density_mode=None):
+        """Crea la gráfica de evolución de toda la población
+
+        Con historiales grandes (más de DENSITY_POINT_THRESHOLD puntos) se dibuja un
+        mapa de densidad: (x, generación) se agrupa en celdas con NumPy y se muestra
+        con un solo imshow. `density_mode` fuerza el modo: None (automático),
+        'scatter', 'best' (mejor fitness por celda) o 'count' (individuos por celda).
+        """
         ax = fig.add_subplot(111)
-        
-        # Preparar datos
-        all_x_values = []
-        generation_numbers = []
-        all_fitness_values = []
-        
-        for gen, (gen_pop, fitness_scores) in enumerate(zip(population_history, fitness_history)):
-            for individual, fitness in zip(gen_pop, fitness_scores):
-                x_val = binary_to_decimal(individual, 
-                                         ga_results['x_min'], 
-                                         ga_results['x_max'], 
-                                         ga_results['n_bits'])
-                all_x_values.append(x_val)
-                generation_numbers.append(gen)
-                all_fitness_values.append(fitness)
-        
-        # Crear scatter plot
-        scatter = ax.scatter(all_x_values, generation_numbers, 
-                           c=all_fitness_values, cmap='viridis', 
-                           alpha=0.7, s=60)
-        
+        is_minimizing = ga_results['is_minimizing']
+
+        if len(population_history) == 0:
+            # Ejecución en modo 'stats': no hay poblaciones que dibujar
+            ax.text(0.5, 0.5, 'Sin historial de población (modo solo estadísticas)\n'
+                    'Ver la gráfica "Estadísticas"', transform=ax.transAxes,
+                    ha='center', va='center', fontsize=16)
+            ax.set_axis_off()
+            return
+
+        # Preparar datos (vectorizado): matrices (generaciones, individuos)
+        x_matrix = self._decode_population_history(ga_results, population_history)
+        fitness_matrix = np.asarray(fitness_history, dtype=float).reshape(x_matrix.shape)
+        n_generations = x_matrix.shape[0]
+        # Con historial parcial (cada k, solo mejoras) cada fila es una generación guardada
+        generations = history_generation_numbers(ga_results, n_generations)
+
+        if density_mode is None:
+            density_mode = 'best' if x_matrix.size > self.DENSITY_POINT_THRESHOLD else 'scatter'
+
+        if density_mode == 'scatter':
+            generation_numbers = np.broadcast_to(generations[:, None], x_matrix.shape)
+            mappable = ax.scatter(x_matrix.ravel(), generation_numbers.ravel(),
+                                  c=fitness_matrix.ravel(), cmap='viridis',
+                                  alpha=0.7, s=60)
+            colorbar_label = 'Fitness (Valor real de f(x))'
+        else:
+            mappable = self._draw_density_raster(ax, ga_results, x_matrix, fitness_matrix, density_mode,
+                                                 generations)
+            colorbar_label = ('Individuos por celda' if density_mode == 'count'
+                              else 'Mejor fitness por celda (Valor real de f(x))')
+
         # Colorbar
-        fig.colorbar(scatter, ax=ax).set_label('Fitness (Valor real de f(x))', fontsize=14)
-        
-        # Línea del mejor de cada generación
-        best_x_history = []
-        for gen_pop, fitness_scores in zip(population_history, fitness_history):
-            if ga_results['is_minimizing']:
+        fig.colorbar(mappable, ax=ax).set_label(colorbar_label, fontsize=14)
+
+        # Línea del mejor de cada generación (siempre por encima del mapa)
+        if n_generations and x_matrix.shape[1]:
+            if is_minimizing:
                 # Para minimización, el mejor es el mínimo
-                best_idx = fitness_scores.index(min(fitness_scores))
+                best_idx = np.argmin(np.where(np.isnan(fitness_matrix), np.inf, fitness_matrix), axis=1)
             else:
                 # Para maximización, el mejor es el máximo
-                best_idx = fitness_scores.index(max(fitness_scores))
-                
-            best_x = binary_to_decimal(gen_pop[best_idx], 
-                                      ga_results['x_min'], 
-                                      ga_results['x_max'], 
-                                      ga_results['n_bits'])
-            best_x_history.append(best_x)
-        
-        ax.plot(best_x_history, range(len(best_x_history)), 
-               'r-', linewidth=3, alpha=0.8, label='Trayectoria del mejor')
-        
+                best_idx = np.argmax(np.where(np.isnan(fitness_matrix), -np.inf, fitness_matrix), axis=1)
+            best_x_history = x_matrix[np.arange(n_generations), best_idx]
+            ax.plot(best_x_history, generations,
+                   'r-', linewidth=3, alpha=0.8, label='Trayectoria del mejor', zorder=5)
+
         # Determinar el texto del modo
-        mode_text = "Minimizando" if ga_results['is_minimizing'] else "Maximizando"
-        
+        mode_text = "Minimizando" if is_minimizing else "Maximizando"
+
         ax.set_xlabel('x', fontsize=16)
         ax.set_ylabel('Generación', fontsize=16)
-        ax.set_title(f'Evolución de Toda la Población ({mode_text})', fontsize=18, fontweight='bold')
+        title = f'Evolución de Toda la Población ({mode_text})'
+        if ga_results.get('history_mode', 'full') != 'full':
+            title += f'\nHistorial parcial: {n_generations} de {ga_results["generations"]} generaciones'
+            if ga_results['history_mode'] == 'reservoir':
+                title += f', {x_matrix.shape[1]} individuos por generación'
+        ax.set_title(title, fontsize=18, fontweight='bold')
         ax.legend(fontsize=14)
         ax.grid(True, alpha=0.3)
         ax.tick_params(axis='both', which='major', labelsize=12)
-        
+
         # Ajustar márgenes
         fig.tight_layout()
 
+    def _create_statistics_graph(self, fig, ga_results, population_history, fitness_history,
+                                 best_fitness_history):
+        """Estadísticas por generación: fitness (mejor/media/mediana/peor ± desviación) y diversidad"""
+        stats = compute_generation_statistics(ga_results, population_history, fitness_history,
+                                              best_fitness_history)
+        mode_text = "Minimizando" if ga_results['is_minimizing'] else "Maximizando"
+        has_diversity = 'hamming_diversity' in stats or 'unique_genomes' in stats
+        if has_diversity:
+            grid = fig.add_gridspec(2, 1, height_ratios=[2, 1])
+            ax = fig.add_subplot(grid[0])
+        else:
+            ax = fig.add_subplot(111)
+
+        generations = np.arange(len(stats['best_fitness']))
+        if 'mean_fitness' in stats and 'std_fitness' in stats:
+            mean, std = stats['mean_fitness'], stats['std_fitness']
+            ax.fill_between(generations[:len(mean)], mean - std, mean + std, color='tab:blue',
+                            alpha=0.2, linewidth=0, label='Media ± desviación')
+        curves = (('best_fitness', 'Mejor', 'g-'), ('mean_fitness', 'Media', 'b-'),
+                  ('median_fitness', 'Mediana', 'c--'), ('worst_fitness', 'Peor', 'r:'))
+        for name, label, style in curves:
+            if name in stats:
+                ax.plot(generations[:len(stats[name])], stats[name], style, linewidth=2, label=label)
+        ax.set_xlabel('Generación', fontsize=16)
+        ax.set_ylabel('Fitness (Valor real de f(x))', fontsize=16)
+        ax.set_title(f'Estadísticas por Generación ({mode_text})', fontsize=18, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='both', which='major', labelsize=12)
+        ax.legend(fontsize=12)
+
+        if has_diversity:
+            ax_div = fig.add_subplot(grid[1], sharex=ax)
+            if 'hamming_diversity' in stats:
+                ax_div.plot(generations[:len(stats['hamming_diversity'])], stats['hamming_diversity'],
+                            'm-', linewidth=2, label='Diversidad (Hamming)')
+                ax_div.set_ylim(0, max(0.5, float(np.nanmax(stats['hamming_diversity'])) * 1.05))
+            ax_div.set_xlabel('Generación', fontsize=14)
+            ax_div.set_ylabel('Diversidad', fontsize=14)
+            ax_div.grid(True, alpha=0.3)
+            handles, labels = ax_div.get_legend_handles_labels()
+            if 'unique_genomes' in stats:
+                # Genomas únicos en un segundo eje (escala 1..pop_size)
+                ax_unique = ax_div.twinx()
+                ax_unique.plot(generations[:len(stats['unique_genomes'])], stats['unique_genomes'],
+                               color='tab:orange', linewidth=2, label='Genomas únicos')
+                ax_unique.set_ylim(0, ga_results['pop_size'] * 1.05)
+                ax_unique.set_ylabel('Genomas únicos', fontsize=14)
+                extra_handles, extra_labels = ax_unique.get_legend_handles_labels()
+                handles, labels = handles + extra_handles, labels + extra_labels
+            ax_div.legend(handles, labels, loc='upper right', fontsize=10)
+
+        fig.tight_layout()
+
+    def _draw_density_raster(self, ax, ga_results, x_matrix, fitness_matrix, density_mode, generations=None):
+        """Agrupa (x, generación) en una malla 2-D y la dibuja con un solo imshow"""
+        x_min, x_max = ga_results['x_min'], ga_results['x_max']
+        if generations is None:
+            generations = np.arange(x_matrix.shape[0])
+        n_generations = int(generations[-1]) + 1 if len(generations) else 0
+        n_x_bins = self.DENSITY_X_BINS
+        n_gen_bins = max(1, min(n_generations, self.DENSITY_MAX_GEN_BINS))
+
+        # Índice de celda de cada punto
+        x_span = (x_max - x_min) or 1.0
+        x_idx = np.clip(((x_matrix - x_min) / x_span * n_x_bins).astype(np.intp), 0, n_x_bins - 1)
+        gen_idx = (generations * n_gen_bins // max(1, n_generations)).astype(np.intp)
+        cell = (gen_idx[:, None] * n_x_bins + x_idx).ravel()
+        n_cells = n_gen_bins * n_x_bins
+
+        if density_mode == 'count':
+            grid = np.bincount(cell, minlength=n_cells).astype(float)
+            grid[grid == 0] = np.nan
+        else:
+            values = fitness_matrix.ravel()
+            valid = np.isfinite(values)
+            cell, values = cell[valid], values[valid]
+            if ga_results['is_minimizing']:
+                grid = np.full(n_cells, np.inf)
+                np.minimum.at(grid, cell, values)
+            else:
+                grid = np.full(n_cells, -np.inf)
+                np.maximum.at(grid, cell, values)
+            grid[~np.isfinite(grid)] = np.nan
+
+        return ax.imshow(
+            np.ma.masked_invalid(grid.reshape(n_gen_bins, n_x_bins)),
+            origin='lower', aspect='auto', cmap='viridis', interpolation='nearest',
+            extent=(x_min, x_max, -0.5, n_generations - 0.5)
+        )
+
     def start_animation(self, best_fitness_history, is_minimizing):
-        """Inicia la animación paso a paso de la evolución"""
+        """Inicia la animación paso a paso de la evolución
+
+        La animación usa blitting: el fondo (ejes, rejilla, títulos) se dibuja una
+        vez y en cada paso solo se repintan la línea, los marcadores de mejora y
+        los textos. Con historiales largos se salta de generaciones para no superar
+        ANIMATION_MAX_FRAMES cuadros a una tasa fija.
+        """
         self.clear_graph_area()
-        if not best_fitness_history:
+        if len(best_fitness_history) == 0:
             return
         self.current_figure = Figure(figsize=(14, 9), dpi=100)
         canvas = FigureCanvasQTAgg(self.current_figure)
@@ -260,80 +598,216 @@ class VisualizationPanel(QWidget):
         self.ax.grid(True, alpha=0.3)
         self.ax.tick_params(axis='both', which='major', labelsize=12)
         
-        y_vals = best_fitness_history.copy()
-        
+        # Datos precalculados una sola vez
+        y_vals = np.asarray(best_fitness_history, dtype=float)
+        n_generations = len(y_vals)
+        self.anim_x = np.arange(n_generations)
+        self.anim_y = y_vals
+        if is_minimizing:
+            # Para minimización, mejora cuando el valor disminuye
+            improvement_mask = y_vals[1:] < y_vals[:-1]
+        else:
+            # Para maximización, mejora cuando el valor aumenta
+            improvement_mask = y_vals[1:] > y_vals[:-1]
+        self.anim_improvement_indices = np.flatnonzero(improvement_mask) + 1
+
+        # Generación mostrada en cada cuadro (submuestreo uniforme, siempre incluye la última)
+        step = int(np.ceil(n_generations / self.ANIMATION_MAX_FRAMES))
+        self.anim_frame_generations = np.unique(np.r_[np.arange(0, n_generations, step), n_generations - 1])
+
         # Configurar límites para mantener la gráfica estable
-        min_fitness = min(y_vals)
-        max_fitness = max(y_vals)
+        finite_vals = y_vals[np.isfinite(y_vals)]
+        min_fitness = finite_vals.min() if finite_vals.size else 0
+        max_fitness = finite_vals.max() if finite_vals.size else 1
         padding = (max_fitness - min_fitness) * 0.1 if max_fitness > min_fitness else 1
         self.ax.set_ylim(min_fitness - padding, max_fitness + padding)
-        self.ax.set_xlim(-1, len(best_fitness_history))
+        self.ax.set_xlim(-1, n_generations)
         
-        # Crear línea para la animación (inicialmente vacía)
-        self.line, = self.ax.plot([], [], 'g-', linewidth=3, marker='o', markersize=8)
+        # Artistas animados, creados una sola vez (excluidos del fondo cacheado)
+        marker = 'o' if n_generations <= self.ANIMATION_MARKER_LIMIT else None
+        self.line, = self.ax.plot([], [], 'g-', linewidth=3, marker=marker, markersize=8, animated=True)
+        self.improvement_markers = self.ax.scatter(np.empty(0), np.empty(0), color='orange', s=120,
+                                                   zorder=5, animated=True)
         
         # Añadir etiqueta de generación actual
         self.gen_text = self.ax.text(0.02, 0.98, 'Generación: 0', 
                                     transform=self.ax.transAxes, fontsize=14,
-                                    verticalalignment='top',
+                                    verticalalignment='top', animated=True,
                                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
         # Añadir etiqueta de fitness actual
-        self.fitness_text = self.ax.text(0.02, 0.90, f'Fitness: {best_fitness_history[0]:.4f}', 
+        self.fitness_text = self.ax.text(0.02, 0.90, f'Fitness: {y_vals[0]:.4f}', 
                                         transform=self.ax.transAxes, fontsize=14,
-                                        verticalalignment='top',
+                                        verticalalignment='top', animated=True,
                                         bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
         self.layout.addWidget(canvas)
         self.current_canvas_widget = canvas
+
+        # Fondo cacheado: se vuelve a capturar en cada redibujado completo (p. ej. al redimensionar)
+        self._anim_background = None
+        self._anim_draw_cid = canvas.mpl_connect('draw_event', self._on_animation_draw)
         
         # Iniciar animación
         self.animation_generation = 0
         self.is_animating = True
         self.anim_best_fitness_history = best_fitness_history
         self.anim_is_minimizing = is_minimizing
-        self.animation_timer.start(200)
+        interval = self.ANIMATION_INTERVAL_MS if step == 1 else self.ANIMATION_DECIMATED_INTERVAL_MS
         canvas.draw()
+        self.animation_timer.start(interval)
+
+    def _animation_artists(self):
+        return (self.line, self.improvement_markers, self.gen_text, self.fitness_text)
+
+    def _on_animation_draw(self, event):
+        """Tras un dibujado completo, guarda el fondo y repinta los artistas animados"""
+        canvas = self.current_canvas_widget
+        if self.ax is None or canvas is None or not hasattr(canvas, 'copy_from_bbox'):
+            return
+        self._anim_background = canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._animation_artists():
+            self.ax.draw_artist(artist)
 
     def _animate_step_slot(self):
         """Ejecuta un paso de la animación"""
-        if not self.is_animating or self.animation_generation >= len(self.anim_best_fitness_history):
+        if not self.is_animating or self.animation_generation >= len(self.anim_frame_generations):
             self.stop_animation()
             # Notificar a ConfigPanel para resetear el botón
             if self.main_window and hasattr(self.main_window, "config_panel") and self.main_window.config_panel:
                 self.main_window.config_panel.update_graph_button_selection(None)
             return
         
-        # Actualizar datos
-        x_data = list(range(self.animation_generation + 1))
-        y_data = self.anim_best_fitness_history[:self.animation_generation + 1]
-        
-        # Actualizar línea
-        self.line.set_data(x_data, y_data)
+        generation = int(self.anim_frame_generations[self.animation_generation])
+        visible = generation + 1
+
+        # Actualizar línea (vistas de los arreglos precalculados, sin copiar)
+        self.line.set_data(self.anim_x[:visible], self.anim_y[:visible])
+
+        # Resaltar mejoras hasta la generación actual (un solo conjunto de marcadores)
+        n_improvements = np.searchsorted(self.anim_improvement_indices, generation, side='right')
+        shown = self.anim_improvement_indices[:n_improvements]
+        self.improvement_markers.set_offsets(np.column_stack((shown, self.anim_y[shown])))
         
         # Actualizar textos informativos
-        self.gen_text.set_text(f'Generación: {self.animation_generation + 1}')
-        self.fitness_text.set_text(f'Fitness: {self.anim_best_fitness_history[self.animation_generation]:.4f}')
-        
-        # Resaltar mejoras según modo de optimización
-        if self.animation_generation > 0:
-            if self.anim_is_minimizing:
-                # Para minimización, mejora cuando el valor disminuye
-                if self.anim_best_fitness_history[self.animation_generation] < self.anim_best_fitness_history[self.animation_generation-1]:
-                    self.ax.scatter([self.animation_generation], 
-                                   [y_data[self.animation_generation]], 
-                                   color='orange', s=120, zorder=5)
-            else:
-                # Para maximización, mejora cuando el valor aumenta
-                if self.anim_best_fitness_history[self.animation_generation] > self.anim_best_fitness_history[self.animation_generation-1]:
-                    self.ax.scatter([self.animation_generation], 
-                                   [y_data[self.animation_generation]], 
-                                   color='orange', s=120, zorder=5)
+        self.gen_text.set_text(f'Generación: {visible}')
+        self.fitness_text.set_text(f'Fitness: {self.anim_y[generation]:.4f}')
         
-        self.current_canvas_widget.draw()
+        canvas = self.current_canvas_widget
+        if self._anim_background is None:
+            canvas.draw()  # dispara _on_animation_draw, que captura el fondo
+        else:
+            canvas.restore_region(self._anim_background)
+            for artist in self._animation_artists():
+                self.ax.draw_artist(artist)
+            canvas.blit(self.ax.bbox)
         self.animation_generation += 1
 
     def stop_animation(self):
         """Detiene la animación en curso"""
         self.is_animating = False
-        self.animation_timer.stop()
\ No newline at end of file
+        self.animation_timer.stop()
+
+    # ------------------------------------------------------------------
+    # Gráfica en vivo mientras el AG se ejecuta
+    # ------------------------------------------------------------------
+    def start_live_plot(self, is_minimizing, max_generations, show_histogram=True):
+        """Prepara la gráfica de convergencia en vivo (y el histograma de la población)"""
+        self.clear_graph_area()
+        self.current_figure = Figure(figsize=(14, 9), dpi=100)
+        canvas = FigureCanvasQTAgg(self.current_figure)
+        mode_text = "Minimizando" if is_minimizing else "Maximizando"
+
+        if show_histogram:
+            self.live_ax, self.live_hist_ax = self.current_figure.subplots(
+                1, 2, gridspec_kw={'width_ratios': [3, 1]}
+            )
+        else:
+            self.live_ax, self.live_hist_ax = self.current_figure.add_subplot(111), None
+
+        self.live_ax.set_xlabel('Generación', fontsize=16)
+        self.live_ax.set_ylabel('Mejor Fitness (Valor real de f(x))', fontsize=16)
+        self.live_ax.set_title(f'Convergencia en vivo ({mode_text})', fontsize=18, fontweight='bold')
+        self.live_ax.grid(True, alpha=0.3)
+        self.live_ax.tick_params(axis='both', which='major', labelsize=12)
+        self.live_ax.set_xlim(-1, max(1, max_generations))
+        self.live_line, = self.live_ax.plot([], [], 'g-', linewidth=3)
+        self.live_text = self.live_ax.text(0.02, 0.98, 'Generación: 0',
+                                           transform=self.live_ax.transAxes, fontsize=14,
+                                           verticalalignment='top',
+                                           bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+        if self.live_hist_ax is not None:
+            self.live_hist_ax.set_title('Población actual', fontsize=14)
+            self.live_hist_ax.set_xlabel('Fitness', fontsize=12)
+            self.live_hist_ax.grid(True, alpha=0.3)
+            self.live_hist = self.live_hist_ax.stairs(np.zeros(1), np.array([0.0, 1.0]), fill=True, alpha=0.7)
+
+        # Arreglo preasignado: añadir una generación es O(1)
+        self.live_best = np.full(max(1, max_generations), np.nan)
+        self.live_count = 0
+        self.live_last_fitness = None
+        self.live_active = True
+
+        self.current_figure.tight_layout()
+        self.layout.addWidget(canvas)
+        self.current_canvas_widget = canvas
+        canvas.draw()
+        self._live_next_draw = time.perf_counter() + self.LIVE_REFRESH_SECONDS
+
+    def update_live_plot(self, record, force=False):
+        """Añade el registro de una generación; redibuja solo si toca según la tasa de refresco.
+
+        Devuelve True si se redibujó (útil para actualizar otros indicadores al mismo ritmo).
+        """
+        if not self.live_active:
+            return False
+        if record is not None:
+            if record.generation >= len(self.live_best):
+                self.live_best = np.concatenate((self.live_best, np.full(len(self.live_best), np.nan)))
+            self.live_best[record.generation] = record.best_fitness
+            self.live_count = max(self.live_count, record.generation + 1)
+            if record.fitness is not None:
+                self.live_last_fitness = record.fitness
+
+        now = time.perf_counter()
+        if not force and now < self._live_next_draw:
+            return False
+
+        self._redraw_live_plot()
+        draw_seconds = time.perf_counter() - now
+        # Si dibujar es lento, se espacian los redibujados para no frenar al AG
+        self._live_next_draw = time.perf_counter() + max(
+            self.LIVE_REFRESH_SECONDS, draw_seconds / self.LIVE_MAX_DRAW_FRACTION
+        )
+        return True
+
+    def _redraw_live_plot(self):
+        count = self.live_count
+        y_vals = self.live_best[:count]
+        self.live_line.set_data(np.arange(count), y_vals)
+        finite_vals = y_vals[np.isfinite(y_vals)]
+        if finite_vals.size:
+            low, high = finite_vals.min(), finite_vals.max()
+            padding = (high - low) * 0.1 if high > low else 1
+            self.live_ax.set_ylim(low - padding, high + padding)
+            self.live_text.set_text(f'Generación: {count}\nMejor: {y_vals[-1]:.4f}')
+
+        if self.live_hist_ax is not None and self.live_last_fitness is not None:
+            fitness = np.asarray(self.live_last_fitness, dtype=float)
+            fitness = fitness[np.isfinite(fitness)]
+            if fitness.size:
+                counts, edges = np.histogram(fitness, bins=self.LIVE_HISTOGRAM_BINS)
+                self.live_hist.set_data(counts, edges)
+                self.live_hist_ax.set_xlim(edges[0], edges[-1] if edges[-1] > edges[0] else edges[0] + 1)
+                self.live_hist_ax.set_ylim(0, counts.max() * 1.1 if counts.max() else 1)
+
+        self.current_canvas_widget.draw()
+        # El AG corre en el hilo de la interfaz: procesar eventos para pintar y mantenerla viva
+        QApplication.processEvents()
+
+    def finish_live_plot(self):
+        """Dibuja el estado final y deja de aceptar registros"""
+        if self.live_active:
+            self.update_live_plot(None, force=True)
+        self.live_active = False
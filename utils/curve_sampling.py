@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Muestreo adaptativo (y cacheado) de la curva de la función objetivo
+
+Se parte de una malla uniforme pequeña evaluada en bloque y se refinan, por
+bisección, solo los tramos donde la curva se aparta de la recta entre puntos
+vecinos (curvatura) o donde f(x) cambia de signo. Así las funciones muy
+oscilantes quedan bien resueltas y las suaves no se sobremuestrean.
+
+Los resultados se cachean por (texto de la función, backend, intervalo), de
+modo que la gráfica de la función objetivo y la vista previa del editor de
+funciones reutilizan la misma curva.
+"""
+
+import threading
+from collections import OrderedDict
+import numpy as np
+
+DEFAULT_INITIAL_POINTS = 257
+DEFAULT_MAX_POINTS = 8193
+DEFAULT_TOLERANCE = 1e-3      # desviación admitida, relativa al rango de f(x)
+_MAX_REFINEMENT_PASSES = 12
+_CACHE_MAX_ENTRIES = 32
+
+_curve_cache = OrderedDict()
+_curve_cache_lock = threading.Lock()
+
+
+def _chord_deviation(x, y):
+    """Distancia vertical de cada punto interior a la recta entre sus vecinos"""
+    x_prev, x_mid, x_next = x[:-2], x[1:-1], x[2:]
+    y_prev, y_mid, y_next = y[:-2], y[1:-1], y[2:]
+    t = (x_mid - x_prev) / (x_next - x_prev)
+    return np.abs(y_mid - (y_prev + t * (y_next - y_prev)))
+
+
+def _flag_segments(x, y, tolerance):
+    """Tramos [x_i, x_{i+1}] que necesitan un punto intermedio"""
+    finite = np.isfinite(y)
+    y_range = np.ptp(y[finite]) if finite.any() else 0.0
+    threshold = tolerance * (y_range if y_range > 0 else 1.0)
+
+    flagged = np.zeros(len(x) - 1, dtype=bool)
+    # Curvatura: el punto se aparta de la cuerda de sus vecinos -> refinar ambos tramos
+    deviation = _chord_deviation(x, y)
+    curved = np.isfinite(deviation) & (deviation > threshold)
+    flagged[:-1] |= curved
+    flagged[1:] |= curved
+    # Cambios de signo de f(x): ubicar bien los cruces por cero
+    flagged |= finite[:-1] & finite[1:] & (np.sign(y[:-1]) != np.sign(y[1:]))
+    return flagged
+
+
+def sample_function_curve(function_provider, x_min, x_max,
+                          initial_points=DEFAULT_INITIAL_POINTS,
+                          max_points=DEFAULT_MAX_POINTS,
+                          tolerance=DEFAULT_TOLERANCE):
+    """
+    Devuelve (x, y) para graficar f(x) en [x_min, x_max], refinando adaptativamente.
+
+    Los arreglos devueltos son de solo lectura porque se comparten desde la caché.
+    """
+    key = (
+        function_provider.function_text, getattr(function_provider, 'backend', None),
+        float(x_min), float(x_max), initial_points, max_points, tolerance
+    )
+    with _curve_cache_lock:
+        cached = _curve_cache.get(key)
+        if cached is not None:
+            _curve_cache.move_to_end(key)
+            return cached
+
+    x = np.linspace(x_min, x_max, max(2, initial_points))
+    y = np.asarray(function_provider.get_raw_function_values(x), dtype=float)
+
+    if x_max > x_min:
+        for _ in range(_MAX_REFINEMENT_PASSES):
+            budget = max_points - len(x)
+            if budget <= 0:
+                break
+            flagged = np.flatnonzero(_flag_segments(x, y, tolerance))
+            if flagged.size == 0:
+                break
+            if flagged.size > budget:
+                # Sin presupuesto para todos: priorizar los tramos más anchos
+                widths = x[flagged + 1] - x[flagged]
+                flagged = np.sort(flagged[np.argsort(widths)[::-1][:budget]])
+            x_new = 0.5 * (x[flagged] + x[flagged + 1])
+            y_new = np.asarray(function_provider.get_raw_function_values(x_new), dtype=float)
+            # Insertar los puntos medios (x ya está ordenado)
+            x = np.insert(x, flagged + 1, x_new)
+            y = np.insert(y, flagged + 1, y_new)
+
+    x.setflags(write=False)
+    y.setflags(write=False)
+    with _curve_cache_lock:
+        _curve_cache[key] = (x, y)
+        while len(_curve_cache) > _CACHE_MAX_ENTRIES:
+            _curve_cache.popitem(last=False)
+    return x, y
+
+
+def clear_curve_cache():
+    """Vacía la caché de curvas"""
+    with _curve_cache_lock:
+        _curve_cache.clear()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Backends de evaluación de la función objetivo
+
+Un evaluador recibe un arreglo de valores x ya decodificados y devuelve el
+fitness real f(x) de cada uno:
+  - SerialEvaluator: evalúa todo en el proceso actual (en bloque).
+  - ProcessPoolEvaluator: reparte el lote en trozos entre procesos trabajadores.
+    Los valores x y los resultados viajan por memoria compartida, y el tamaño
+    del trozo se adapta al costo medido por evaluación; si la función es barata
+    el lote se evalúa en el proceso actual sin tocar el pool (el pool solo se
+    crea la primera vez que un lote lo justifica). Los trabajadores
+    se inician con 'spawn' por defecto: bifurcar (fork) un proceso con hilos,
+    como la interfaz Qt, no es seguro.
+"""
+
+import os
+import time
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+EVALUATION_BACKENDS = ('serial', 'process', 'auto')
+DEFAULT_START_METHOD = 'spawn'
+
+
+class SerialEvaluator:
+    """Evalúa el lote completo en el proceso actual"""
+
+    def __init__(self, function_provider):
+        self.function_provider = function_provider
+
+    def evaluate(self, x_values) -> np.ndarray:
+        return self.function_provider.get_raw_function_values(x_values)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# --- Estado y funciones de los procesos trabajadores (deben ser de nivel de módulo) ---
+_worker_provider = None
+
+
+def _init_worker(function_provider):
+    global _worker_provider
+    _worker_provider = function_provider
+
+
+def _attach_shared_memory(name):
+    """Se conecta a un bloque existente creado por el proceso principal.
+
+    Los trabajadores comparten el resource_tracker del proceso principal, que es
+    el único que libera (unlink) los bloques.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13: el registro repetido en el tracker es inocuo
+        return shared_memory.SharedMemory(name=name)
+
+
+def _evaluate_chunk(input_name, output_name, capacity, start, stop):
+    """Evalúa x[start:stop] del bloque compartido y escribe en el bloque de salida.
+
+    Devuelve el tiempo empleado, para que el proceso principal ajuste el tamaño de trozo.
+    """
+    t0 = time.perf_counter()
+    shm_in = _attach_shared_memory(input_name)
+    shm_out = _attach_shared_memory(output_name)
+    try:
+        x_values = np.ndarray((capacity,), dtype=np.float64, buffer=shm_in.buf)
+        results = np.ndarray((capacity,), dtype=np.float64, buffer=shm_out.buf)
+        results[start:stop] = _worker_provider.get_raw_function_values(x_values[start:stop])
+        del x_values, results
+    finally:
+        shm_in.close()
+        shm_out.close()
+    return time.perf_counter() - t0
+
+
+class ProcessPoolEvaluator:
+    """Evalúa lotes en un pool de procesos, con trozos adaptados al costo por evaluación"""
+
+    def __init__(self, function_provider, max_workers=None, target_chunk_seconds=0.05,
+                 min_parallel_seconds=0.05, probe_size=8, start_method=DEFAULT_START_METHOD):
+        """
+        Args:
+            function_provider: Proveedor serializable (se envía una vez a cada trabajador).
+            max_workers: Número de procesos (por defecto, os.cpu_count()).
+            target_chunk_seconds: Duración objetivo de cada trozo enviado a un trabajador.
+            min_parallel_seconds: Si el lote se estima por debajo de este tiempo,
+                se evalúa en el proceso actual.
+            probe_size: Individuos evaluados localmente para medir el costo.
+            start_method: Método de inicio de los trabajadores ('spawn', 'forkserver'
+                o 'fork'; este último solo es seguro en procesos sin hilos).
+        """
+        self.function_provider = function_provider
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.target_chunk_seconds = target_chunk_seconds
+        self.min_parallel_seconds = min_parallel_seconds
+        self.probe_size = max(1, probe_size)
+        self.start_method = start_method
+        self.cost_per_eval = None  # segundos por evaluación (media móvil)
+        self._executor = None
+        self._shm_in = None
+        self._shm_out = None
+        self._capacity = 0
+
+    # --- Gestión de recursos ---
+    def _ensure_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(self.function_provider,)
+            )
+        return self._executor
+
+    def _ensure_buffers(self, n):
+        if n <= self._capacity:
+            return
+        self._release_buffers()
+        nbytes = max(1, n) * np.dtype(np.float64).itemsize
+        self._shm_in = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._shm_out = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._capacity = n
+
+    def _release_buffers(self):
+        for shm in (self._shm_in, self._shm_out):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._shm_in = self._shm_out = None
+        self._capacity = 0
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._release_buffers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- Evaluación ---
+    def _update_cost(self, seconds, count):
+        if count <= 0:
+            return
+        sample = seconds / count
+        if self.cost_per_eval is None:
+            self.cost_per_eval = sample
+        else:
+            self.cost_per_eval = 0.7 * self.cost_per_eval + 0.3 * sample
+
+    def chunk_size_for(self, n):
+        """Tamaño de trozo para un lote de n evaluaciones (0 = evaluar en el proceso actual)"""
+        if self.cost_per_eval is None or self.max_workers <= 1:
+            return 0
+        if self.cost_per_eval * n < self.min_parallel_seconds:
+            return 0
+        per_chunk = int(np.ceil(self.target_chunk_seconds / max(self.cost_per_eval, 1e-12)))
+        # Al menos un trozo por trabajador para aprovechar todos los procesos
+        return int(np.clip(per_chunk, 1, int(np.ceil(n / self.max_workers))))
+
+    def evaluate(self, x_values) -> np.ndarray:
+        x_array = np.ascontiguousarray(x_values, dtype=np.float64).ravel()
+        n = x_array.size
+        results = np.empty(n, dtype=np.float64)
+        if n == 0:
+            return results
+
+        # 1) Sonda local: mide el costo y ya deja evaluados los primeros individuos.
+        #    La primera vez se evalúa un valor sin medir, porque incluye la compilación perezosa.
+        if self.cost_per_eval is None:
+            self.function_provider.get_raw_function_values(x_array[:1])
+        probe = min(self.probe_size, n)
+        t0 = time.perf_counter()
+        results[:probe] = self.function_provider.get_raw_function_values(x_array[:probe])
+        self._update_cost(time.perf_counter() - t0, probe)
+
+        remaining = n - probe
+        if remaining == 0:
+            return results
+
+        chunk = self.chunk_size_for(remaining)
+        if chunk == 0:
+            # Función barata: no compensa el costo de comunicación con el pool
+            t0 = time.perf_counter()
+            results[probe:] = self.function_provider.get_raw_function_values(x_array[probe:])
+            self._update_cost(time.perf_counter() - t0, remaining)
+            return results
+
+        # 2) Reparto en trozos por memoria compartida
+        executor = self._ensure_executor()
+        self._ensure_buffers(n)
+        shared_x = np.ndarray((self._capacity,), dtype=np.float64, buffer=self._shm_in.buf)
+        shared_out = np.ndarray((self._capacity,), dtype=np.float64, buffer=self._shm_out.buf)
+        shared_x[:n] = x_array
+
+        futures = []
+        for start in range(probe, n, chunk):
+            stop = min(start + chunk, n)
+            futures.append((stop - start, executor.submit(
+                _evaluate_chunk, self._shm_in.name, self._shm_out.name, self._capacity, start, stop
+            )))
+        busy_seconds = 0.0
+        for count, future in futures:
+            busy_seconds += future.result()
+        self._update_cost(busy_seconds, remaining)
+
+        results[probe:] = shared_out[probe:n]
+        del shared_x, shared_out
+        return results
+
+
+def create_evaluator(function_provider, backend='serial', **options):
+    """Crea un evaluador para el backend indicado ('serial', 'process' o 'auto')
+
+    'auto' elige según la función: los proveedores que ya reparten cada lote
+    entre sus propios procesos (manages_own_workers) se evalúan en serie; el
+    resto usa ProcessPoolEvaluator, cuya sonda de costo deja en el proceso
+    actual las funciones baratas y reparte las costosas entre trabajadores.
+
+    Raises:
+        ValueError: Si el backend no existe.
+    """
+    if backend == 'serial':
+        return SerialEvaluator(function_provider)
+    if backend == 'auto':
+        if getattr(function_provider, 'manages_own_workers', False):
+            return SerialEvaluator(function_provider)
+        return ProcessPoolEvaluator(function_provider, **options)
+    if backend == 'process':
+        return ProcessPoolEvaluator(function_provider, **options)
+    raise ValueError(f"Backend de evaluación '{backend}' no soportado. Opciones: {list(EVALUATION_BACKENDS)}")
@@ -6,23 +6,230 @@ Funciones para exportar resultados (reportes y animaciones)
 """
 
 import os
+import csv
+import json
 import datetime
+import itertools
 import subprocess
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
-from utils.math_functions import binary_to_decimal, get_raw_function_value, get_function_provider
+from utils.math_functions import binary_to_decimal, decode_population, get_raw_function_value, get_function_provider
+from utils.curve_sampling import sample_function_curve
+from algorithm.history import history_generation_numbers
+from utils.evaluation import DEFAULT_START_METHOD
+
+REPORT_FORMATS = ('txt', 'json', 'csv')
+_STATS_CHUNK_ELEMENTS = 4_000_000   # bits decodificados a la vez al calcular estadísticas
+_WRITE_CHUNK = 65_536               # valores formateados por escritura
+
+
+def _improvement_count(best_fitness_history, is_minimizing):
+    y_vals = np.asarray(best_fitness_history, dtype=float)
+    steps = np.diff(y_vals)
+    return int(np.count_nonzero(steps < 0 if is_minimizing else steps > 0))
+
+
+def compute_generation_statistics(ga_results, population_history, fitness_history, best_fitness_history):
+    """
+    Estadísticas por generación como diccionario de arreglos (G,).
+
+    Si la ejecución trae ga_results['generation_stats'] (calculadas dentro del
+    bucle del AG) se usan directamente: mean/std/median/worst_fitness,
+    unique_genomes y hamming_diversity, también en ejecuciones sin historial de
+    población. Si no, mean/std/worst_fitness se calculan con NumPy recorriendo
+    fitness_history. Con historial de población se agrega diversity (desviación
+    estándar de x), decodificando por bloques de generaciones para acotar la
+    memoria. Con tasas adaptativas se agregan además las tasas de cada generación.
+
+    Si la política de retención guardó solo algunas generaciones (o una muestra
+    de individuos), las columnas calculadas desde el historial quedan en NaN en
+    las generaciones no guardadas.
+    """
+    best = np.asarray(best_fitness_history, dtype=float)
+    n_total = len(best)
+    stats = {'generation': np.arange(1, n_total + 1), 'best_fitness': best}
+    for name, values in (ga_results.get('rate_history') or {}).items():
+        column = 'hamming_diversity' if name == 'diversity' else name
+        stats[column] = np.asarray(values, dtype=float)[:n_total]
+
+    in_loop_stats = ga_results.get('generation_stats')
+    n_generations = min(len(population_history), len(fitness_history))
+    kept = history_generation_numbers(ga_results, n_generations)
+    kept_in_range = kept < n_total
+
+    def _by_generation(values):
+        # Valores de las entradas guardadas en su generación; NaN en el resto
+        column = np.full(n_total, np.nan)
+        column[kept[kept_in_range]] = values[kept_in_range]
+        return column
+
+    if in_loop_stats:
+        for name, values in in_loop_stats.items():
+            stats[name] = np.asarray(values, dtype=float)[:n_total]
+    elif n_generations:
+        fitness = np.asarray(fitness_history[:n_generations], dtype=float)
+        with np.errstate(invalid='ignore'):
+            stats['mean_fitness'] = _by_generation(np.nanmean(fitness, axis=1))
+            stats['std_fitness'] = _by_generation(np.nanstd(fitness, axis=1))
+            stats['worst_fitness'] = _by_generation(
+                (np.nanmax if ga_results['is_minimizing'] else np.nanmin)(fitness, axis=1))
+    if n_generations == 0:
+        return stats
+
+    pop_size = len(population_history[0])
+    n_bits = max(1, ga_results['n_bits'])
+    chunk = max(1, _STATS_CHUNK_ELEMENTS // max(1, pop_size * n_bits))
+    diversity = np.empty(n_generations)
+    for start in range(0, n_generations, chunk):
+        stop = min(start + chunk, n_generations)
+        x_values = decode_population(np.asarray(population_history[start:stop]),
+                                     ga_results['x_min'], ga_results['x_max'], ga_results['n_bits'])
+        diversity[start:stop] = x_values.std(axis=1)
+    stats['diversity'] = _by_generation(diversity)
+    return stats
+
+
+def _history_description(ga_results):
+    """Texto de la política de retención del historial de una ejecución"""
+    mode = ga_results.get('history_mode', 'full')
+    param = ga_results.get('history_param')
+    labels = {
+        'full': "completo (todas las generaciones)",
+        'every_k': f"cada {param} generaciones",
+        'improved': "solo generaciones con mejora",
+        'reservoir': f"muestra de {param} individuos por generación",
+        'stats': "ninguno (solo estadísticas por generación)",
+    }
+    text = labels.get(mode, mode)
+    if mode in ('every_k', 'improved'):
+        text += f" ({len(ga_results.get('history_generations', []))} de {ga_results['generations']})"
+    return text
+
+
+def _final_population_table(ga_results):
+    """Columnas de la población final: bits (como texto), x y f(x)"""
+    bits = np.asarray(ga_results['final_population'], dtype=np.uint8)
+    fitness = np.asarray(ga_results['final_fitness'], dtype=float)
+    if bits.size == 0:
+        return np.empty(0, dtype=str), np.empty(0), fitness
+    x_values = decode_population(bits, ga_results['x_min'], ga_results['x_max'], ga_results['n_bits'])
+    # '0'/'1' como bytes contiguos: una cadena por individuo sin bucles de Python
+    bit_strings = np.ascontiguousarray(bits + ord('0')).view(f'S{bits.shape[1]}').ravel()
+    return bit_strings, x_values, fitness
+
+
+def _write_json_array(f, values, formatter):
+    """Escribe un arreglo JSON por bloques (NaN/inf como null)"""
+    f.write('[')
+    for start in range(0, len(values), _WRITE_CHUNK):
+        if start:
+            f.write(', ')
+        f.write(', '.join(formatter(v) for v in values[start:start + _WRITE_CHUNK]))
+    f.write(']')
+
+
+def _json_float(value):
+    value = float(value)
+    return repr(value) if np.isfinite(value) else 'null'
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
 
 class ReportGenerator:
     """Clase para generar reportes de resultados"""
     
     def __init__(self):
         pass
-    
-    def generate(self, filename, ga_results, best_fitness_history):
+
+    def generate(self, filename, ga_results, best_fitness_history,
+                 population_history=None, fitness_history=None, formats=REPORT_FORMATS):
+        """
+        Genera el reporte de texto y, junto a él, sus versiones legibles por máquina.
+
+        Con `filename` = 'reporte.txt' se escriben reporte.txt, reporte.json,
+        reporte_generaciones.csv y reporte_poblacion_final.csv (según `formats`).
+
+        Returns:
+            Lista de archivos escritos.
+        """
+        base, _ = os.path.splitext(filename)
+        population_history = population_history if population_history is not None else []
+        fitness_history = fitness_history if fitness_history is not None else []
+        written = []
+        if 'txt' in formats:
+            self.generate_text(filename, ga_results, best_fitness_history)
+            written.append(filename)
+        if 'json' in formats or 'csv' in formats:
+            stats = compute_generation_statistics(ga_results, population_history, fitness_history,
+                                                  best_fitness_history)
+            table = _final_population_table(ga_results)
+            if 'json' in formats:
+                written.append(self.generate_json(f"{base}.json", ga_results, stats, table))
+            if 'csv' in formats:
+                written.extend(self.generate_csv(base, stats, table))
+        return written
+
+    def generate_json(self, filename, ga_results, stats, table):
+        """JSON por columnas, escrito por bloques (sin armar la cadena completa en memoria)"""
+        summary = {key: value for key, value in ga_results.items()
+                   if key not in ('final_population', 'final_fitness', 'rate_history', 'generation_stats')}
+        bit_strings, x_values, fitness = table
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('{"ga_results": ')
+            f.write(json.dumps(summary, default=_json_default, ensure_ascii=False))
+            f.write(', "generations": {')
+            for i, (name, values) in enumerate(stats.items()):
+                f.write(f'{", " if i else ""}"{name}": ')
+                _write_json_array(f, values, str if name == 'generation' else _json_float)
+            f.write('}, "final_population": {"bits": ')
+            _write_json_array(f, bit_strings, lambda b: f'"{b.decode()}"')
+            f.write(', "x": ')
+            _write_json_array(f, x_values, _json_float)
+            f.write(', "fitness": ')
+            _write_json_array(f, fitness, _json_float)
+            f.write('}}\n')
+        return filename
+
+    def generate_csv(self, base, stats, table):
+        """CSV de estadísticas por generación y de la población final"""
+        generations_file = f"{base}_generaciones.csv"
+        columns = list(stats)
+        matrix = np.column_stack([stats[name] for name in columns])
+        with open(generations_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(','.join(columns) + '\n')
+            for start in range(0, len(matrix), _WRITE_CHUNK):
+                np.savetxt(f, matrix[start:start + _WRITE_CHUNK], delimiter=',',
+                           fmt=['%d'] + ['%.10g'] * (len(columns) - 1))
+
+        population_file = f"{base}_poblacion_final.csv"
+        bit_strings, x_values, fitness = table
+        with open(population_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['individuo', 'bits', 'x', 'fitness'])
+            for start in range(0, len(bit_strings), _WRITE_CHUNK):
+                stop = start + _WRITE_CHUNK
+                writer.writerows(zip(
+                    range(start + 1, start + 1 + len(bit_strings[start:stop])),
+                    (b.decode() for b in bit_strings[start:stop]),
+                    (f'{x:.10g}' for x in x_values[start:stop]),
+                    (f'{y:.10g}' for y in fitness[start:stop])
+                ))
+        return [generations_file, population_file]
+
+    def generate_text(self, filename, ga_results, best_fitness_history):
         if ga_results['is_minimizing']:
             mode_text = "MINIMIZACIÓN"
         else:
@@ -61,41 +268,27 @@ class ReportGenerator:
             
             f.write("ANÁLISIS DE CONVERGENCIA (SOBRE FITNESS REAL):\n")
             f.write("-" * 30 + "\n")
-            if best_fitness_history:
+            if len(best_fitness_history) > 0:
                 f.write(f"• Fitness inicial (real): {best_fitness_history[0]:.6f}\n")
                 f.write(f"• Fitness final (real): {best_fitness_history[-1]:.6f}\n")
             else:
                 f.write("• Fitness inicial (real): N/A\n")
                 f.write("• Fitness final (real): N/A\n")
             
-            significant_improvements = 0
-            if ga_results['is_minimizing']:
-                for i in range(1, len(best_fitness_history)):
-                    if best_fitness_history[i] < best_fitness_history[i-1]:
-                        significant_improvements += 1
-            else:
-                for i in range(1, len(best_fitness_history)):
-                    if best_fitness_history[i] > best_fitness_history[i-1]:
-                        significant_improvements += 1
+            significant_improvements = _improvement_count(best_fitness_history, ga_results['is_minimizing'])
             percent_productive = (significant_improvements/len(best_fitness_history))*100 if len(best_fitness_history) > 0 else 0
             f.write(f"• Generaciones con mejora: {significant_improvements}\n")
             f.write(f"• Porcentaje de generaciones productivas: {percent_productive:.1f}%\n\n")
             
             f.write("POBLACIÓN FINAL (FITNESS REALES):\n")
             f.write("-" * 30 + "\n")
-            final_x_values = []
-            for i, (individual, raw_fitness) in enumerate(zip(ga_results['final_population'], ga_results['final_fitness'])):
-                x_val = binary_to_decimal(individual, 
-                                         ga_results['x_min'], 
-                                         ga_results['x_max'], 
-                                         ga_results['n_bits'])
-                final_x_values.append(x_val)
-                binary_str = ''.join(map(str, individual))
-                f.write(f"• Individuo {i+1}: {binary_str} -> x = {x_val:.6f}, f(x) = {raw_fitness:.6f}\n")
+            bit_strings, final_x_values, final_fitness = _final_population_table(ga_results)
+            for i, (binary_str, x_val, raw_fitness) in enumerate(zip(bit_strings, final_x_values, final_fitness)):
+                f.write(f"• Individuo {i+1}: {binary_str.decode()} -> x = {x_val:.6f}, f(x) = {raw_fitness:.6f}\n")
             
-            if final_x_values:
+            if len(final_x_values) > 0:
                 f.write(f"\n• Diversidad final (desviación estándar de x): {np.std(final_x_values):.6f}\n")
-                f.write(f"• Rango de soluciones x: [{min(final_x_values):.6f}, {max(final_x_values):.6f}]\n\n")
+                f.write(f"• Rango de soluciones x: [{final_x_values.min():.6f}, {final_x_values.max():.6f}]\n\n")
             else:
                 f.write("\n• Diversidad final (desviación estándar de x): N/A\n")
                 f.write("• Rango de soluciones x: N/A\n\n")
@@ -115,12 +308,90 @@ class ReportGenerator:
                 for i in range(len(best_fitness_history)):
                     f.write(f"  Gen {i+1}: {best_fitness_history[i]:.6f}\n")
 
+            rate_history = ga_results.get('rate_history')
+            if rate_history:
+                f.write("\nTASAS ADAPTATIVAS (SEGÚN DIVERSIDAD):\n")
+                f.write("-" * 30 + "\n")
+                labels = {'prob_crossover': 'Probabilidad de cruzamiento', 'prob_mutation_i': 'PMI',
+                          'prob_mutation_g': 'PMG'}
+                bounds = ga_results.get('adaptive_rates') or {}
+                for name, label in labels.items():
+                    values = np.asarray(rate_history.get(name, []), dtype=float)
+                    if values.size == 0:
+                        continue
+                    bounds_text = f" en [{bounds[name][0]}, {bounds[name][1]}]" if name in bounds else ""
+                    f.write(f"• {label}{bounds_text}: inicial {values[0]:.4f}, final {values[-1]:.4f}, "
+                            f"media {values.mean():.4f}\n")
+                diversity = np.asarray(rate_history.get('diversity', []), dtype=float)
+                if diversity.size:
+                    f.write(f"• Diversidad (Hamming media / bits): inicial {diversity[0]:.4f}, "
+                            f"final {diversity[-1]:.4f}\n")
+
+            if ga_results.get('niching'):
+                niches = ga_results.get('niches') or []
+                f.write("\nNICHOS ENCONTRADOS (CROWDING DETERMINISTA):\n")
+                f.write("-" * 30 + "\n")
+                f.write(f"• Radio de nicho: {ga_results['niche_radius']:.6g} | Nichos: {len(niches)}\n")
+                for i, niche in enumerate(niches, 1):
+                    f.write(f"• Nicho {i}: x = {niche['x']:.6f}, f(x) = {niche['fitness']:.6f} "
+                            f"({niche['size']} individuos en [{niche['x_low']:.4f}, {niche['x_high']:.4f}])\n")
+                if ga_results.get('niches_omitted'):
+                    f.write(f"• {ga_results['niches_omitted']} nichos adicionales omitidos "
+                            f"(se informan los {len(niches)} mejores)\n")
+                if ga_results.get('niche_isolated'):
+                    f.write(f"• {ga_results['niche_isolated']} individuos aislados sin nicho "
+                            f"(a más del radio de cualquier otro)\n")
+
+            memetic = ga_results.get('memetic')
+            if memetic:
+                memetic_stats = ga_results.get('memetic_stats') or {}
+                f.write("\nREFINAMIENTO LOCAL (MEMÉTICO):\n")
+                f.write("-" * 30 + "\n")
+                f.write(f"• Cada {memetic['interval']} generaciones, los {memetic['top']} mejores dan hasta "
+                        f"{memetic['steps']} pasos de Newton/gradiente con f' y f'' simbólicas\n")
+                f.write(f"• Refinamientos: {memetic_stats.get('refinements', 0)} | "
+                        f"Individuos mejorados: {memetic_stats.get('improved', 0)}\n")
+                f.write(f"• Evaluaciones de f en el refinamiento: {memetic_stats.get('evaluations', 0)} "
+                        f"(incluidas en el total) | Evaluaciones de f'/f'': "
+                        f"{memetic_stats.get('derivative_evaluations', 0)}\n")
+
+            seed_summary = ga_results.get('multi_seed')
+            if seed_summary:
+                final_best = np.asarray(seed_summary['final_best'], dtype=float)
+                f.write("\nEJECUCIONES REPETIDAS (VARIAS SEMILLAS):\n")
+                f.write("-" * 30 + "\n")
+                f.write(f"• Semillas ejecutadas: {seed_summary['n_seeds']} "
+                        f"({seed_summary['seeds'][0]} a {seed_summary['seeds'][-1]}); "
+                        f"este reporte detalla la semilla mediana {ga_results.get('seed')}\n")
+                f.write(f"• Objetivo: f(x) = {seed_summary['target']:.6f} "
+                        f"(tolerancia {seed_summary['target_tolerance']:.3g})\n")
+                f.write(f"• Tasa de éxito: {seed_summary['success_rate'] * 100:.1f}%\n")
+                median_generations = seed_summary['median_generations_to_target']
+                median_seconds = seed_summary['median_seconds_to_target']
+                f.write(f"• Mediana de generaciones hasta el objetivo: "
+                        f"{'N/A' if median_generations is None else f'{median_generations:.1f}'}\n")
+                f.write(f"• Mediana de tiempo hasta el objetivo: "
+                        f"{'N/A' if median_seconds is None else f'{median_seconds:.3f} s'}\n")
+                if final_best.size:
+                    for q, value in zip(seed_summary['percentiles'],
+                                        np.percentile(final_best, seed_summary['percentiles'])):
+                        f.write(f"• Percentil {q} del mejor fitness final: {value:.6f}\n")
+
             f.write("\nESTADÍSTICAS ADICIONALES:\n")
             f.write("-" * 30 + "\n")
-            f.write(f"• Evaluaciones totales de la función: {ga_results['pop_size'] * ga_results['generations']}\n")
-            f.write(f"• Tipo de selección (ejemplo AG): Emparejamiento aleatorio con poda\n")
+            evaluations = ga_results.get('evaluations', ga_results['pop_size'] * ga_results['generations'])
+            f.write(f"• Evaluaciones totales de la función: {evaluations}\n")
+            if ga_results.get('elite_count'):
+                f.write(f"• Elitismo: los {ga_results['elite_count']} mejores pasan intactos "
+                        f"a la siguiente generación (sin reevaluarse)\n")
+            if ga_results.get('niching') == 'crowding':
+                f.write(f"• Tipo de selección (ejemplo AG): Crowding determinista (cada hijo reemplaza "
+                        f"al padre más cercano en x si es mejor)\n")
+            else:
+                f.write(f"• Tipo de selección (ejemplo AG): Emparejamiento aleatorio con poda\n")
             f.write(f"• Tipo de cruzamiento (ejemplo AG): 3 puntos aleatorios\n")
-            f.write(f"• Tipo de mutación (ejemplo AG): Intercambio de genes\n\n")
+            f.write(f"• Tipo de mutación (ejemplo AG): Intercambio de genes\n")
+            f.write(f"• Historial de poblaciones guardado: {_history_description(ga_results)}\n\n")
             
             f.write("="*60 + "\nFIN DEL REPORTE\n" + "="*60 + "\n")
         return True
@@ -144,87 +415,410 @@ class ReportGenerator:
             print(f"Error opening file: {e}")
             return False
 
+def select_animation_frames(best_fitness_history, is_minimizing, max_frames):
+    """
+    Generaciones a mostrar en una animación de a lo sumo `max_frames` cuadros.
+
+    Se conservan siempre la primera y la última generación y las generaciones con
+    mejora (submuestreadas uniformemente solo si por sí solas exceden el límite);
+    el resto del presupuesto se reparte uniformemente.
+    """
+    y_vals = np.asarray(best_fitness_history, dtype=float)
+    n_generations = len(y_vals)
+    if n_generations <= max_frames:
+        return np.arange(n_generations)
+    if is_minimizing:
+        improvements = np.flatnonzero(y_vals[1:] < y_vals[:-1]) + 1
+    else:
+        improvements = np.flatnonzero(y_vals[1:] > y_vals[:-1]) + 1
+    max_improvements = max(0, max_frames - 2)
+    if improvements.size > max_improvements:
+        improvements = improvements[np.linspace(0, improvements.size - 1, max_improvements).astype(int)]
+    uniform = np.linspace(0, n_generations - 1, max(2, max_frames - improvements.size)).round().astype(int)
+    return np.unique(np.r_[improvements, uniform])
+
+
+class _FrameRenderer:
+    """Base de los renderizadores de cuadros con artistas preasignados.
+
+    Es serializable (solo viajan los arreglos); la figura se crea perezosamente en
+    el proceso que dibuja. El fondo (ejes, rejilla, curvas fijas) se rasteriza una
+    vez y cada cuadro lo restaura y repinta solo los artistas animados.
+    Las subclases implementan _build(fig) -> artistas animados y _update(cuadro).
+    """
+
+    def __init__(self, frame_generations, figsize=(10, 6), dpi=100):
+        self.frame_generations = np.asarray(frame_generations, dtype=int)
+        self.figsize = figsize
+        self.dpi = dpi
+        self._figure = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_figure'] = None
+        return state
+
+    @property
+    def frame_count(self):
+        return len(self.frame_generations)
+
+    def _ensure_figure(self):
+        if self._figure is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        self._canvas = FigureCanvasAgg(fig)
+        self._animated_artists = self._build(fig)
+        for artist in self._animated_artists:
+            artist.set_animated(True)
+        self._canvas.draw()
+        self._background = self._canvas.copy_from_bbox(fig.bbox)
+        self._figure = fig
+
+    def render(self, frame_number):
+        """Devuelve ((ancho, alto), bytes RGB) del cuadro indicado"""
+        self._ensure_figure()
+        self._update(frame_number)
+        self._canvas.restore_region(self._background)
+        for artist in self._animated_artists:
+            self._figure.draw_artist(artist)
+        rgba = np.asarray(self._canvas.buffer_rgba())
+        return (rgba.shape[1], rgba.shape[0]), rgba[..., :3].tobytes()
+
+
+def _text_box(ax, y, fontsize=10):
+    return ax.text(0.02, y, '', transform=ax.transAxes, fontsize=fontsize, verticalalignment='top',
+                   bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+
+class _BestFitnessFrameRenderer(_FrameRenderer):
+    """Evolución del mejor fitness: línea acumulada y marcadores de mejora"""
+
+    MARKER_LIMIT = 200  # por encima de esto no se dibujan marcadores en la línea
+
+    def __init__(self, best_fitness_history, is_minimizing, frame_generations, **figure_options):
+        super().__init__(frame_generations, **figure_options)
+        self.y_vals = np.asarray(best_fitness_history, dtype=float)
+        self.is_minimizing = is_minimizing
+
+    def _build(self, fig):
+        y_vals = self.y_vals
+        n_generations = len(y_vals)
+        self.x_vals = np.arange(n_generations)
+        if self.is_minimizing:
+            improvement_mask = y_vals[1:] < y_vals[:-1]
+        else:
+            improvement_mask = y_vals[1:] > y_vals[:-1]
+        self.improvement_indices = np.flatnonzero(improvement_mask) + 1
+        self.improvement_points = np.column_stack(
+            (self.improvement_indices, y_vals[self.improvement_indices])
+        )
+
+        ax = fig.add_subplot(111)
+        ax.set_xlabel('Generación', fontsize=12)
+        ax.set_ylabel('Mejor Fitness (Valor real)', fontsize=12)
+        ax.set_title('Evolución del Mejor Individuo', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+
+        finite_vals = y_vals[np.isfinite(y_vals)]
+        min_fitness = finite_vals.min() if finite_vals.size else 0
+        max_fitness = finite_vals.max() if finite_vals.size else 1
+        padding = (max_fitness - min_fitness) * 0.1 if max_fitness > min_fitness else 1
+        ax.set_ylim(min_fitness - padding, max_fitness + padding)
+        ax.set_xlim(-1, n_generations)
+
+        marker = 'o' if n_generations <= self.MARKER_LIMIT else None
+        self._line, = ax.plot([], [], 'g-', linewidth=2, marker=marker, markersize=6)
+        self._markers = ax.scatter(np.empty(0), np.empty(0), color='orange', s=100, zorder=5)
+        self._gen_text = _text_box(ax, 0.95)
+        self._fitness_text = _text_box(ax, 0.87)
+        return (self._line, self._markers, self._gen_text, self._fitness_text)
+
+    def _update(self, frame_number):
+        generation = self.frame_generations[frame_number]
+        self._line.set_data(self.x_vals[:generation + 1], self.y_vals[:generation + 1])
+        shown = np.searchsorted(self.improvement_indices, generation, side='right')
+        self._markers.set_offsets(self.improvement_points[:shown])
+        self._gen_text.set_text(f'Generación: {generation + 1}')
+        self._fitness_text.set_text(f'Fitness: {self.y_vals[generation]:.4f}')
+
+
+class _PopulationFrameRenderer(_FrameRenderer):
+    """Nube de la población sobre la curva de la función objetivo.
+
+    x_frames y fitness_frames son matrices (cuadros, individuos) precalculadas: cada
+    cuadro solo copia una fila en el búfer de posiciones del scatter, sin decodificar.
+    """
+
+    def __init__(self, x_frames, fitness_frames, frame_generations, curve_x, curve_y,
+                 x_min, x_max, is_minimizing, **figure_options):
+        super().__init__(frame_generations, **figure_options)
+        self.x_frames = x_frames
+        self.fitness_frames = fitness_frames
+        self.curve_x = curve_x
+        self.curve_y = curve_y
+        self.x_min = x_min
+        self.x_max = x_max
+        self.is_minimizing = is_minimizing
+
+    def _build(self, fig):
+        fitness = self.fitness_frames
+        ranked = np.where(np.isfinite(fitness), fitness, np.inf if self.is_minimizing else -np.inf)
+        self.best_indices = ranked.argmin(axis=1) if self.is_minimizing else ranked.argmax(axis=1)
+        self._offsets = np.empty((fitness.shape[1], 2))
+
+        ax = fig.add_subplot(111)
+        mode_text = "Minimizando" if self.is_minimizing else "Maximizando"
+        ax.plot(self.curve_x, self.curve_y, 'b-', linewidth=2, alpha=0.6, label='f(x)')
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('f(x)', fontsize=12)
+        ax.set_title(f'Evolución de la Población ({mode_text})', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+
+        all_y = np.concatenate((np.asarray(self.curve_y, dtype=float), fitness.ravel()))
+        all_y = all_y[np.isfinite(all_y)]
+        y_low = all_y.min() if all_y.size else 0
+        y_high = all_y.max() if all_y.size else 1
+        padding = (y_high - y_low) * 0.05 if y_high > y_low else 1
+        ax.set_ylim(y_low - padding, y_high + padding)
+        ax.set_xlim(self.x_min, self.x_max)
+
+        self._cloud = ax.scatter(self._offsets[:, 0], self._offsets[:, 1], s=25, color='green',
+                                 alpha=0.6, edgecolors='none', zorder=4)
+        self._best = ax.scatter([np.nan], [np.nan], s=160, marker='*', color='red', zorder=5)
+        self._gen_text = _text_box(ax, 0.95)
+        self._fitness_text = _text_box(ax, 0.87)
+        return (self._cloud, self._best, self._gen_text, self._fitness_text)
+
+    def _update(self, frame_number):
+        self._offsets[:, 0] = self.x_frames[frame_number]
+        self._offsets[:, 1] = self.fitness_frames[frame_number]
+        self._cloud.set_offsets(self._offsets)
+        best = self.best_indices[frame_number]
+        self._best.set_offsets(self._offsets[best:best + 1])
+        self._gen_text.set_text(f'Generación: {self.frame_generations[frame_number] + 1}')
+        self._fitness_text.set_text(f'Mejor: f({self._offsets[best, 0]:.4f}) = {self._offsets[best, 1]:.4f}')
+
+
+# --- Estado y funciones de los procesos que dibujan cuadros (deben ser de nivel de módulo) ---
+_worker_renderer = None
+
+
+def _init_frame_worker(renderer):
+    global _worker_renderer
+    _worker_renderer = renderer
+
+
+def _render_frame_chunk(frame_numbers):
+    return [_worker_renderer.render(i) for i in frame_numbers]
+
+
+class _FFMpegRawWriter:
+    """Envía cuadros RGB crudos a ffmpeg por stdin"""
+
+    def __init__(self, filename, size, fps):
+        import matplotlib
+        width, height = size
+        command = [
+            matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-', '-an', '-vcodec', 'libx264', '-pix_fmt', 'yuv420p',
+            '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', filename
+        ]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def write(self, frame_bytes):
+        self.process.stdin.write(frame_bytes)
+
+    def finish(self):
+        self.process.stdin.close()
+        stderr = self.process.stderr.read()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg terminó con error: {stderr.decode(errors='replace').strip()}")
+
+    def abort(self):
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+
+class _PillowGifWriter:
+    """Escribe el GIF cuadro a cuadro (cada uno con su paleta local), sin acumularlos
+
+    Usa getheader/getdata de GifImagePlugin, que codifican la cabecera global y
+    cada cuadro por separado; así la memoria no crece con el número de cuadros.
+    """
+
+    def __init__(self, filename, size, fps):
+        self.filename = filename
+        self.size = size
+        self.duration_ms = int(round(1000 / fps))
+        self._file = open(filename, 'wb')
+        self._frames_written = 0
+
+    def write(self, frame_bytes):
+        from PIL import Image, GifImagePlugin
+        image = Image.frombuffer('RGB', self.size, frame_bytes, 'raw', 'RGB', 0, 1)
+        image = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        if self._frames_written == 0:
+            header, _ = GifImagePlugin.getheader(image, None, {'loop': 0})
+            self._file.write(b''.join(header))
+        self._file.write(b''.join(GifImagePlugin.getdata(image, (0, 0), duration=self.duration_ms,
+                                                           include_color_table=True)))
+        self._frames_written += 1
+
+    def finish(self):
+        self._file.write(b';')  # fin del GIF
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+
 class AnimationGenerator:
+    """Exporta animaciones a MP4 (ffmpeg) o GIF (Pillow): la evolución del mejor
+    fitness (generate) o la nube de la población sobre f(x) (generate_population).
+
+    Los historiales largos se reducen a lo sumo MAX_FRAMES cuadros (sin perder
+    las generaciones con mejora), los cuadros se dibujan en paralelo en procesos
+    trabajadores (iniciados con 'spawn': la interfaz Qt no se bifurca) y se
+    envían al escritor como RGB crudo, en orden, a medida que terminan.
+    """
+
+    MAX_FRAMES = 600
+    GIF_MAX_FRAMES = 300          # el GIF no comprime entre cuadros: menos cuadros
+    FPS = 5                       # una generación por cuadro
+    DECIMATED_FPS = 20            # cuando se saltan generaciones
+    FRAMES_PER_TASK = 8
+    MIN_PARALLEL_FRAMES = 32      # por debajo se dibuja en el proceso actual
+    POPULATION_MEMORY_BUDGET = 128 * 1024 * 1024  # bytes para x y fitness precalculados
+
     def __init__(self):
         pass
 
-    def generate(self, filename, best_fitness_history, is_minimizing):
-        import matplotlib.pyplot as plt
-        import matplotlib.animation as animation
-        import numpy as np
+    def _render(self, renderer, writer_factory, workers):
+        """Dibuja todos los cuadros del renderer y los escribe en orden"""
+        chunks = [
+            range(start, min(start + self.FRAMES_PER_TASK, renderer.frame_count))
+            for start in range(0, renderer.frame_count, self.FRAMES_PER_TASK)
+        ]
+        writer = None
+        try:
+            if workers <= 1 or renderer.frame_count < self.MIN_PARALLEL_FRAMES:
+                rendered_chunks = ([renderer.render(i) for i in chunk] for chunk in chunks)
+                for rendered in rendered_chunks:
+                    for size, frame_bytes in rendered:
+                        writer = writer or writer_factory(size)
+                        writer.write(frame_bytes)
+            else:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context(DEFAULT_START_METHOD),
+                                         initializer=_init_frame_worker, initargs=(renderer,)) as executor:
+                    # Pocas tareas en vuelo: la memoria no crece con la longitud del historial
+                    pending = deque()
+                    chunk_iter = iter(chunks)
+                    for chunk in itertools.islice(chunk_iter, 2 * workers):
+                        pending.append(executor.submit(_render_frame_chunk, list(chunk)))
+                    while pending:
+                        for size, frame_bytes in pending.popleft().result():
+                            writer = writer or writer_factory(size)
+                            writer.write(frame_bytes)
+                        next_chunk = next(chunk_iter, None)
+                        if next_chunk is not None:
+                            pending.append(executor.submit(_render_frame_chunk, list(next_chunk)))
+            writer.finish()
+        except Exception:
+            if writer is not None:
+                writer.abort()
+            raise
+
+    def _resolve_output(self, filename, max_frames):
+        """Normaliza la extensión (MP4 por defecto) y el límite de cuadros"""
+        is_gif = filename.endswith('.gif')
+        if not is_gif and not filename.endswith('.mp4'):
+            filename = f"{filename}.mp4"
+        if max_frames is None:
+            max_frames = self.GIF_MAX_FRAMES if is_gif else self.MAX_FRAMES
+        return filename, is_gif, max_frames
+
+    def _export(self, filename, is_gif, renderer, decimated, workers):
+        fps = self.DECIMATED_FPS if decimated else self.FPS
+        writer_class = _PillowGifWriter if is_gif else _FFMpegRawWriter
+        self._render(renderer, lambda size: writer_class(filename, size, fps), workers or os.cpu_count() or 1)
+        return {"success": True, "message": f"Animación guardada exitosamente en:\n{filename}"}
+
+    @staticmethod
+    def _error_result(e):
+        msg = str(e)
+        if isinstance(e, FileNotFoundError) or "ffmpeg" in msg.lower():
+            msg = ("Para guardar animaciones en formato MP4, necesita tener FFmpeg instalado.\n"
+                   "Visite: https://www.ffmpeg.org/download.html\n\n"
+                   "Alternativamente, intente guardar como GIF (.gif)\n\n" + msg)
+        return {"success": False, "message": f"No se pudo generar la animación: {msg}"}
 
+    def generate(self, filename, best_fitness_history, is_minimizing, max_frames=None, workers=None):
         try:
-            fig = plt.figure(figsize=(10, 6), dpi=100)
-            ax = fig.add_subplot(111)
-            ax.set_xlabel('Generación', fontsize=12)
-            ax.set_ylabel('Mejor Fitness (Valor real)', fontsize=12)
-            ax.set_title('Evolución del Mejor Individuo', fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-
-            y_vals = best_fitness_history
-            min_fitness = min(y_vals) if y_vals else 0
-            max_fitness = max(y_vals) if y_vals else 1
-            padding = (max_fitness - min_fitness) * 0.1 if (max_fitness - min_fitness) > 0 else 1
-            ax.set_ylim(min_fitness - padding, max_fitness + padding)
-            ax.set_xlim(-1, len(best_fitness_history) if best_fitness_history else 1)
-
-            line, = ax.plot([], [], 'g-', linewidth=2, marker='o', markersize=6)
-            gen_text = ax.text(0.02, 0.95, 'Generación: 0', transform=ax.transAxes, fontsize=10,
-                               verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-            initial_fitness_text = f'Fitness: {best_fitness_history[0]:.4f}' if best_fitness_history else 'Fitness: N/A'
-            fitness_text = ax.text(0.02, 0.87, initial_fitness_text, transform=ax.transAxes, fontsize=10,
-                                   verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-
-            improvements_indices = []
-            if best_fitness_history:
-                for i in range(1, len(best_fitness_history)):
-                    condition = best_fitness_history[i] < best_fitness_history[i-1] if is_minimizing else best_fitness_history[i] > best_fitness_history[i-1]
-                    if condition:
-                        improvements_indices.append(i)
-
-            def init():
-                line.set_data([], [])
-                gen_text.set_text('Generación: 0')
-                fitness_text.set_text(initial_fitness_text)
-                return line, gen_text, fitness_text
-
-            def animate_frame(i):
-                if not best_fitness_history:
-                    return line, gen_text, fitness_text
-                x_data = list(range(i + 1))
-                y_data = best_fitness_history[:i + 1]
-                line.set_data(x_data, y_data)
-                gen_text.set_text(f'Generación: {i + 1}')
-                fitness_text.set_text(f'Fitness: {best_fitness_history[i]:.4f}')
-                if i in improvements_indices:
-                    ax.scatter([i], [best_fitness_history[i]], color='orange', s=100, zorder=5)
-                return line, gen_text, fitness_text
-
-            num_frames = len(best_fitness_history) if best_fitness_history else 0
-            if num_frames == 0:
-                plt.close(fig)
+            if len(best_fitness_history) == 0:
                 return {"success": False, "message": "No hay datos para generar la animación."}
+            filename, is_gif, max_frames = self._resolve_output(filename, max_frames)
+            frame_generations = select_animation_frames(best_fitness_history, is_minimizing, max_frames)
+            renderer = _BestFitnessFrameRenderer(best_fitness_history, is_minimizing, frame_generations)
+            decimated = len(frame_generations) < len(best_fitness_history)
+            return self._export(filename, is_gif, renderer, decimated, workers)
+        except Exception as e:
+            return self._error_result(e)
 
-            anim = animation.FuncAnimation(fig, animate_frame, init_func=init, frames=num_frames, interval=200, blit=True)
+    def generate_population(self, filename, ga_results, population_history, fitness_history,
+                            best_fitness_history, max_frames=None, workers=None, function_provider=None):
+        """
+        Anima la nube de la población sobre la curva de f(x), un cuadro por generación.
 
-            if filename.endswith('.mp4'):
-                writer = animation.FFMpegWriter(fps=5)
-                anim.save(filename, writer=writer)
-            elif filename.endswith('.gif'):
-                writer = animation.PillowWriter(fps=5)
-                anim.save(filename, writer=writer)
-            else:
-                writer = animation.FFMpegWriter(fps=5)
-                anim.save(f"{filename}.mp4", writer=writer)
+        Las posiciones x de las generaciones animadas se decodifican una sola vez a
+        una matriz (cuadros, individuos). Para respetar POPULATION_MEMORY_BUDGET con
+        poblaciones grandes se reduce el número de cuadros (conservando las mejoras).
+        """
+        try:
+            n_generations = min(len(population_history), len(best_fitness_history))
+            if n_generations == 0 or len(population_history[0]) == 0:
+                return {"success": False, "message": "No hay historial de población para generar la animación."}
+            filename, is_gif, max_frames = self._resolve_output(filename, max_frames)
+            is_minimizing = ga_results['is_minimizing']
+            x_min, x_max, n_bits = ga_results['x_min'], ga_results['x_max'], ga_results['n_bits']
+            function_provider = function_provider or get_function_provider()
 
-            plt.close(fig)
-            return {"success": True, "message": f"Animación guardada exitosamente en:\n{filename}"}
+            # Historial parcial (política de retención): una entrada por generación guardada
+            n_entries = len(population_history)
+            kept = history_generation_numbers(ga_results, n_entries)
+            kept = kept[kept < len(best_fitness_history)]
+            n_generations = len(kept)
+            if n_generations == 0:
+                return {"success": False, "message": "No hay historial de población para generar la animación."}
+
+            pop_size = len(population_history[0])
+            budget_frames = max(2, self.POPULATION_MEMORY_BUDGET // (pop_size * 2 * 8))
+            frame_entries = select_animation_frames(
+                np.asarray(best_fitness_history, dtype=float)[kept], is_minimizing, min(max_frames, budget_frames)
+            )
+            frame_generations = kept[frame_entries]
+
+            x_frames = np.empty((len(frame_entries), pop_size))
+            fitness_frames = np.empty_like(x_frames)
+            for frame_number, entry in enumerate(frame_entries):
+                x_frames[frame_number] = decode_population(population_history[entry], x_min, x_max, n_bits)
+                if fitness_history is not None and len(fitness_history) > 0:
+                    fitness_frames[frame_number] = fitness_history[entry]
+                else:
+                    fitness_frames[frame_number] = function_provider.get_raw_function_values(x_frames[frame_number])
 
+            curve_x, curve_y = sample_function_curve(function_provider, x_min, x_max)
+            renderer = _PopulationFrameRenderer(
+                x_frames, fitness_frames, frame_generations, curve_x, curve_y, x_min, x_max, is_minimizing
+            )
+            decimated = len(frame_generations) < n_generations
+            return self._export(filename, is_gif, renderer, decimated, workers)
         except Exception as e:
-            plt.close('all')
-            msg = str(e)
-            if "MovieWriter" in msg or "ffmpeg" in msg.lower():
-                msg = ("Para guardar animaciones en formato MP4, necesita tener FFmpeg instalado.\n"
-                       "Visite: https://www.ffmpeg.org/download.html\n\n"
-                       "Alternativamente, intente guardar como GIF (.gif)\n\n" + msg)
-            return {"success": False, "message": f"No se pudo generar la animación: {msg}"}
\ No newline at end of file
+            return self._error_result(e)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Proveedor de función objetivo externa (simuladores propios)
+
+El objetivo lo calcula un proceso local de larga duración que habla un protocolo
+binario simple por stdin/stdout. Cada mensaje (petición o respuesta) es:
+
+    b'GAEV' | uint32 n (little-endian) | n valores float64 (little-endian)
+
+El AG envía la población completa de una generación en un solo mensaje por
+proceso trabajador, así el costo de ida y vuelta por generación es constante y
+no depende del número de individuos. Con `pool_size > 1` el lote se reparte en
+partes contiguas entre varios procesos que trabajan en paralelo.
+
+Del lado del simulador, `serve(func)` implementa el protocolo para funciones
+escritas en Python (func recibe un arreglo de x y devuelve un arreglo de f(x)).
+"""
+
+import shlex
+import struct
+import subprocess
+import sys
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait
+
+MAGIC = b'GAEV'
+_HEADER = struct.Struct('<4sI')
+_FLOAT_DTYPE = np.dtype('<f8')
+
+
+def _read_exact(stream, nbytes):
+    chunks = []
+    while nbytes > 0:
+        chunk = stream.read(nbytes)
+        if not chunk:
+            raise EOFError("El proceso externo cerró la conexión")
+        chunks.append(chunk)
+        nbytes -= len(chunk)
+    return b''.join(chunks)
+
+
+def write_message(stream, values):
+    """Escribe un mensaje del protocolo con los valores dados"""
+    array = np.ascontiguousarray(values, dtype=_FLOAT_DTYPE).ravel()
+    stream.write(_HEADER.pack(MAGIC, array.size))
+    stream.write(array.tobytes())
+    stream.flush()
+
+
+def read_message(stream):
+    """Lee un mensaje del protocolo; devuelve None si el otro extremo cerró antes de la cabecera"""
+    header = stream.read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        header += _read_exact(stream, _HEADER.size - len(header))
+    magic, count = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"Mensaje inválido del proceso externo (cabecera {magic!r})")
+    return np.frombuffer(_read_exact(stream, count * _FLOAT_DTYPE.itemsize), dtype=_FLOAT_DTYPE)
+
+
+def serve(func, stdin=None, stdout=None):
+    """Atiende peticiones del AG por stdin/stdout hasta que se cierre la entrada.
+
+    Args:
+        func: Función vectorizada (arreglo de x -> arreglo de f(x)).
+    """
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    while True:
+        x_values = read_message(stdin)
+        if x_values is None:
+            break
+        result = np.asarray(func(x_values), dtype=float)
+        write_message(stdout, np.broadcast_to(result, x_values.shape))
+
+
+class _ExternalWorker:
+    """Un proceso externo y su canal stdin/stdout"""
+
+    def __init__(self, command):
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0
+        )
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def round_trip(self, x_values):
+        write_message(self.process.stdin, x_values)
+        result = read_message(self.process.stdout)
+        if result is None:
+            raise EOFError("El proceso externo terminó sin responder")
+        if result.size != x_values.size:
+            raise ValueError(
+                f"El proceso externo devolvió {result.size} valores para {x_values.size} entradas"
+            )
+        return result
+
+    def close(self):
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=1.0)
+            except Exception:
+                self.process.kill()
+                self.process.wait()
+
+
+class ExternalFunctionProvider:
+    """Proveedor intercambiable con CustomFunctionProvider que evalúa en procesos externos"""
+
+    # Ya reparte cada lote entre sus propios procesos: no conviene envolverlo en otro pool
+    manages_own_workers = True
+
+    def __init__(self, command, pool_size: int = 1, timeout: float = 30.0, label: str = None):
+        """
+        Args:
+            command: Comando del simulador (lista de argumentos o cadena).
+            pool_size: Número de procesos externos que atienden cada lote en paralelo.
+            timeout: Tiempo máximo (s) por lote; si se supera se reinician los procesos.
+            label: Texto a mostrar como función (por defecto, el comando).
+        """
+        self.command = shlex.split(command) if isinstance(command, str) else list(command)
+        self.pool_size = max(1, int(pool_size))
+        self.timeout = timeout
+        self.function_text = label or f"externa: {' '.join(self.command)}"
+        self._workers = []
+        self._threads = None
+        self._lock = threading.Lock()
+
+    # --- Serialización: solo la configuración, los procesos se crean en el destino ---
+    def __getstate__(self):
+        return {
+            'command': self.command, 'pool_size': self.pool_size,
+            'timeout': self.timeout, 'function_text': self.function_text
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state['command'], state['pool_size'], state['timeout'], state['function_text'])
+
+    def __repr__(self):
+        return f"ExternalFunctionProvider({self.command!r}, pool_size={self.pool_size})"
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def copy(self):
+        """Devuelve un proveedor independiente (con sus propios procesos) con la misma configuración"""
+        return ExternalFunctionProvider(self.command, self.pool_size, self.timeout, self.function_text)
+
+    # --- Gestión de procesos ---
+    def _ensure_workers(self):
+        self._workers = [w for w in self._workers if w.is_alive()]
+        while len(self._workers) < self.pool_size:
+            self._workers.append(_ExternalWorker(self.command))
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.pool_size)
+
+    def _kill_workers(self):
+        for worker in self._workers:
+            worker.process.kill()
+            worker.process.wait()
+        self._workers = []
+
+    def close(self):
+        with self._lock:
+            for worker in self._workers:
+                worker.close()
+            self._workers = []
+            if self._threads is not None:
+                self._threads.shutdown(wait=False)
+                self._threads = None
+
+    # --- Evaluación ---
+    def get_raw_function_values(self, x_values) -> np.ndarray:
+        """Evalúa un lote completo: un mensaje por proceso externo
+
+        Raises:
+            TimeoutError: Si el lote no termina dentro de `timeout` segundos.
+        """
+        x_array = np.asarray(x_values, dtype=float)
+        flat = np.ascontiguousarray(x_array.ravel())
+        if flat.size == 0:
+            return np.empty(x_array.shape)
+
+        with self._lock:
+            self._ensure_workers()
+            parts = np.array_split(flat, min(self.pool_size, flat.size))
+            futures = [
+                self._threads.submit(worker.round_trip, part)
+                for worker, part in zip(self._workers, parts)
+            ]
+            done, pending = wait(futures, timeout=self.timeout)
+            if pending:
+                # Los procesos colgados se reinician en el siguiente lote
+                self._kill_workers()
+                raise TimeoutError(
+                    f"El proceso externo no respondió en {self.timeout} s ({self.function_text})"
+                )
+            try:
+                results = [future.result() for future in futures]
+            except Exception:
+                self._kill_workers()
+                raise
+        return np.concatenate(results).reshape(x_array.shape)
+
+    def get_raw_function_value(self, x_val):
+        try:
+            return float(self.get_raw_function_values([x_val])[0])
+        except TimeoutError:
+            raise
+        except Exception as e:
+            print(f"Error evaluating function '{self.function_text}' at x={x_val}: {e}")
+            return np.nan
+
+    def evaluate(self, x_val, is_minimizing):
+        raw_value = self.get_raw_function_value(x_val)
+        return -raw_value if is_minimizing else raw_value
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Proveedores de la función objetivo
+
+Un proveedor se serializa solo como (texto de la función, backend) y recompila
+la expresión de forma perezosa en cada proceso, así puede enviarse a procesos
+trabajadores (pickle) y usarse desde varios hilos a la vez.
+"""
+
+import threading
+import numpy as np
+from sympy import DiracDelta, S, diff, symbols, sympify, lambdify
+
+from utils.keyboard_utils import prepare_function_for_eval
+
+DEFAULT_FUNCTION_TEXT = "ln(1+abs(x**7)) + pi*cos(x) + sin(15.5*x)"
+FALLBACK_FUNCTION_TEXT = "x**2"
+
+# Módulos de lambdify para cada backend disponible
+#   - 'numpy': vectorizado, acepta arreglos completos
+#   - 'math': escalar, más rápido para evaluar un solo valor
+BACKEND_MODULES = {
+    'numpy': lambda: ['numpy', {'abs': np.abs, 'sign': np.sign}],
+    'math': lambda: ['math'],
+}
+
+# Caché de funciones compiladas del proceso actual: (texto, backend, derivada) -> función
+_compiled_cache = {}
+_compiled_cache_lock = threading.Lock()
+
+
+def _derivative_expression(expr, order: int):
+    """Derivada de orden `order` respecto de x tomada como real (abs -> sign)"""
+    x, x_real = symbols('x'), symbols('x', real=True)
+    derivative = diff(expr.subs(x, x_real), x_real, order)
+    # Las deltas de Dirac (derivadas de sign) son nulas casi en todo punto
+    derivative = derivative.replace(lambda e: isinstance(e, DiracDelta), lambda e: S.Zero)
+    return derivative.subs(x_real, x)
+
+
+def compile_function_text(function_text: str, backend: str = 'numpy', derivative: int = 0):
+    """Compila el texto de una función con sympy (o lo toma de la caché del proceso)
+
+    Con `derivative` > 0 se compila la derivada exacta de ese orden, por el
+    mismo camino de lambdify.
+
+    Raises:
+        ValueError: Si el backend no existe.
+        SympifyError: Si el texto no es una expresión válida.
+    """
+    if backend not in BACKEND_MODULES:
+        raise ValueError(
+            f"Backend '{backend}' no soportado. Opciones: {list(BACKEND_MODULES.keys())}"
+        )
+    key = (function_text, backend, derivative)
+    with _compiled_cache_lock:
+        compiled = _compiled_cache.get(key)
+        if compiled is None:
+            expr = sympify(prepare_function_for_eval(function_text))
+            if derivative:
+                expr = _derivative_expression(expr, derivative)
+            compiled = lambdify(symbols('x'), expr, modules=BACKEND_MODULES[backend]())
+            _compiled_cache[key] = compiled
+    return compiled
+
+
+class CustomFunctionProvider:
+    """Proveedor de la función objetivo definida como expresión de sympy"""
+
+    def __init__(self, function_text: str = DEFAULT_FUNCTION_TEXT, backend: str = 'numpy'):
+        if backend not in BACKEND_MODULES:
+            raise ValueError(
+                f"Backend '{backend}' no soportado. Opciones: {list(BACKEND_MODULES.keys())}"
+            )
+        self.function_text = function_text
+        self.backend = backend
+        self._compiled_function = None
+        self._compiled_derivatives = {}
+        self._lock = threading.Lock()
+
+    # --- Serialización: solo texto + backend, se recompila en el destino ---
+    def __getstate__(self):
+        return {'function_text': self.function_text, 'backend': self.backend}
+
+    def __setstate__(self, state):
+        self.function_text = state['function_text']
+        self.backend = state['backend']
+        self._compiled_function = None
+        self._compiled_derivatives = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"CustomFunctionProvider({self.function_text!r}, backend={self.backend!r})"
+
+    def copy(self):
+        """Devuelve un proveedor independiente con la misma función (para una ejecución del AG)"""
+        return CustomFunctionProvider(self.function_text, self.backend)
+
+    @property
+    def compiled_function(self):
+        compiled = self._compiled_function
+        if compiled is None:
+            with self._lock:
+                if self._compiled_function is None:
+                    self._compiled_function = self._compile_current_function()
+                compiled = self._compiled_function
+        return compiled
+
+    def _compile_current_function(self):
+        try:
+            return compile_function_text(self.function_text, self.backend)
+        except Exception:
+            print(f"Warning: Failed to compile '{self.function_text}'. Using x**2 as fallback.")
+            return compile_function_text(FALLBACK_FUNCTION_TEXT, self.backend)
+
+    def set_function(self, text, compiled_func=None):
+        """Cambia la función objetivo.
+
+        `compiled_func` se acepta por compatibilidad, pero el proveedor siempre
+        recompila desde el texto para que todos los procesos evalúen la misma expresión.
+        """
+        with self._lock:
+            self.function_text = text
+            self._compiled_function = None
+            self._compiled_derivatives = {}
+
+    def evaluate(self, x_val, is_minimizing):
+        raw_value = self.get_raw_function_value(x_val)
+        return -raw_value if is_minimizing else raw_value
+
+    def get_raw_function_value(self, x_val):
+        compiled = self.compiled_function
+        try:
+            return float(compiled(x_val))
+        except Exception as e:
+            print(f"Error evaluating function '{self.function_text}' at x={x_val}: {e}")
+            return np.nan
+
+    def get_raw_function_values(self, x_values) -> np.ndarray:
+        """Evalúa la función en un arreglo de valores x (en bloque si el backend lo permite)"""
+        x_array = np.asarray(x_values, dtype=float)
+        if self.backend == 'numpy':
+            try:
+                with np.errstate(all='ignore'):
+                    result = np.asarray(self.compiled_function(x_array), dtype=float)
+                # Expresiones constantes devuelven un escalar
+                return np.broadcast_to(result, x_array.shape).copy()
+            except Exception:
+                pass
+        return np.fromiter(
+            (self.get_raw_function_value(x) for x in x_array.ravel()),
+            dtype=float, count=x_array.size
+        ).reshape(x_array.shape)
+
+    def get_derivative_values(self, x_values, order: int = 1) -> np.ndarray:
+        """
+        Derivada exacta (simbólica) de orden `order` en un arreglo de valores x.
+
+        Se compila una sola vez por proveedor, siempre vectorizada (backend
+        numpy). Devuelve NaN si la expresión no se puede derivar o evaluar.
+        """
+        x_array = np.asarray(x_values, dtype=float)
+        with self._lock:
+            if order not in self._compiled_derivatives:
+                try:
+                    self._compiled_derivatives[order] = compile_function_text(self.function_text, 'numpy', order)
+                except Exception:
+                    print(f"Warning: Failed to differentiate '{self.function_text}' (order {order}).")
+                    self._compiled_derivatives[order] = None
+            compiled = self._compiled_derivatives[order]
+        if compiled is None:
+            return np.full(x_array.shape, np.nan)
+        try:
+            with np.errstate(all='ignore'):
+                result = np.asarray(compiled(x_array), dtype=float)
+            return np.broadcast_to(result, x_array.shape).copy()
+        except Exception:
+            return np.full(x_array.shape, np.nan)
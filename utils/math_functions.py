@@ -8,11 +8,13 @@ Funciones matemáticas para el algoritmo genético
 import numpy as np
 from typing import List
 
-# Variable global para almacenar la instancia del proveedor de funciones
+# Proveedor de funciones de la interfaz (el que edita el usuario).
+# Cada ejecución del AG trabaja con su propia copia (ver GeneticAlgorithm.run),
+# por lo que cambiarlo no afecta a ejecuciones en curso.
 _function_provider = None
 
 def set_function_provider(provider):
-    """Establece el proveedor de funciones a usar globalmente"""
+    """Establece el proveedor de funciones de la interfaz"""
     global _function_provider
     _function_provider = provider
 
@@ -21,19 +23,18 @@ def get_function_provider():
     global _function_provider
     # Si no existe, usar la función predeterminada
     if _function_provider is None:
-        from ui.function_editor import CustomFunctionProvider  # Importación local
+        from utils.function_provider import CustomFunctionProvider  # Importación local
         _function_provider = CustomFunctionProvider()
-        # CustomFunctionProvider ahora intenta compilar su función predeterminada en __init__
     return _function_provider
 
-def objective_function(x: float, is_minimizing: bool) -> float:
+def objective_function(x: float, is_minimizing: bool, provider=None) -> float:
     """Función objetivo adaptada según modo de optimización (para uso del AG)"""
-    provider = get_function_provider()
+    provider = provider or get_function_provider()
     return provider.evaluate(x, is_minimizing)
 
-def get_raw_function_value(x: float) -> float:
+def get_raw_function_value(x: float, provider=None) -> float:
     """Obtiene el valor real de la función (para reportes y visualización)"""
-    provider = get_function_provider()
+    provider = provider or get_function_provider()
     return provider.get_raw_function_value(x)
 
 def binary_to_decimal(binary: List[int], x_min: float, x_max: float, n_bits: int) -> float:
@@ -56,4 +57,17 @@ def decimal_to_binary(decimal: int, n_bits: int) -> List[int]:
     for _ in range(n_bits):
         binary.insert(0, decimal % 2)
         decimal //= 2
-    return binary
\ No newline at end of file
+    return binary
+
+def decode_population(population, x_min: float, x_max: float, n_bits: int) -> np.ndarray:
+    """Convierte una población binaria (lista de individuos o arreglo (N, n_bits)) a valores x.
+
+    Versión vectorizada de `binary_to_decimal` para toda la población a la vez.
+    """
+    bits = np.asarray(population, dtype=np.float64)
+    if n_bits <= 0 or bits.size == 0:
+        return np.full(bits.shape[:-1] if bits.ndim > 1 else (len(population),), float(x_min))
+    weights = 2.0 ** np.arange(n_bits - 1, -1, -1)
+    decimal = bits @ weights
+    max_decimal = 2.0 ** n_bits - 1
+    return x_min + (decimal / max_decimal) * (x_max - x_min)
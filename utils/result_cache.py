@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Caché de resultados direccionada por contenido
+
+Con semilla, el resultado de una ejecución queda determinado por (algoritmo,
+texto de la función, parámetros, semilla). La clave es el SHA-256 de esos datos
+en JSON canónico y el valor es el archivo de ejecución .npz (utils/run_archive.py),
+que al leerse queda mapeado en memoria.
+
+El tamaño en disco está acotado: al guardar se eliminan las entradas usadas
+hace más tiempo (LRU por fecha de modificación, que se actualiza en cada acierto).
+Los aciertos y fallos se acumulan en stats.json para informar la tasa de aciertos.
+
+Ubicación por defecto: ~/.ga_visualizer/result_cache (GA_RESULT_CACHE_DIR);
+límite por defecto: 1024 MB (GA_RESULT_CACHE_MAX_MB).
+"""
+
+import os
+import json
+import hashlib
+import threading
+
+from utils.run_archive import save_run_archive, load_run_archive
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.ga_visualizer', 'result_cache')
+DEFAULT_MAX_MB = 1024
+CACHE_KEY_VERSION = 1
+
+# Parámetros que no cambian el resultado (solo cómo se calcula)
+EXECUTION_ONLY_PARAMS = ('evaluation_backend',)
+
+_STATS_FILE = 'stats.json'
+_ENTRY_SUFFIX = '.npz'
+
+
+def result_cache_key(algorithm_name, function_text, params, seed, function_backend=None):
+    """Clave (hex SHA-256) de una configuración de ejecución"""
+    relevant_params = {k: v for k, v in params.items()
+                       if k not in EXECUTION_ONLY_PARAMS and k != 'seed'}
+    payload = {
+        'version': CACHE_KEY_VERSION,
+        'algorithm': algorithm_name,
+        'function_text': function_text,
+        'function_backend': function_backend,
+        'params': relevant_params,
+        'seed': seed,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Caché en disco de ejecuciones completas, acotada por tamaño (LRU)"""
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = directory or os.environ.get('GA_RESULT_CACHE_DIR') or DEFAULT_CACHE_DIR
+        if max_bytes is None:
+            max_bytes = float(os.environ.get('GA_RESULT_CACHE_MAX_MB', DEFAULT_MAX_MB)) * 1024 * 1024
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    # --- Estadísticas ---
+    def _read_stats(self):
+        try:
+            with open(os.path.join(self.directory, _STATS_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'hits': 0, 'misses': 0}
+
+    def _count(self, field):
+        stats = self._read_stats()
+        stats[field] = stats.get(field, 0) + 1
+        tmp_path = os.path.join(self.directory, _STATS_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, os.path.join(self.directory, _STATS_FILE))
+
+    def stats(self):
+        """Aciertos, fallos, tasa de aciertos, entradas y bytes ocupados"""
+        with self._lock:
+            stats = self._read_stats()
+            entries = self._entries()
+        lookups = stats.get('hits', 0) + stats.get('misses', 0)
+        return {
+            'hits': stats.get('hits', 0),
+            'misses': stats.get('misses', 0),
+            'hit_rate': stats.get('hits', 0) / lookups if lookups else 0.0,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
+
+    # --- Entradas ---
+    def _entries(self):
+        """Lista de (ruta, tamaño, última modificación) de las entradas"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, info.st_size, info.st_mtime))
+        return entries
+
+    def get(self, key):
+        """Devuelve los resultados guardados (historiales mapeados en memoria) o None"""
+        path = self._entry_path(key)
+        with self._lock:
+            if not os.path.exists(path):
+                self._count('misses')
+                return None
+            try:
+                results = load_run_archive(path)
+            except (OSError, ValueError):
+                # Entrada dañada: se descarta y se cuenta como fallo
+                self._remove(path)
+                self._count('misses')
+                return None
+            os.utime(path)  # más recientemente usada
+            self._count('hits')
+        results['cache_path'] = path
+        return results
+
+    def put(self, key, results):
+        """Guarda los resultados de una ejecución y aplica el límite de tamaño; devuelve la ruta"""
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with self._lock:
+            try:
+                save_run_archive(tmp_path, results['ga_results'], results['population_history'],
+                                 results['fitness_history'], results['best_fitness_history'])
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._evict(keep=path)
+        return path
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # p. ej. en Windows, si sigue mapeada en memoria
+
+    def _evict(self, keep=None):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            for path, _, _ in self._entries():
+                self._remove(path)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """Caché compartida del proceso (se crea al primer uso)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache()
+        return _cache
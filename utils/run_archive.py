@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Archivo de ejecución (.npz) para guardar y reabrir resultados del AG
+
+Es un .npz estándar (se puede abrir con np.load) con:
+  - metadata.json: versión del formato y ga_results (parámetros, texto de la
+    función, semilla, mejor solución, población final).
+  - population_history.npy: bits de la población por generación, uint8 (G, P, n_bits).
+  - fitness_history.npy: fitness real por generación, float64 (G, P).
+  - best_fitness_history.npy: mejor fitness real por generación, float64 (G,).
+
+Los miembros se guardan sin comprimir para que load_run_archive pueda mapearlos
+en memoria (np.memmap) directamente desde su posición dentro del zip: abrir un
+historial de varios GB no lee los datos hasta que se grafican.
+"""
+
+import json
+import struct
+import zipfile
+import numpy as np
+
+RUN_ARCHIVE_FORMAT_VERSION = 1
+RUN_ARCHIVE_FILTER = "Ejecución AG (*.npz)"
+
+_METADATA_MEMBER = 'metadata.json'
+_HISTORY_MEMBERS = ('population_history', 'fitness_history', 'best_fitness_history')
+_HISTORY_DTYPES = {
+    'population_history': np.uint8,
+    'fitness_history': np.float64,
+    'best_fitness_history': np.float64,
+}
+_LOCAL_HEADER = struct.Struct('<4s5H3I2H')  # cabecera local de un miembro zip (30 bytes)
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tipo no serializable en ga_results: {type(value).__name__}")
+
+
+def _history_shape(name, history):
+    """Forma del arreglo apilado sin materializarlo"""
+    if isinstance(history, np.ndarray):
+        return history.shape
+    if len(history) == 0:
+        return (0,)
+    if name == 'best_fitness_history':
+        return (len(history),)
+    return (len(history),) + np.shape(history[0])
+
+
+def _write_npy_member(archive, name, history):
+    """Escribe un .npy generación a generación (sin apilar todo el historial en memoria)"""
+    dtype = np.dtype(_HISTORY_DTYPES[name])
+    header = {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False,
+              'shape': _history_shape(name, history)}
+    with archive.open(f'{name}.npy', 'w', force_zip64=True) as member:
+        np.lib.format.write_array_header_2_0(member, header)
+        if name == 'best_fitness_history':
+            member.write(np.ascontiguousarray(history, dtype=dtype).tobytes())
+            return
+        for generation in history:
+            member.write(np.ascontiguousarray(generation, dtype=dtype).tobytes())
+
+
+def save_run_archive(filename, ga_results, population_history, fitness_history, best_fitness_history):
+    """Guarda una ejecución completa en `filename` (.npz sin comprimir)"""
+    metadata = {'format_version': RUN_ARCHIVE_FORMAT_VERSION, 'ga_results': ga_results}
+    histories = {
+        'population_history': population_history,
+        'fitness_history': fitness_history,
+        'best_fitness_history': best_fitness_history,
+    }
+    with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        archive.writestr(_METADATA_MEMBER, json.dumps(metadata, default=_json_default, ensure_ascii=False))
+        for name in _HISTORY_MEMBERS:
+            _write_npy_member(archive, name, histories[name])
+    return filename
+
+
+def _memmap_member(filename, file_handle, info):
+    """Mapea en memoria un .npy almacenado (sin comprimir) dentro del zip"""
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"El miembro '{info.filename}' está comprimido y no se puede mapear en memoria")
+    file_handle.seek(info.header_offset)
+    fields = _LOCAL_HEADER.unpack(file_handle.read(_LOCAL_HEADER.size))
+    name_length, extra_length = fields[-2], fields[-1]
+    file_handle.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+
+    version = np.lib.format.read_magic(file_handle)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file_handle)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file_handle)
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode='r', offset=file_handle.tell(), shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def load_run_archive(filename):
+    """
+    Abre un archivo de ejecución con los historiales mapeados en memoria.
+
+    Returns:
+        El mismo diccionario que GeneticAlgorithm.run(): 'ga_results',
+        'population_history', 'fitness_history' y 'best_fitness_history'.
+
+    Raises:
+        ValueError: Si el archivo no es un archivo de ejecución válido.
+    """
+    try:
+        archive = zipfile.ZipFile(filename, 'r')
+    except zipfile.BadZipFile:
+        raise ValueError(f"'{filename}' no es un archivo de ejecución del AG: no es un .npz válido") from None
+    with archive:
+        try:
+            metadata = json.loads(archive.read(_METADATA_MEMBER).decode('utf-8'))
+            infos = {name: archive.getinfo(f'{name}.npy') for name in _HISTORY_MEMBERS}
+        except KeyError as e:
+            raise ValueError(f"'{filename}' no es un archivo de ejecución del AG: falta {e}") from None
+    if metadata.get('format_version', 0) > RUN_ARCHIVE_FORMAT_VERSION:
+        raise ValueError(f"Versión de archivo de ejecución no soportada: {metadata.get('format_version')}")
+
+    results = {'ga_results': metadata['ga_results']}
+    with open(filename, 'rb') as file_handle:
+        for name in _HISTORY_MEMBERS:
+            results[name] = _memmap_member(filename, file_handle, infos[name])
+    return results
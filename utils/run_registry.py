@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Registro local (SQLite) de las ejecuciones del AG
+
+Cada ejecución guarda sus parámetros, el texto de la función, la semilla, los
+resultados principales, la duración y (si existe) la ruta de su archivo .npz.
+La tabla está indexada por función y por parámetros para consultar rápido
+cientos de ejecuciones.
+
+Las inserciones de un barrido de parámetros se agrupan en una sola transacción
+con record_runs() (o con registry.batch() alrededor de varias escrituras); así
+se registran las semillas de una ejecución con varias semillas
+(execute_multi_seed_ga) y cada ronda del ajuste de parámetros
+(algorithm/tuning.py).
+
+La ubicación por defecto es ~/.ga_visualizer/runs.sqlite3 (variable de entorno
+GA_RUN_REGISTRY para cambiarla).
+"""
+
+import os
+import json
+import sqlite3
+import datetime
+import threading
+from contextlib import contextmanager
+
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.expanduser('~'), '.ga_visualizer', 'runs.sqlite3')
+
+# Parámetros de la UI que tienen columna propia (el resto va en extra_params como JSON)
+_PARAM_COLUMNS = {
+    'interval_a': 'x_min', 'interval_b': 'x_max', 'delta_x': 'delta_x', 'pop_size': 'pop_size',
+    'num_generations': 'num_generations', 'prob_crossover': 'prob_crossover',
+    'prob_mutation_i': 'prob_mutation_i', 'prob_mutation_g': 'prob_mutation_g',
+    'is_minimizing': 'is_minimizing',
+}
+_RESULT_COLUMNS = ('seed', 'best_x', 'best_fitness', 'improvement')
+_COLUMNS = (
+    'created_at', 'algorithm', 'function_text', *_PARAM_COLUMNS.values(), *_RESULT_COLUMNS,
+    'duration_seconds', 'archive_path', 'extra_params'
+)
+_ORDERABLE = set(_COLUMNS) | {'id'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    function_text TEXT NOT NULL,
+    x_min REAL, x_max REAL, delta_x REAL,
+    pop_size INTEGER, num_generations INTEGER,
+    prob_crossover REAL, prob_mutation_i REAL, prob_mutation_g REAL,
+    is_minimizing INTEGER,
+    seed INTEGER,
+    best_x REAL, best_fitness REAL, improvement REAL,
+    duration_seconds REAL,
+    archive_path TEXT,
+    extra_params TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_function ON runs (function_text, is_minimizing, best_fitness);
+CREATE INDEX IF NOT EXISTS idx_runs_params ON runs (
+    function_text, algorithm, x_min, x_max, delta_x, pop_size, num_generations,
+    prob_crossover, prob_mutation_i, prob_mutation_g, is_minimizing
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at);
+"""
+
+
+class RunRegistry:
+    """Registro de ejecuciones sobre SQLite"""
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('GA_RUN_REGISTRY') or DEFAULT_REGISTRY_PATH
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        with self._lock:
+            if self.path != ':memory:':
+                self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.executescript(_SCHEMA)
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- Escritura ---
+    @contextmanager
+    def batch(self):
+        """Agrupa todas las escrituras del bloque en una sola transacción"""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._connection.rollback()
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._connection.commit()
+
+    def _commit(self):
+        if self._batch_depth == 0:
+            self._connection.commit()
+
+    @staticmethod
+    def _row_values(algorithm, params, ga_results, duration_seconds, archive_path):
+        row = {
+            'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'algorithm': algorithm,
+            'function_text': ga_results.get('function_text_for_report', ''),
+            'duration_seconds': duration_seconds,
+            'archive_path': archive_path,
+        }
+        for param_name, column in _PARAM_COLUMNS.items():
+            value = params.get(param_name)
+            row[column] = int(value) if isinstance(value, bool) else value
+        for column in _RESULT_COLUMNS:
+            value = ga_results.get(column)
+            row[column] = None if value is None else (int(value) if column == 'seed' else float(value))
+        extra = {k: v for k, v in params.items() if k not in _PARAM_COLUMNS}
+        row['extra_params'] = json.dumps(extra, default=str, sort_keys=True) if extra else None
+        return tuple(row[column] for column in _COLUMNS)
+
+    def record_run(self, algorithm, params, ga_results, duration_seconds=None, archive_path=None):
+        """Registra una ejecución y devuelve su id"""
+        values = self._row_values(algorithm, params, ga_results, duration_seconds, archive_path)
+        placeholders = ', '.join('?' * len(_COLUMNS))
+        with self._lock:
+            cursor = self._connection.execute(
+                f"INSERT INTO runs ({', '.join(_COLUMNS)}) VALUES ({placeholders})", values
+            )
+            self._commit()
+            return cursor.lastrowid
+
+    def record_runs(self, entries):
+        """Registra varias ejecuciones en una transacción.
+
+        Args:
+            entries: Iterable de tuplas (algorithm, params, ga_results, duration_seconds, archive_path).
+        """
+        placeholders = ', '.join('?' * len(_COLUMNS))
+        with self.batch():
+            self._connection.executemany(
+                f"INSERT INTO runs ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                (self._row_values(*entry) for entry in entries)
+            )
+
+    def set_archive_path(self, run_id, archive_path):
+        with self._lock:
+            self._connection.execute('UPDATE runs SET archive_path = ? WHERE id = ?', (archive_path, run_id))
+            self._commit()
+
+    # --- Consultas ---
+    def query_runs(self, function_text=None, function_contains=None, algorithm=None,
+                   order_by='created_at', descending=True, limit=200, **param_filters):
+        """
+        Busca ejecuciones registradas.
+
+        Args:
+            function_text: Texto exacto de la función (usa el índice).
+            function_contains: Subcadena del texto de la función.
+            algorithm: Nombre del algoritmo.
+            order_by: Columna de orden ('created_at', 'best_fitness', ...).
+            **param_filters: Igualdad sobre columnas de parámetros, con los nombres
+                de la UI (interval_a, pop_size, is_minimizing, ...) o de columna.
+
+        Returns:
+            Lista de diccionarios, uno por ejecución.
+
+        Raises:
+            ValueError: Si se pide una columna desconocida.
+        """
+        clauses, values = [], []
+        if function_text is not None:
+            clauses.append('function_text = ?')
+            values.append(function_text)
+        if function_contains:
+            clauses.append('function_text LIKE ?')
+            values.append(f'%{function_contains}%')
+        if algorithm is not None:
+            clauses.append('algorithm = ?')
+            values.append(algorithm)
+        for name, value in param_filters.items():
+            column = _PARAM_COLUMNS.get(name, name)
+            if column not in _COLUMNS:
+                raise ValueError(f"Columna de filtro desconocida: '{name}'")
+            clauses.append(f'{column} = ?')
+            values.append(int(value) if isinstance(value, bool) else value)
+        if order_by not in _ORDERABLE:
+            raise ValueError(f"Columna de orden desconocida: '{order_by}'")
+
+        sql = 'SELECT * FROM runs'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, id DESC"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            values.append(int(limit))
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, values)]
+
+    def get_run(self, run_id):
+        with self._lock:
+            row = self._connection.execute('SELECT * FROM runs WHERE id = ?', (run_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def count(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_run_registry():
+    """Registro compartido del proceso (se crea al primer uso)"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = RunRegistry()
+        return _registry